@@ -0,0 +1,89 @@
+# ==============================================================
+# Benchmark: Gantt mit barh/text vs. gfalgo.gantt
+# ==============================================================
+"""
+Vergleicht die Renderzeit des Gantt-Diagramms.
+
+- alt: ein ``ax.barh`` und ein ``ax.text`` pro Operation (wie gt_koz.py),
+  gemessen auf den ersten OLD_OPS Operationen und hochgerechnet.
+- neu: ``gfalgo.gantt.save_gantt`` auf dem kompletten Plan, als PNG und SVG.
+"""
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gfalgo.gantt import default_job_colors, save_gantt
+from gfalgo.gt_core import GTEngine
+
+# ==============================================================
+# KONFIGURATION
+# ==============================================================
+NUM_JOBS = 10000
+NUM_OPERATIONS = 10
+NUM_MACHINES = 20
+OLD_OPS = 2000        # so viele Operationen werden mit barh/text gezeichnet
+DPI = 150
+SEED = 42
+
+
+def build_schedule(seed):
+    """Plan aus einer Zufallsinstanz (KOZ)."""
+    rng = random.Random(seed)
+    machines = [f"M{str(i).zfill(2)}" for i in range(NUM_MACHINES)]
+    jobs = {
+        j: [(rng.choice(machines), rng.randint(10, 100)) for _ in range(NUM_OPERATIONS)]
+        for j in range(NUM_JOBS)
+    }
+    engine = GTEngine(jobs)
+    engine.run()
+    return engine.records()
+
+
+def render_old(schedule, path):
+    """Variante aus gt_koz.py."""
+    job_colors = default_job_colors(s["job"] for s in schedule)
+    fig, ax = plt.subplots(figsize=(10, 5))
+    for s in schedule:
+        ax.barh(f"Maschine {s['machine']}", s['end'] - s['start'], left=s['start'],
+                color=job_colors[s['job']], edgecolor='black')
+        ax.text(s['start'] + (s['end'] - s['start']) / 2, f"Maschine {s['machine']}",
+                f"Job {s['job']}", va='center', ha='center', color='white', fontsize=9)
+    plt.tight_layout()
+    plt.savefig(path, dpi=DPI)
+    plt.close(fig)
+
+
+def timed(func, *args, **kwargs):
+    t0 = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - t0
+
+
+def main():
+    schedule = build_schedule(SEED)
+    n = len(schedule)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        old = timed(render_old, schedule[:OLD_OPS], tmp / "old.png")
+        new_png = timed(save_gantt, schedule, tmp / "new.png", dpi=DPI)
+        new_svg = timed(save_gantt, schedule, tmp / "new.svg", dpi=DPI)
+        svg_kb = (tmp / "new.svg").stat().st_size / 1024
+
+    print(f"Plan: {n} Operationen auf {NUM_MACHINES} Maschinen")
+    print(f"{'Variante':<26} | {'Zeit (s)':>9}")
+    print("-" * 40)
+    print(f"{'barh/text (' + str(OLD_OPS) + ' Ops)':<26} | {old:9.2f}")
+    print(f"{'barh/text hochgerechnet':<26} | {old * n / OLD_OPS:9.2f}")
+    print(f"{'gantt PNG':<26} | {new_png:9.2f}")
+    print(f"{'gantt SVG':<26} | {new_svg:9.2f}  ({svg_kb:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# ==============================================================
+# Benchmark: Maschinenverfügbarkeit max() vs. MachineState
+# ==============================================================
+"""
+Vergleicht die Kosten der Maschinenverfügbarkeit in Schritt 2 von
+gt_mininv.py auf einer Instanz mit 1.000 Jobs.
+
+Der Plan wird einmal mit dem GT-Kern (KOZ) erzeugt und danach Schritt für
+Schritt nachgespielt. In jedem SAMPLE-ten Schritt wird für alle aktuell
+einplanbaren Operationen die Ready-Time der Maschine abgefragt:
+
+- alt: ``max([o["end"] for o in machines[m]], default=0)``
+- neu: ``MachineState.ready_time(m)``
+
+Die alte Variante wird nur stichprobenartig gemessen, weil sie auf der
+vollen Instanz Stunden bräuchte. Ausgegeben werden die Zeit pro Abfrage
+und der daraus hochgerechnete Aufwand für den kompletten Lauf.
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gfalgo.gt_core import GTEngine
+from gfalgo.machine_state import MachineState
+
+# ==============================================================
+# KONFIGURATION
+# ==============================================================
+NUM_JOBS = 1000
+NUM_OPERATIONS = 10
+NUM_MACHINES = 10
+SAMPLE = 100          # jeder SAMPLE-te Schritt wird gemessen
+SEED = 42
+
+
+def build_instance(seed):
+    """Zufällige Instanz im Format von gt_koz.py (wie randx.py, nur größer)."""
+    rng = random.Random(seed)
+    machines = [f"M{str(i).zfill(2)}" for i in range(NUM_MACHINES)]
+    return {
+        j: [(rng.choice(machines), rng.randint(10, 100)) for _ in range(NUM_OPERATIONS)]
+        for j in range(NUM_JOBS)
+    }
+
+
+def main():
+    jobs = build_instance(SEED)
+    engine = GTEngine(jobs)
+    engine.run()
+
+    old_machines = {m: [] for m in engine.queues}
+    new_machines = MachineState(engine.queues)
+    next_idx = {j: 0 for j in jobs}
+
+    old_time = new_time = 0.0
+    lookups = 0
+    total_lookups = 0
+
+    for step, o in enumerate(engine.order):
+        frontier = [jobs[j][i][0] for j, i in next_idx.items() if i < len(jobs[j])]
+        total_lookups += len(frontier)
+
+        if step % SAMPLE == 0:
+            t0 = time.perf_counter()
+            for m in frontier:
+                max([op["end"] for op in old_machines[m]], default=0)
+            t1 = time.perf_counter()
+            for m in frontier:
+                new_machines.ready_time(m)
+            t2 = time.perf_counter()
+            old_time += t1 - t0
+            new_time += t2 - t1
+            lookups += len(frontier)
+
+        # Operation nachspielen
+        m = engine.machine[o]
+        op = {"end": engine.end[o]}
+        old_machines[m].append(op)
+        new_machines.book(m, op, engine.end[o])
+        next_idx[engine.op_job[o]] += 1
+
+    old_per = old_time / lookups
+    new_per = new_time / lookups
+    print(f"Instanz: {NUM_JOBS} Jobs x {NUM_OPERATIONS} Ops, {NUM_MACHINES} Maschinen")
+    print(f"Gemessene Abfragen:       {lookups}")
+    print(f"Abfragen im ganzen Lauf:  {total_lookups}")
+    print(f"{'Variante':<14} | {'us/Abfrage':>10} | {'Lauf hochgerechnet (s)':>22}")
+    print("-" * 54)
+    print(f"{'max() alt':<14} | {old_per * 1e6:10.3f} | {old_per * total_lookups:22.2f}")
+    print(f"{'MachineState':<14} | {new_per * 1e6:10.3f} | {new_per * total_lookups:22.2f}")
+    print(f"\nSpeedup: {old_per / new_per:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
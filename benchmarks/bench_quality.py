@@ -0,0 +1,126 @@
+# ==============================================================
+# Benchmark: Planqualität auf Standardinstanzen (OR-Library, Taillard)
+# ==============================================================
+"""
+Rechnet Standard-Job-Shop-Instanzen mit dem GT-Kern und vergleicht den
+Makespan mit dem besten bekannten Wert (gfalgo.instances.BEST_KNOWN,
+obere Schranke aus Taillard-Dateien oder ``--bounds``).
+
+Pro Instanz und Regel werden Laufzeit, Makespan und Gap in Prozent
+ausgegeben, am Ende der mittlere Gap pro Regel. So lässt sich prüfen, dass
+Optimierungen am Kern die Lösungsqualität nicht verschlechtern:
+``--csv`` speichert einen Lauf, ``--baseline`` markiert jede Instanz, deren
+Makespan schlechter ist als in der gespeicherten CSV.
+
+Aufruf:
+    python benchmarks/bench_quality.py benchmarks/instances/*.txt --csv quality.csv
+    python benchmarks/bench_quality.py jobshop1.txt tai15_15.txt --rules koz mwkr --baseline quality.csv
+"""
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gfalgo.gt_core import GTEngine
+from gfalgo.instances import load_instances, optimality_gap
+from gfalgo.portfolio import DEFAULT_RULES
+from gfalgo.rules import RULES, get_rule
+
+FIELDS = ["instance", "n_jobs", "n_machines", "rule", "seconds", "makespan", "best", "gap_pct"]
+
+
+def load_bounds(path):
+    """{instanz: bester Makespan} aus einer CSV mit den Spalten name, best."""
+    with open(path, mode="r", newline="") as f:
+        return {r["name"]: int(r["best"]) for r in csv.DictReader(f)}
+
+
+def load_baseline(path):
+    """{(instanz, regel): makespan} aus einer früheren --csv-Datei."""
+    with open(path, mode="r", newline="") as f:
+        return {(r["instance"], r["rule"]): int(r["makespan"]) for r in csv.DictReader(f)}
+
+
+def run_instance(instance, rule_name):
+    """Ein GT-Lauf; Laufzeit ohne das Einlesen der Datei."""
+    jobs = instance["routing"].to_jobs()
+    t0 = time.perf_counter()
+    engine = GTEngine(jobs, get_rule(rule_name))
+    engine.run()
+    seconds = time.perf_counter() - t0
+    makespan = engine.makespan()
+    gap = optimality_gap(makespan, instance["best"])
+    return {
+        "instance": instance["name"],
+        "n_jobs": instance["routing"].n_jobs,
+        "n_machines": instance["routing"].n_machines,
+        "rule": rule_name,
+        "seconds": round(seconds, 4),
+        "makespan": makespan,
+        "best": instance["best"],
+        "gap_pct": None if gap is None else round(gap, 2),
+    }
+
+
+def main(argv=None):
+    rule_choices = sorted(r for r in RULES if r not in ("deviation", "edd", "mst"))  # ohne Vortagsplan/Fälligkeit
+    parser = argparse.ArgumentParser(description="Makespan und Gap auf OR-Library-/Taillard-Instanzen")
+    parser.add_argument("files", nargs="+", help="Instanzdateien")
+    parser.add_argument("--format", choices=["orlib", "taillard"], default=None, help="Standard: automatisch")
+    parser.add_argument("--rules", nargs="+", choices=rule_choices, default=list(DEFAULT_RULES))
+    parser.add_argument("--bounds", help="CSV mit name,best für Instanzen ohne bekannten Wert")
+    parser.add_argument("--csv", help="Ergebnisse als CSV speichern")
+    parser.add_argument("--baseline", help="frühere CSV; schlechtere Makespans werden markiert")
+    args = parser.parse_args(argv)
+
+    bounds = load_bounds(args.bounds) if args.bounds else {}
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+
+    header = (f"{'Instanz':<12} | {'n x m':>7} | {'Regel':<6} | {'Zeit (s)':>8} | "
+              f"{'Makespan':>8} | {'Best':>6} | {'Gap %':>7}")
+    print(header)
+    print("-" * len(header))
+
+    rows, worse = [], 0
+    for path in args.files:
+        for instance in load_instances(path, args.format):
+            if instance["name"] in bounds:
+                instance["best"] = bounds[instance["name"]]
+            for rule_name in args.rules:
+                row = run_instance(instance, rule_name)
+                rows.append(row)
+                size = f"{row['n_jobs']}x{row['n_machines']}"
+                best = "-" if row["best"] is None else row["best"]
+                gap = "-" if row["gap_pct"] is None else f"{row['gap_pct']:.2f}"
+                line = (f"{row['instance']:<12} | {size:>7} | {rule_name:<6} | {row['seconds']:8.4f} | "
+                        f"{row['makespan']:8d} | {best:>6} | {gap:>7}")
+                old = baseline.get((row["instance"], rule_name))
+                if old is not None and row["makespan"] > old:
+                    line += f"  ! vorher {old}"
+                    worse += 1
+                print(line)
+
+    # Mittlerer Gap pro Regel (nur Instanzen mit bekanntem Bestwert)
+    print()
+    for rule_name in args.rules:
+        gaps = [r["gap_pct"] for r in rows if r["rule"] == rule_name and r["gap_pct"] is not None]
+        seconds = sum(r["seconds"] for r in rows if r["rule"] == rule_name)
+        mean = f"{sum(gaps) / len(gaps):.2f} %" if gaps else "-"
+        print(f"{rule_name:<6}: mittlerer Gap {mean} über {len(gaps)} Instanzen, Laufzeit gesamt {seconds:.3f} s")
+
+    if args.csv:
+        with open(args.csv, mode="w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"\nErgebnisse gespeichert als {args.csv}")
+    if worse:
+        print(f"\n{worse} Lauf/Läufe mit schlechterem Makespan als die Basis")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
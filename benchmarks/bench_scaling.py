@@ -0,0 +1,210 @@
+# ==============================================================
+# Benchmark: Skalierung der Planer von 100 bis 1.000.000 Operationen
+# ==============================================================
+"""
+Misst die drei Planer auf synthetischen Instanzen (gfalgo.generator)
+wachsender Größe:
+
+- ``koz``: GT-Kern mit KOZ-Regel wie gt_koz.py (``giffler_thompson``)
+- ``mininv``: DEVIATION-Lauf wie gt_mininv.py, Vortagsplan = KOZ-Plan
+- ``rolling``: eine Schicht aus gt_v2/gt_test_rollierend.py
+  (``run_single_shift``) mit gestörten Dauern, Vortagsplan = erste Schicht
+- ``repair``: die gestörte Schicht per Right Shift (gfalgo.repair) statt
+  GT; Vortagsplan = KOZ-Plan der ersten Schicht (schneller Aufbau)
+
+Jeder Lauf startet in einem eigenen Prozess, damit der Speicher-Peak
+(``ru_maxrss``) nicht von früheren Läufen stammt. Instanz und Vortagsplan
+werden dort erzeugt; die Laufzeit enthält sie nicht, der Peak-RSS schon
+(ganzer Kindprozess). Ausgegeben werden Laufzeit, Ops/s, Peak-RSS und
+Makespan.
+
+Braucht ein Planer auf einer Größe voraussichtlich länger als ``--budget``
+Sekunden (hochgerechnet aus den letzten beiden Größen), werden die
+größeren Instanzen für ihn übersprungen.
+
+Regressionen: ``--csv`` speichert die Ergebnisse, ``--baseline`` vergleicht
+Ops/s mit einer früheren CSV und markiert Läufe, die mehr als
+``--tolerance`` langsamer sind.
+
+Aufruf:
+    python benchmarks/bench_scaling.py --csv scaling.csv
+    python benchmarks/bench_scaling.py --baseline scaling.csv --sizes 100 1000 10000
+"""
+import argparse
+import csv
+import math
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gfalgo.generator import STRUCTURES, generate_routing
+
+# ==============================================================
+# KONFIGURATION
+# ==============================================================
+SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+ALGORITHMS = ("koz", "mininv", "rolling", "repair")
+SIGMA = 0.1   # Störung der Dauern für rolling
+SEED = 42
+
+FIELDS = ["algorithm", "structure", "n_ops", "n_jobs", "seconds", "ops_per_sec", "peak_rss_mib", "makespan"]
+
+
+def _peak_rss_mib():
+    """Höchster Speicherverbrauch dieses Prozesses (Linux: KiB, macOS: Byte)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _koz_plan(routing):
+    from gfalgo.gt_core import giffler_thompson, koz
+
+    jobs = routing.to_jobs()
+    start_times, end_times = giffler_thompson(jobs, rule=koz)
+    return [{"job": job, "op": i + 1, "machine": jobs[job][i][0], "start": s, "end": end_times[(job, i)]}
+            for (job, i), s in start_times.items()]
+
+
+def run_case(algorithm, n_jobs, ops_per_job, machines, structure, skew, seed):
+    """Ein Lauf (im Kindprozess). Gibt eine Ergebniszeile zurück."""
+    from gfalgo.prev_schedule import PreviousSchedule
+
+    routing = generate_routing(n_jobs, ops_per_job, machines, structure=structure, seed=seed, skew=skew)
+
+    if algorithm == "koz":
+        t0 = time.perf_counter()
+        schedule = _koz_plan(routing)
+        seconds = time.perf_counter() - t0
+    elif algorithm == "mininv":
+        from gfalgo.mininv import schedule_deviation
+
+        prev = PreviousSchedule(_koz_plan(routing))
+        t0 = time.perf_counter()
+        schedule = schedule_deviation(routing, prev).records()
+        seconds = time.perf_counter() - t0
+    elif algorithm == "rolling":
+        from gfalgo.rolling import run_single_shift
+        from gfalgo.sampling import DurationSampler
+
+        pts = DurationSampler(SIGMA, seed=seed).sample(routing.pt, 2)
+        prev = PreviousSchedule(run_single_shift(routing, PreviousSchedule(), pts[0]))
+        t0 = time.perf_counter()
+        schedule = run_single_shift(routing, prev, pts[1])
+        seconds = time.perf_counter() - t0
+    else:
+        from gfalgo.repair import RightShiftRepair
+        from gfalgo.sampling import DurationSampler
+
+        pts = DurationSampler(SIGMA, seed=seed).sample(routing.pt, 2)
+        repair = RightShiftRepair(routing, _koz_plan(routing.with_pt(pts[0])), use_op_ids=False)
+        t0 = time.perf_counter()
+        repair.apply(pts[1])
+        schedule = repair.records()
+        seconds = time.perf_counter() - t0
+
+    return {
+        "algorithm": algorithm,
+        "structure": structure,
+        "n_ops": routing.n_ops,
+        "n_jobs": routing.n_jobs,
+        "seconds": round(seconds, 4),
+        "ops_per_sec": round(routing.n_ops / seconds) if seconds > 0 else 0,
+        "peak_rss_mib": round(_peak_rss_mib(), 1),
+        "makespan": max(s["end"] for s in schedule),
+    }
+
+
+def _isolated(*args):
+    """run_case in einem frischen Prozess (spawn), damit ru_maxrss nur diesen Lauf misst."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(run_case, *args).result()
+
+
+def _estimate(history, n_ops):
+    """Hochrechnung der Laufzeit aus den letzten beiden Messungen (Potenzgesetz)."""
+    if not history:
+        return 0.0
+    n1, t1 = history[-1]
+    exponent = 1.0
+    if len(history) > 1:
+        n0, t0 = history[-2]
+        if t0 > 0 and t1 > 0 and n1 > n0:
+            exponent = max(1.0, math.log(t1 / t0) / math.log(n1 / n0))
+    return t1 * (n_ops / n1) ** exponent
+
+
+def load_baseline(path):
+    """{(algorithm, structure, n_ops): ops_per_sec} aus einer früheren --csv-Datei."""
+    with open(path, mode="r", newline="") as f:
+        return {(r["algorithm"], r["structure"], int(r["n_ops"])): float(r["ops_per_sec"])
+                for r in csv.DictReader(f)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Skalierungs-Benchmark für koz, mininv, rolling und repair")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Anzahl Operationen")
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument("--ops-per-job", type=int, default=10)
+    parser.add_argument("--machines", type=int, default=10)
+    parser.add_argument("--structure", choices=STRUCTURES, default="random")
+    parser.add_argument("--skew", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--budget", type=float, default=120.0, help="Sekunden pro Lauf, danach überspringen")
+    parser.add_argument("--csv", help="Ergebnisse als CSV speichern")
+    parser.add_argument("--baseline", help="frühere CSV zum Vergleich der Ops/s")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="erlaubter Rückgang der Ops/s (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+    print(f"Struktur: {args.structure}, {args.ops_per_job} Ops/Job, {args.machines} Maschinen, "
+          f"Skew {args.skew}, Seed {args.seed}")
+    header = f"{'Planer':<8} | {'Ops':>9} | {'Zeit (s)':>9} | {'Ops/s':>9} | {'Peak (MiB)':>10} | {'Makespan':>9}"
+    if baseline:
+        header += f" | {'vs. Basis':>9}"
+    print(header)
+    print("-" * len(header))
+
+    rows, regressions = [], 0
+    for algorithm in args.algorithms:
+        history = []
+        for size in sorted(args.sizes):
+            n_jobs = max(1, size // args.ops_per_job)
+            n_ops = n_jobs * args.ops_per_job
+            estimate = _estimate(history, n_ops)
+            if estimate > args.budget:
+                print(f"{algorithm:<8} | {n_ops:9d} | übersprungen (geschätzt {estimate:.0f} s > Budget)")
+                continue
+
+            row = _isolated(algorithm, n_jobs, args.ops_per_job, args.machines,
+                            args.structure, args.skew, args.seed)
+            history.append((n_ops, row["seconds"]))
+            rows.append(row)
+
+            line = (f"{algorithm:<8} | {n_ops:9d} | {row['seconds']:9.3f} | {row['ops_per_sec']:9d} | "
+                    f"{row['peak_rss_mib']:10.1f} | {row['makespan']:9d}")
+            base = baseline.get((algorithm, args.structure, n_ops))
+            if base:
+                ratio = row["ops_per_sec"] / base
+                flag = " !" if ratio < 1.0 - args.tolerance else ""
+                regressions += bool(flag)
+                line += f" | {ratio:8.2f}x{flag}"
+            print(line)
+
+    if args.csv:
+        with open(args.csv, mode="w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"\nErgebnisse gespeichert als {args.csv}")
+    if regressions:
+        print(f"\n{regressions} Lauf/Läufe langsamer als Basis - {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+# ==============================================================
+# Benchmark: previous_schedule.json vs. ScheduleStore
+# ==============================================================
+"""
+Vergleicht Schreiben, Lesen und Dateigröße eines Plans mit einer Million
+Operationen:
+
+- alt: ``json.dump(schedule, f, indent=4)`` bzw. ``json.load`` (gt_mininv.py)
+- neu: ``ScheduleStore.save`` bzw. ``ScheduleStore.load`` (Memory-Mapping)
+  und der Zugriff auf eine Spalte (Makespan)
+"""
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gfalgo.store import ScheduleColumns, ScheduleStore
+
+# ==============================================================
+# KONFIGURATION
+# ==============================================================
+NUM_OPS = 1_000_000
+NUM_OPERATIONS = 10
+NUM_MACHINES = 20
+SEED = 42
+
+
+def build_schedule(seed):
+    """Synthetischer Plan im Format von previous_schedule.json."""
+    rng = random.Random(seed)
+    machines = [f"M{str(i).zfill(2)}" for i in range(NUM_MACHINES)]
+    schedule = []
+    for k in range(NUM_OPS):
+        start = rng.randint(0, 10 * NUM_OPS)
+        schedule.append({"job": k // NUM_OPERATIONS, "op": k % NUM_OPERATIONS + 1,
+                         "machine": rng.choice(machines), "start": start,
+                         "end": start + rng.randint(10, 100)})
+    return schedule
+
+
+def timed(func, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - t0, result
+
+
+def dir_size(path):
+    return sum(p.stat().st_size for p in Path(path).rglob("*") if p.is_file())
+
+
+def main():
+    schedule = build_schedule(SEED)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        json_file = tmp / "previous_schedule.json"
+
+        def write_json():
+            with open(json_file, "w") as f:
+                json.dump(schedule, f, indent=4)
+
+        def read_json():
+            with open(json_file, "r") as f:
+                return json.load(f)
+
+        json_write, _ = timed(write_json)
+        json_read, _ = timed(read_json)
+        json_mb = json_file.stat().st_size / 2**20
+
+        store = ScheduleStore(tmp / "schedule_store")
+        cols_time, cols = timed(ScheduleColumns.from_records, schedule)
+        store_write, version = timed(store.save, cols)
+        store_read, loaded = timed(store.load, version)
+        makespan_time, _ = timed(lambda: loaded.makespan)
+        store_mb = dir_size(store.root) / 2**20
+
+    print(f"Plan: {NUM_OPS} Operationen")
+    print(f"{'Variante':<28} | {'Zeit (s)':>9} | {'Größe (MiB)':>11}")
+    print("-" * 56)
+    print(f"{'JSON schreiben (indent=4)':<28} | {json_write:9.3f} | {json_mb:11.1f}")
+    print(f"{'JSON lesen':<28} | {json_read:9.3f} |")
+    print(f"{'Dicts -> Spalten':<28} | {cols_time:9.3f} |")
+    print(f"{'Store schreiben':<28} | {store_write:9.3f} | {store_mb:11.1f}")
+    print(f"{'Store lesen (mmap)':<28} | {store_read:9.4f} |")
+    print(f"{'Makespan aus Spalte':<28} | {makespan_time:9.4f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+GFAlgo – Giffler-Thompson-Scheduling mit minimalinvasiver Umplanung.
+"""
+from .batch import schedule_batch
+from .beam import beam_search
+from .branch_bound import branch_and_bound
+from .calendars import MachineCalendar, load_calendars
+from .changelog import RoutingChangeLog
+from .disjunctive import DisjunctiveGraph
+from .generator import generate_routing
+from .gt_core import GTEngine, giffler_thompson, koz
+from .incremental import reschedule_incremental
+from .instances import BEST_KNOWN, load_instances
+from .local_search import improve_schedule
+from .machine_state import MachineState
+from .portfolio import run_portfolio
+from .prev_schedule import PreviousSchedule
+from .profiling import Profiler
+from .repair import RightShiftRepair
+from .routing import Routing, load_routing
+from .rules import RULES, get_rule
+from .sampling import DurationSampler
+from .schedule_state import ScheduleState
+from .stability import calculate_metrics, kendall_tau_distance, start_time_deviation
+from .store import ScheduleStore
+
+__all__ = ["GTEngine", "giffler_thompson", "koz", "MachineState", "PreviousSchedule",
+           "RULES", "get_rule", "run_portfolio", "reschedule_incremental", "RightShiftRepair",
+           "branch_and_bound", "beam_search", "improve_schedule", "DisjunctiveGraph",
+           "schedule_batch", "Profiler", "MachineCalendar", "load_calendars",
+           "Routing", "RoutingChangeLog", "load_routing", "generate_routing",
+           "load_instances", "BEST_KNOWN",
+           "ScheduleState", "ScheduleStore", "DurationSampler",
+           "calculate_metrics", "kendall_tau_distance", "start_time_deviation"]
@@ -0,0 +1,6 @@
+"""``python -m gfalgo`` – siehe gfalgo.cli."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,213 @@
+# ==============================================================
+# Batch: viele Routing-Varianten in einem Prozesspool
+# ==============================================================
+"""
+Planung vieler Routing-Instanzen in einem Aufruf (Szenarien, Varianten von
+randx.py), statt für jede Variante ein Skript neu zu starten.
+
+- CSV-Dateien werden einmal im Hauptprozess gelesen, samt Änderungsprotokoll
+  von randx.py (gfalgo.changelog.load_latest).
+- Maschinennamen werden über alle Instanzen gemeinsam auf dichte Codes
+  abgebildet; die Namensliste geht nur einmal an jeden Worker.
+- Die Arrays aller Instanzen (Job-IDs, Offsets, Operationen, Maschinencodes,
+  Dauern, Fälligkeiten, Freigaben) liegen hintereinander in einem Block
+  ``multiprocessing.shared_memory``. Die Worker lesen sie ohne Kopie, pro
+  Aufgabe wandert nur die Nummer der Instanz über die Prozessgrenze.
+- Regeln, Seeds, Vortagsplan und Maschinenkalender gehen nur einmal an jeden
+  Worker; jede Instanz wird dort mit ``gfalgo.portfolio.run_portfolio``
+  über alle Regeln und Seeds gerechnet.
+
+Die Ergebnisse kommen als Generator in der Reihenfolge zurück, in der die
+Instanzen fertig werden.
+"""
+import os
+import time
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+
+from .changelog import load_latest
+from .portfolio import OBJECTIVES, run_portfolio
+from .routing import Routing
+from .rules import get_rule
+
+__all__ = ["schedule_batch", "pack_routings"]
+
+# Kontext pro Worker-Prozess (wird in _init_worker gesetzt)
+_shm = None
+_arrays = None
+_machines = None
+_options = None
+
+
+def pack_routings(routings):
+    """
+    Legt mehrere Routings mit gemeinsamen Maschinencodes hintereinander ab.
+
+    Args:
+        routings (list): Routing-Objekte.
+
+    Returns:
+        tuple: (arrays, machines) – arrays ist ein dict mit den verketteten
+        Spalten und den Zeigern "jobs_ptr"/"ops_ptr" (Länge n + 1) pro Instanz,
+        machines die gemeinsame, sortierte Namensliste.
+    """
+    # Namen behalten ihren Typ (int-IDs aus gt_v2 neben "M01"), sortiert je Typ
+    names = sorted({m for r in routings for m in r.machines}, key=lambda m: (type(m).__name__, m))
+    index = {m: k for k, m in enumerate(names)}
+    codes, due, has_due, release, has_release, offsets = [], [], [], [], [], []
+    for r in routings:
+        remap = np.array([index[m] for m in r.machines], dtype=np.int32)
+        codes.append(remap[r.machine_codes])
+        has_due.append(r.due_dates is not None)
+        due.append(r.due_dates if r.due_dates is not None else np.zeros(r.n_jobs, dtype=np.int64))
+        has_release.append(r.release_dates is not None)
+        release.append(r.release_dates if r.release_dates is not None else np.zeros(r.n_jobs, dtype=np.int64))
+        offsets.append(r.job_offsets)
+
+    def concat(parts, dtype):
+        return np.concatenate([np.asarray(p, dtype=dtype) for p in parts]) if parts else np.zeros(0, dtype)
+
+    arrays = {
+        "jobs_ptr": np.concatenate([[0], np.cumsum([r.n_jobs for r in routings])]).astype(np.int64),
+        "ops_ptr": np.concatenate([[0], np.cumsum([r.n_ops for r in routings])]).astype(np.int64),
+        "job_ids": concat([r.job_ids for r in routings], np.int64),
+        "job_offsets": concat(offsets, np.int64),
+        "op_ids": concat([r.op_ids for r in routings], np.int64),
+        "machine_codes": concat(codes, np.int32),
+        "pt": concat([r.pt for r in routings], np.int64),
+        "due_dates": concat(due, np.int64),
+        "has_due": np.asarray(has_due, dtype=np.bool_),
+        "release_dates": concat(release, np.int64),
+        "has_release": np.asarray(has_release, dtype=np.bool_),
+    }
+    return arrays, names
+
+
+def _unpack(arrays, machines, i):
+    """Routing der Instanz i als Sicht auf die verketteten Arrays."""
+    j0, j1 = (int(x) for x in arrays["jobs_ptr"][i:i + 2])
+    o0, o1 = (int(x) for x in arrays["ops_ptr"][i:i + 2])
+    return Routing(
+        job_ids=arrays["job_ids"][j0:j1],
+        job_offsets=arrays["job_offsets"][j0 + i:j1 + i + 1],
+        op_ids=arrays["op_ids"][o0:o1],
+        machine_codes=arrays["machine_codes"][o0:o1],
+        pt=arrays["pt"][o0:o1],
+        machines=machines,
+        due_dates=arrays["due_dates"][j0:j1] if arrays["has_due"][i] else None,
+        release_dates=arrays["release_dates"][j0:j1] if arrays["has_release"][i] else None,
+    )
+
+
+def _to_shared(arrays):
+    """Kopiert die Arrays in einen Shared-Memory-Block; Rückgabe (Block, Layout)."""
+    layout, size = {}, 0
+    for name, a in arrays.items():
+        size = -(-size // 8) * 8  # 8-Byte-Ausrichtung
+        layout[name] = (size, a.dtype.str, a.shape)
+        size += a.nbytes
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for name, a in arrays.items():
+        offset, dtype, shape = layout[name]
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)[...] = a
+    return shm, layout
+
+
+def _init_worker(machines, options, shm_name=None, layout=None, arrays=None):
+    """Hängt den Shared-Memory-Block an (bzw. übernimmt arrays ohne Pool)."""
+    global _shm, _arrays, _machines, _options
+    if shm_name is not None:
+        _shm = shared_memory.SharedMemory(name=shm_name)
+        arrays = {name: np.ndarray(shape, dtype=dtype, buffer=_shm.buf, offset=offset)
+                  for name, (offset, dtype, shape) in layout.items()}
+    _arrays = arrays
+    _machines = machines
+    _options = options
+
+
+def _run_instance(i):
+    """Portfolio-Lauf für Instanz i im Worker; Rückgabe (i, Ergebnis)."""
+    t0 = time.perf_counter()
+    routing = _unpack(_arrays, _machines, i)
+    opts = _options
+    best, _ = run_portfolio(routing.to_jobs(), rules=opts["rules"], seeds=opts["seeds"],
+                            objective=opts["objective"], prev_schedule=opts["prev_schedule"],
+                            due_dates=routing.due_date_map(), workers=1, calendars=opts["calendars"],
+                            release_dates=routing.release_date_map())
+    return i, dict(best, n_ops=routing.n_ops, seconds=time.perf_counter() - t0)
+
+
+def schedule_batch(routings, rules=("koz",), seeds=(None,), objective="makespan",
+                   prev_schedule=None, workers=None, calendars=None):
+    """
+    Plant eine Reihe von Routing-Instanzen parallel.
+
+    Args:
+        routings (dict | iterable): {name: Routing oder Pfad zur routing.csv}
+            oder eine Folge davon (Name = Position in der Folge).
+        rules (iterable): Regelnamen aus gfalgo.rules.RULES (Portfolio pro Instanz).
+        seeds (iterable): Tie-Break-Seeds.
+        objective (str): "makespan", "stability" oder "tardiness" (siehe gfalgo.portfolio).
+        prev_schedule (PreviousSchedule | None): Gemeinsamer Vortagsplan für
+            "deviation" und die Stabilitätskennzahlen aller Instanzen.
+        workers (int | None): Anzahl Prozesse; None = os.cpu_count(),
+            1 = ohne Prozesspool im aktuellen Prozess.
+        calendars (dict | None): Gemeinsame Maschinenkalender {maschine:
+            MachineCalendar} aller Instanzen (gfalgo.calendars).
+
+    Returns:
+        generator: Liefert den besten Lauf pro Instanz in der Reihenfolge der
+        Fertigstellung, als dict mit "name", "rule", "seed", "makespan",
+        "time_dev", "seq_dev", "tardiness", "schedule", "n_ops" und "seconds".
+
+    Raises:
+        ValueError: Unbekannte Zielgröße oder Regel (sofort, nicht erst beim Iterieren).
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unbekannte Zielgröße '{objective}', verfügbar: {', '.join(OBJECTIVES)}")
+    for name in rules:
+        get_rule(name)  # unbekannte Regeln vor dem Start melden
+
+    items = list(routings.items()) if isinstance(routings, Mapping) else list(enumerate(routings))
+    names = [name for name, _ in items]
+    loaded = [load_latest(r)[0] if isinstance(r, (str, Path)) else r for _, r in items]
+    arrays, machines = pack_routings(loaded) if loaded else ({}, [])
+    options = {"rules": list(rules), "seeds": list(seeds),
+               "objective": objective, "prev_schedule": prev_schedule, "calendars": calendars}
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(items)))
+    return _stream(names, arrays, machines, options, workers)
+
+
+def _stream(names, arrays, machines, options, workers):
+    """Generator hinter schedule_batch: rechnet die Instanzen und liefert sie fertig aus."""
+    if not names:
+        return
+    if workers == 1:
+        _init_worker(machines, options, arrays=arrays)
+        for i in range(len(names)):
+            _, result = _run_instance(i)
+            yield {"name": names[i], **result}
+        return
+
+    shm, layout = _to_shared(arrays)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(machines, options, shm.name, layout)) as pool:
+            futures = [pool.submit(_run_instance, i) for i in range(len(names))]
+            try:
+                for future in as_completed(futures):
+                    i, result = future.result()
+                    yield {"name": names[i], **result}
+            finally:
+                for future in futures:  # Abbruch durch den Aufrufer: offene Instanzen verwerfen
+                    future.cancel()
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,200 @@
+# ==============================================================
+# Beam Search über die Giffler-Thompson-Konfliktmengen
+# ==============================================================
+"""
+Beam Search als Mittelweg zwischen einem GT-Lauf und Branch-and-Bound.
+
+In jedem GT-Schritt wird jeder Teilplan im Beam um alle Operationen seiner
+Konfliktmenge K erweitert (``GTEngine.copy`` + ``commit``, wie in
+gfalgo.branch_bound). Von allen Kindern bleiben die ``width`` besten.
+Bewertet wird mit einer billigen unteren Schranke, die pro Kind nur
+O(Maschinen + Jobs) kostet:
+
+    max( max_m  ready(m) + Restlast(m),  max_j  Start(j) + Restarbeit(j) )
+
+Die Job-Schranke nimmt als frühesten Start das Maximum aus Job-Ende und
+Bereitzeit der Maschine der nächsten Operation. Gleichstände entscheidet
+der Rang in der Prioritätsregel, dann der bisherige Makespan.
+Doppelte Zustände (gleiche Bereitzeiten) werden nur einmal behalten.
+
+Zeitbudget: Mit ``time_limit`` wird die Suche mit wachsender Breite
+wiederholt (width, 2*width, 4*width, ...), solange Zeit bleibt; der beste
+Plan gewinnt. Läuft die Zeit mitten in einem Lauf ab, wird er mit Breite 1
+und der Prioritätsregel zu Ende geführt. Mehr Budget ergibt also breitere
+Suchen und meist kürzere Makespans.
+
+Parallelisierung wie im Portfolio (gfalgo.portfolio): Jede Kombination aus
+Regel und Tie-Break-Seed ist ein eigener Beam in einem Worker-Prozess; die
+Jobs werden jedem Worker nur einmal übergeben.
+"""
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .gt_core import GTEngine
+from .rules import get_rule
+
+__all__ = ["beam_search"]
+
+# Kontext pro Worker-Prozess (wird in _init_worker gesetzt)
+_jobs = None
+
+
+def _init_worker(jobs):
+    global _jobs
+    _jobs = jobs
+
+
+class _Node:
+    """Teilplan im Beam: Kern plus Restlast pro Maschine und Stand pro Job."""
+
+    __slots__ = ("engine", "load", "job_end", "job_rest", "job_next", "makespan")
+
+    def __init__(self, engine, load, job_end, job_rest, job_next, makespan=0):
+        self.engine = engine
+        self.load = load
+        self.job_end = job_end
+        self.job_rest = job_rest
+        self.job_next = job_next
+        self.makespan = makespan
+
+    def child(self, m, K, o, job_idx, reuse=False):
+        engine = self.engine if reuse else self.engine.copy()
+        engine.commit(m, K, o)
+        load = dict(self.load)
+        load[m] -= engine.pt[o]
+        job_end = list(self.job_end)
+        job_rest = list(self.job_rest)
+        job_next = list(self.job_next)
+        j = job_idx[engine.op_job[o]]
+        job_end[j] = engine.end[o]
+        job_rest[j] -= engine.pt[o]
+        job_next[j] += 1
+        return _Node(engine, load, job_end, job_rest, job_next, max(self.makespan, engine.end[o]))
+
+    def bound(self):
+        """Untere Schranke: Maschinen (ready + Restlast) und Jobs (frühester Start + Restarbeit)."""
+        engine = self.engine
+        queues, machine = engine.queues, engine.machine
+        lb = max(queues[m].ready + work for m, work in self.load.items())
+        for end, rest, nxt in zip(self.job_end, self.job_rest, self.job_next):
+            if rest:
+                lb = max(lb, max(end, queues[machine[nxt]].ready) + rest)
+            else:
+                lb = max(lb, end)
+        return lb
+
+    def state_key(self):
+        """Gleiche Schlüssel = gleicher Zustand: Job-Fortschritt, Freigaben der nächsten Operationen, Maschinen."""
+        t = self.engine.t
+        release = tuple(t[nxt] if nxt < len(t) else None for nxt in self.job_next)
+        return (tuple(self.job_next), release, tuple(self.job_end),
+                tuple(q.ready for q in self.engine.queues.values()))
+
+
+def _beam(jobs, rule, width, seed, deadline):
+    """Ein Beam-Lauf; nach deadline wird mit Breite 1 zu Ende geplant."""
+    root = GTEngine(jobs, get_rule(rule), seed=seed)
+    root.begin()
+    job_idx = {job: k for k, job in enumerate(jobs)}
+    load = {}
+    for m, p in zip(root.machine, root.pt):
+        load[m] = load.get(m, 0) + p
+    job_rest = [sum(p for _, p in ops) for ops in jobs.values()]
+    job_next = [root.job_first[job] for job in jobs]
+    beam = [_Node(root, load, [0] * len(jobs), job_rest, job_next)]
+
+    def priority(engine, o):
+        key = engine.rule(engine, o)
+        return key if engine.tiebreak is None else (key, engine.tiebreak[o])
+
+    while True:
+        greedy = deadline is not None and time.perf_counter() > deadline
+        children = []
+        for node in beam:
+            step = node.engine.next_conflict()
+            if step is None:
+                return min(beam, key=lambda n: n.makespan).engine
+            m, K = step
+            ranked = sorted(K, key=lambda o: priority(node.engine, o))
+            if greedy:
+                ranked = ranked[:1]
+            for i, o in enumerate(ranked):
+                child = node.child(m, K, o, job_idx, reuse=(i == len(ranked) - 1))
+                children.append((child.bound(), i, child.makespan, len(children), child))
+
+        children.sort(key=lambda c: c[:4])
+        beam, seen = [], set()
+        for *_, child in children:
+            key = child.state_key()
+            if key in seen:
+                continue
+            seen.add(key)
+            beam.append(child)
+            if len(beam) >= (1 if greedy else width):
+                break
+
+
+def _run_task(task):
+    """Iterierter Beam für (Regel, Seed) im Worker."""
+    rule, seed, width, time_limit = task
+    t0 = time.perf_counter()
+    deadline = None if time_limit is None else t0 + time_limit
+    # Startwert: ein normaler GT-Lauf mit der Regel, der Beam ist nie schlechter
+    best = GTEngine(_jobs, get_rule(rule), seed=seed)
+    best.run()
+    best_width = 0
+    w = width
+    while True:
+        engine = _beam(_jobs, rule, w, seed, deadline)
+        if engine.makespan() < best.makespan():
+            best, best_width = engine, w
+        if deadline is None or time.perf_counter() > deadline:
+            break
+        w *= 2
+    return {
+        "rule": rule,
+        "seed": seed,
+        "width": best_width,
+        "makespan": best.makespan(),
+        "schedule": best.records(),
+        "seconds": time.perf_counter() - t0,
+    }
+
+
+def beam_search(jobs, width=8, time_limit=None, rules=("mwkr",), seeds=(None,), workers=None):
+    """
+    Beam Search über die GT-Konfliktmengen, optional parallel und mit Zeitbudget.
+
+    Args:
+        jobs (dict): {job_id: [(maschine, pt), ...]} wie in gt_koz.py.
+        width (int): Anzahl der Teilpläne pro Schritt (bzw. Startbreite mit time_limit).
+        time_limit (float | None): Sekunden pro Lauf; None = ein Lauf mit fester Breite.
+        rules (iterable): Regeln aus gfalgo.rules für die Gleichstände; je Regel ein Beam.
+        seeds (iterable): Tie-Break-Seeds; je Seed ein Beam.
+        workers (int | None): Anzahl Prozesse; None = os.cpu_count(),
+            1 = ohne Prozesspool im aktuellen Prozess.
+
+    Returns:
+        tuple: (bester Lauf, alle Läufe nach Makespan sortiert). Ein Lauf ist
+        ein dict {"rule", "seed", "width", "makespan", "schedule", "seconds"};
+        "width" ist die Breite des besten Beams (0 = der einfache GT-Lauf war besser).
+    """
+    for name in rules:
+        get_rule(name)  # unbekannte Regeln vor dem Start melden
+
+    tasks = [(rule, seed, width, time_limit) for rule, seed in itertools.product(rules, seeds)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(tasks)))
+
+    if workers == 1:
+        _init_worker(jobs)
+        results = [_run_task(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(jobs,)) as pool:
+            results = list(pool.map(_run_task, tasks))
+
+    results.sort(key=lambda r: (r["makespan"], r["seconds"]))
+    return results[0], results
@@ -0,0 +1,176 @@
+# ==============================================================
+# Branch-and-Bound über die Giffler-Thompson-Konfliktmengen
+# ==============================================================
+"""
+Exakter bzw. anytime-Modus für kleine Instanzen.
+
+Jeder GT-Lauf wählt in jeder Konfliktmenge K genau eine Operation und
+erzeugt damit einen aktiven Plan. Hier wird über alle Wahlen verzweigt
+(Tiefensuche), womit alle aktiven Pläne erreichbar sind, also auch ein
+optimaler. Der Kern ist derselbe wie in gt_koz.py (``GTEngine``): Jeder
+Knoten ist eine Kopie des Kerns nach ``next_conflict``, jedes Kind ein
+``commit`` mit einer anderen Operation aus K.
+
+Beschneidung:
+
+- **Schranken**: Ein Knoten wird verworfen, wenn seine untere Schranke den
+  besten bisherigen Makespan erreicht. Schranke = Maximum aus
+  Job-Schranke (frühester Start der nächsten Operation + Restarbeit) und
+  Maschinen-Schranke (frühester Kopf + Restlast + kürzester Schwanz).
+- **Dominanz**: Zustände mit denselben eingeplanten Operationen werden
+  über die Bereitzeiten von Maschinen und Jobs verglichen. Ist ein
+  bekannter Zustand überall höchstens so spät, ist der neue dominiert.
+
+Startwert ist der beste Plan der Prioritätsregeln; die Kinder werden in
+der Reihenfolge der Regel ``rule`` besucht. Bei Ablauf von ``time_limit``
+wird der beste bisher gefundene Plan zurückgegeben (``optimal`` = False).
+"""
+import time
+
+from .gt_core import GTEngine
+from .portfolio import DEFAULT_RULES
+from .rules import get_rule
+
+__all__ = ["branch_and_bound", "lower_bound"]
+
+
+def _job_ranges(engine):
+    firsts = sorted(engine.job_first.values()) + [len(engine.pt)]
+    return list(zip(firsts[:-1], firsts[1:]))
+
+
+def lower_bound(engine, ranges=None):
+    """
+    Untere Schranke für den Makespan aller Pläne, die aus dem Zustand
+    von engine entstehen können.
+
+    Args:
+        engine (GTEngine): Laufender Kern (nach ``begin`` oder ``commit``).
+        ranges (list | None): [(erste Op, Ende), ...] pro Job; None = neu berechnen.
+
+    Returns:
+        tuple: (Schranke, Schlüssel, Vektor) – Schlüssel = Anzahl eingeplanter
+        Operationen pro Job, Vektor = Bereitzeiten der Jobs und Maschinen (für
+        die Dominanzprüfung).
+    """
+    if ranges is None:
+        ranges = _job_ranges(engine)
+    start, end, t, pt = engine.start, engine.end, engine.t, engine.pt
+    machine, rest = engine.machine, engine.work_remaining
+    queues = engine.queues
+
+    lb = 0
+    key, job_ready = [], []
+    head_min, tail_min, load = {}, {}, {}
+    for lo, hi in ranges:
+        o = lo
+        while o < hi and start[o] is not None:
+            o += 1
+        key.append(o - lo)
+        ready = end[o - 1] if o > lo else 0
+        job_ready.append(ready)
+        if o == hi:
+            lb = max(lb, ready)
+            continue
+        h = max(t[o], queues[machine[o]].ready)
+        lb = max(lb, h + rest[o])
+        while o < hi:
+            m = machine[o]
+            tail = rest[o] - pt[o]
+            if m in load:
+                head_min[m] = min(head_min[m], h)
+                tail_min[m] = min(tail_min[m], tail)
+                load[m] += pt[o]
+            else:
+                head_min[m], tail_min[m], load[m] = h, tail, pt[o]
+            h += pt[o]
+            o += 1
+    for m, work in load.items():
+        lb = max(lb, max(head_min[m], queues[m].ready) + work + tail_min[m])
+    vector = tuple(job_ready) + tuple(q.ready for q in queues.values())
+    return lb, tuple(key), vector
+
+
+def _dominated(memo, key, vector, limit):
+    """Prüft und merkt sich einen Zustand; True, wenn ein bekannter ihn dominiert."""
+    known = memo.get(key)
+    if known is None:
+        if limit is None or len(memo) < limit:
+            memo[key] = [vector]
+        return False
+    for w in known:
+        if all(a <= b for a, b in zip(w, vector)):
+            return True
+    known[:] = [w for w in known if not all(a <= b for a, b in zip(vector, w))]
+    known.append(vector)
+    return False
+
+
+def branch_and_bound(jobs, time_limit=60.0, rule="mwkr", initial_rules=DEFAULT_RULES, memo_limit=1_000_000):
+    """
+    Sucht den Plan mit minimalem Makespan über alle aktiven Pläne.
+
+    Args:
+        jobs (dict): {job_id: [(maschine, pt), ...]} wie in gt_koz.py.
+        time_limit (float | None): Sekunden; None = bis zum Beweis der Optimalität.
+        rule (str): Regel aus gfalgo.rules für die Besuchsreihenfolge der Kinder.
+        initial_rules (iterable): Regeln für den Startwert (bester GT-Lauf).
+        memo_limit (int | None): Höchstzahl gespeicherter Zustandsschlüssel
+            für die Dominanzprüfung (Speicherbegrenzung).
+
+    Returns:
+        dict: {"makespan", "schedule", "optimal", "lower_bound", "nodes", "seconds"}.
+        "schedule" hat das Format von previous_schedule.json; "lower_bound"
+        ist die Schranke der Wurzel (bzw. der Makespan, wenn optimal).
+    """
+    t0 = time.perf_counter()
+    best = None
+    for name in initial_rules:
+        engine = GTEngine(jobs, get_rule(name))
+        engine.run()
+        if best is None or engine.makespan() < best.makespan():
+            best = engine
+    ub = best.makespan()
+
+    root = GTEngine(jobs, get_rule(rule))
+    root.begin()
+    ranges = _job_ranges(root)
+    root_lb, _, _ = lower_bound(root, ranges)
+
+    memo = {}
+    stack = [root] if root_lb < ub else []
+    nodes = 0
+    timed_out = False
+    while stack:
+        engine = stack.pop()
+        nodes += 1
+        if time_limit is not None and nodes % 256 == 0 and time.perf_counter() - t0 > time_limit:
+            timed_out = True
+            break
+
+        step = engine.next_conflict()
+        if step is None:
+            if engine.makespan() < ub:
+                best, ub = engine, engine.makespan()
+            continue
+
+        # Kinder in umgekehrter Prioritätsreihenfolge auf den Stapel: das beste zuerst besuchen
+        m, K = step
+        choices = sorted(K, key=lambda o: engine.rule(engine, o), reverse=True)
+        for i, o in enumerate(choices):
+            child = engine if i == len(choices) - 1 else engine.copy()
+            child.commit(m, K, o)
+            lb, key, vector = lower_bound(child, ranges)
+            if lb >= ub or _dominated(memo, key, vector, memo_limit):
+                continue
+            stack.append(child)
+
+    optimal = not timed_out
+    return {
+        "makespan": ub,
+        "schedule": best.records(),
+        "optimal": optimal,
+        "lower_bound": ub if optimal else min(root_lb, ub),
+        "nodes": nodes,
+        "seconds": time.perf_counter() - t0,
+    }
@@ -0,0 +1,181 @@
+# ==============================================================
+# Maschinenkalender: Pausen und Wartung als sortierte Intervalle
+# ==============================================================
+"""
+Maschinenkalender für den Giffler-Thompson-Kern.
+
+Ohne Kalender ist jede Maschine ab t = 0 durchgehend verfügbar (wie
+``machines = {m: 0}`` im ursprünglichen gt_koz.py). Ein ``MachineCalendar``
+hält die Zeiten, in denen eine
+Maschine nicht arbeitet (Pausen, Wartung, Schichtende), als sortierte,
+zusammengefasste Intervalle ``[start, ende)``. Alle Abfragen sind
+Binärsuchen, kosten also O(log Anzahl Intervalle) statt eines Durchlaufs
+über den Kalender:
+
+- **unterbrechbar** (``resumable=True``, Standard): Eine Operation ruht
+  während einer Pause und läuft danach weiter. Start = nächster freier
+  Zeitpunkt; Ende über die Präfixsummen der Pausenlängen
+  (verfügbare Zeit bis zum Beginn jeder Pause, ``bisect``).
+- **nicht unterbrechbar** (``resumable=False``): Eine Operation muss
+  vollständig in eine Lücke zwischen zwei Pausen passen. Die erste Lücke
+  mit ausreichender Länge findet eine Sparse Table der Lückenlängen
+  (Maxima über 2^k Lücken) in O(log n).
+
+Kalender als CSV (``load_calendars``): eine Zeile pro Pause mit den Spalten
+``Machine, Start, End``; Maschinen ohne Zeile sind durchgehend verfügbar.
+"""
+import bisect
+import sys
+from pathlib import Path
+
+__all__ = ["MachineCalendar", "load_calendars"]
+
+# Spaltennamen in calendar.csv
+COL_MACHINE = "Machine"
+COL_START = "Start"
+COL_END = "End"
+
+_OPEN = sys.maxsize  # Länge der letzten Lücke (nach der letzten Pause)
+
+
+class MachineCalendar:
+    """
+    Nicht verfügbare Zeiten einer Maschine.
+
+    Args:
+        downtimes (iterable): [(start, ende), ...] als halboffene Intervalle;
+            überlappende und aneinandergrenzende werden zusammengefasst.
+        resumable (bool): True = Operationen werden von Pausen unterbrochen
+            und danach fortgesetzt; False = Operationen müssen in eine Lücke passen.
+
+    Raises:
+        ValueError: Ein Intervall endet vor seinem Start.
+    """
+
+    def __init__(self, downtimes=(), resumable=True):
+        merged = []
+        for s, e in sorted((int(s), int(e)) for s, e in downtimes):
+            if e < s:
+                raise ValueError(f"Pause [{s}, {e}) endet vor ihrem Start")
+            if e == s:
+                continue
+            if merged and s <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], e)
+            else:
+                merged.append([s, e])
+        self.resumable = resumable
+        self.starts = [s for s, _ in merged]
+        self.ends = [e for _, e in merged]
+
+        # Unterbrechbar: Pausenzeit vor Pause k und verfügbare Zeit bis zu ihrem Beginn
+        self._down = [0]
+        for s, e in merged:
+            self._down.append(self._down[-1] + e - s)
+        self._avail = [s - d for s, d in zip(self.starts, self._down)]
+
+        # Nicht unterbrechbar: Lücke k = [ende(k-1), start(k)), Lücke n ist offen
+        n = len(merged)
+        gaps = [0] + [self.starts[k] - self.ends[k - 1] for k in range(1, n)] + [_OPEN]
+        self._table = [gaps]
+        width = 1
+        while 2 * width <= len(gaps):
+            prev = self._table[-1]
+            self._table.append([max(prev[i], prev[i + width]) for i in range(len(prev) - width)])
+            width *= 2
+
+    @classmethod
+    def periodic(cls, downtimes, period, horizon, resumable=True):
+        """
+        Wiederholt ein Pausenmuster, z.B. die Pausen einer Schicht.
+
+        Args:
+            downtimes (iterable): [(start, ende), ...] relativ zum Periodenbeginn.
+            period (int): Länge einer Periode (z.B. 1440 für einen Tag in Minuten).
+            horizon (int): Ende des Planungshorizonts; danach ist die Maschine frei.
+            resumable (bool): Siehe MachineCalendar.
+
+        Returns:
+            MachineCalendar
+        """
+        pattern = list(downtimes)
+        repeated = [(k + s, k + e) for k in range(0, int(horizon), int(period)) for s, e in pattern]
+        return cls(repeated, resumable=resumable)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def downtimes(self):
+        """Zusammengefasste Pausen als [(start, ende), ...]."""
+        return list(zip(self.starts, self.ends))
+
+    # ----------------------------------------------------------
+    # Abfragen (alle O(log n))
+    # ----------------------------------------------------------
+    def next_free(self, t):
+        """Frühester Zeitpunkt >= t, der in keiner Pause liegt."""
+        i = bisect.bisect_right(self.starts, t) - 1
+        if i >= 0 and self.ends[i] > t:
+            return self.ends[i]
+        return t
+
+    def gap_end(self, t):
+        """Beginn der nächsten Pause nach dem freien Zeitpunkt t (ohne weitere Pause: sehr groß)."""
+        i = bisect.bisect_right(self.starts, t)
+        return self.starts[i] if i < len(self.starts) else _OPEN
+
+    def start(self, t, p):
+        """Frühester zulässiger Start >= t einer Operation der Dauer p."""
+        if self.resumable:
+            return self.next_free(t)
+        starts, ends = self.starts, self.ends
+        i = bisect.bisect_right(ends, t)  # Pausen, die bis t vorbei sind
+        if i < len(starts) and starts[i] <= t:
+            t = ends[i]
+            i += 1
+        if i == len(starts) or t + p <= starts[i]:
+            return t
+        return ends[self._first_gap(i + 1, p) - 1]
+
+    def finish(self, s, p):
+        """Ende einer Operation der Dauer p, die zum zulässigen Zeitpunkt s beginnt."""
+        if not self.resumable or p == 0:
+            return s + p
+        # Verfügbare Zeit bis s plus p, dazu alle Pausen, die vorher beginnen
+        target = s - self._down[bisect.bisect_right(self.starts, s)] + p
+        return target + self._down[bisect.bisect_left(self._avail, target)]
+
+    def schedule(self, t, p):
+        """(Start, Ende) einer Operation der Dauer p, die ab t einplanbar ist."""
+        s = self.start(t, p)
+        return s, self.finish(s, p)
+
+    def _first_gap(self, lo, p):
+        """Erste Lücke k >= lo mit Länge >= p (Abstieg über die Sparse Table)."""
+        table = self._table
+        i = lo
+        for level in range(len(table) - 1, -1, -1):
+            row = table[level]
+            if i < len(row) and row[i] < p:
+                i += 1 << level
+        return i
+
+
+def load_calendars(path, resumable=True):
+    """
+    Liest Pausen pro Maschine aus einer CSV mit den Spalten Machine, Start, End.
+
+    Args:
+        path (str | Path): Pfad zur Kalenderdatei.
+        resumable (bool): Siehe MachineCalendar.
+
+    Returns:
+        dict: {maschine: MachineCalendar}; Maschinennamen wie in routing.csv.
+    """
+    import pandas as pd
+
+    df = pd.read_csv(Path(path), skipinitialspace=True)
+    df.columns = [c.strip() for c in df.columns]
+    downtimes = {}
+    for m, s, e in zip(df[COL_MACHINE].tolist(), df[COL_START].tolist(), df[COL_END].tolist()):
+        downtimes.setdefault(m, []).append((s, e))
+    return {m: MachineCalendar(d, resumable=resumable) for m, d in downtimes.items()}
@@ -0,0 +1,289 @@
+# ==============================================================
+# Änderungsprotokoll für routing.csv
+# ==============================================================
+"""
+Änderungen am Routing als Protokoll statt als neu geschriebene Datei.
+
+randx.py hat bisher die komplette routing.csv gelesen und neu geschrieben,
+obwohl sich nur ein Job ändert. Jetzt bleibt routing.csv die Basis
+(Version 0) und jede Änderung wird als Zeile an ein Protokoll angehängt:
+
+    routing_changelog.csv
+        Version, Timestamp, Routing_ID, Operation, Machine, Processing Time
+
+Alle Zeilen eines ``append`` bilden eine neue Version. Version ``v`` ist
+die Basis plus alle Änderungen bis einschließlich ``v``; eine Zeile
+ersetzt Maschine und Dauer einer vorhandenen Operation oder hängt eine
+neue Operation an ihren Job an.
+
+- ``changes(since)`` liefert nur die Deltas, z.B. für gfalgo.incremental.
+- ``materialize(version)`` baut ein Routing erst bei Bedarf; die zuletzt
+  gebaute Version wird behalten und für spätere Versionen nur um die
+  neuen Deltas ergänzt.
+- ``load_latest(path)`` liest die aktuelle Version für Skripte und die
+  Kommandozeile; ohne Protokoll ist das einfach ``load_routing(path)``.
+- ``write_routing`` / ``compact`` schreiben eine Version blockweise
+  (iter_routing_chunks), auch für Dateien, die nicht in den Speicher passen.
+"""
+import csv
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .routing import (COL_DUE, COL_JOB, COL_MACHINE, COL_OP, COL_PT, COL_RELEASE, Routing, iter_routing_chunks,
+                      load_routing)
+
+__all__ = ["RoutingChangeLog", "load_latest"]
+
+COL_VERSION = "Version"
+COL_TIMESTAMP = "Timestamp"
+LOG_COLUMNS = (COL_VERSION, COL_TIMESTAMP, COL_JOB, COL_OP, COL_MACHINE, COL_PT)
+
+
+class RoutingChangeLog:
+    """
+    Änderungsprotokoll zu einer routing.csv (siehe Moduldokumentation).
+
+    Args:
+        routing_path (str | Path): Basisdatei (Version 0).
+        log_path (str | Path | None): Protokolldatei; None = ``<name>_changelog.csv``
+            neben der Basisdatei.
+        chunksize (int): Zeilen pro Block beim Lesen der Basisdatei.
+    """
+
+    def __init__(self, routing_path, log_path=None, chunksize=100_000):
+        self.routing_path = Path(routing_path)
+        if log_path is None:
+            log_path = self.routing_path.with_name(f"{self.routing_path.stem}_changelog.csv")
+        self.log_path = Path(log_path)
+        self.chunksize = chunksize
+        self._rows = None      # {(job, op): [maschine, pt]} der zuletzt gebauten Version
+        self._due = None       # {job: Fälligkeit} oder None
+        self._release = None   # {job: Freigabezeitpunkt} oder None
+        self._version = None   # Version von _rows
+
+    # ----------------------------------------------------------
+    # Protokoll
+    # ----------------------------------------------------------
+    def iter_changes(self, since=0, until=None):
+        """
+        Liest die Änderungen zeilenweise.
+
+        Args:
+            since (int): Nur Änderungen mit Version > since.
+            until (int | None): Nur Änderungen mit Version <= until.
+
+        Yields:
+            dict: {"version", "timestamp", "job", "op", "machine", "pt"}
+        """
+        if not self.log_path.is_file():
+            return
+        with open(self.log_path, mode="r", newline="") as f:
+            for row in csv.DictReader(f, skipinitialspace=True):
+                version = int(row[COL_VERSION])
+                if version <= since or (until is not None and version > until):
+                    continue
+                yield {
+                    "version": version,
+                    "timestamp": row[COL_TIMESTAMP],
+                    "job": int(row[COL_JOB]),
+                    "op": int(row[COL_OP]),
+                    "machine": row[COL_MACHINE],
+                    "pt": int(row[COL_PT]),
+                }
+
+    def changes(self, since=0, until=None):
+        """Änderungen als Liste (siehe iter_changes)."""
+        return list(self.iter_changes(since, until))
+
+    def latest(self):
+        """Aktuelle Version (0 = nur die Basisdatei)."""
+        return max((c["version"] for c in self.iter_changes()), default=0)
+
+    def append(self, changes, timestamp=None):
+        """
+        Hängt Änderungen als neue Version an.
+
+        Args:
+            changes (iterable): [(job_id, op_id, maschine, pt), ...].
+            timestamp (str | None): Zeitstempel; None = jetzt.
+
+        Returns:
+            int: Die neue Versionsnummer (unverändert, wenn changes leer ist).
+        """
+        changes = list(changes)
+        version = self.latest()
+        if not changes:
+            return version
+        version += 1
+        if timestamp is None:
+            timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+        new_file = not self.log_path.is_file()
+        with open(self.log_path, mode="a", newline="") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(LOG_COLUMNS)
+            for job_id, op_id, machine, pt in changes:
+                writer.writerow([version, timestamp, job_id, op_id, machine, pt])
+        return version
+
+    # ----------------------------------------------------------
+    # Versionen bauen
+    # ----------------------------------------------------------
+    def _read_base(self):
+        rows, due, release = {}, None, None
+        for chunk in iter_routing_chunks(self.routing_path, self.chunksize):
+            if COL_DUE in chunk.columns:
+                due = {} if due is None else due
+                due.update(zip(chunk[COL_JOB].tolist(), chunk[COL_DUE].tolist()))
+            if COL_RELEASE in chunk.columns:
+                release = {} if release is None else release
+                release.update(zip(chunk[COL_JOB].tolist(), chunk[COL_RELEASE].tolist()))
+            for key, m, p in zip(zip(chunk[COL_JOB].tolist(), chunk[COL_OP].tolist()),
+                                 chunk[COL_MACHINE].tolist(), chunk[COL_PT].tolist()):
+                rows[key] = [m, p]
+        return rows, due, release
+
+    @staticmethod
+    def _apply(rows, changes):
+        """Wendet Änderungen auf {(job, op): [maschine, pt]} an."""
+        # Maschinen im Protokoll sind Text; ganzzahlige IDs wie in gt_v2/routing.csv zurückwandeln
+        numeric = bool(rows) and isinstance(next(iter(rows.values()))[0], int)
+        for c in changes:
+            machine = int(c["machine"]) if numeric else c["machine"]
+            rows[(c["job"], c["op"])] = [machine, c["pt"]]
+
+    def materialize(self, version=None):
+        """
+        Baut das Routing einer Version.
+
+        Args:
+            version (int | None): Versionsnummer; None = aktuelle Version.
+
+        Returns:
+            Routing
+
+        Raises:
+            ValueError: Ein neuer Job hat keine Fälligkeit, obwohl die Basis
+                eine "Due Date"-Spalte hat.
+        """
+        if version is None:
+            version = self.latest()
+        if self._rows is None or version < self._version:
+            self._rows, self._due, self._release = self._read_base()
+            self._version = 0
+        self._apply(self._rows, self.iter_changes(since=self._version, until=version))
+        self._version = version
+
+        keys = list(self._rows)
+        job = np.fromiter((k[0] for k in keys), dtype=np.int64, count=len(keys))
+        op = np.fromiter((k[1] for k in keys), dtype=np.int64, count=len(keys))
+        values = list(self._rows.values())
+        machine = [v[0] for v in values]
+        pt = np.fromiter((v[1] for v in values), dtype=np.int64, count=len(values))
+        due = None
+        if self._due is not None:
+            missing = set(job.tolist()) - self._due.keys()
+            if missing:
+                raise ValueError(f"Keine Fälligkeit für neue Jobs {sorted(missing)}")
+            due = np.fromiter((self._due[j] for j in job.tolist()), dtype=np.int64, count=len(job))
+        release = None
+        if self._release is not None:  # neue Jobs ohne Freigabezeitpunkt sind sofort frei
+            release = np.fromiter((self._release.get(j, 0) for j in job.tolist()), dtype=np.int64, count=len(job))
+        return Routing.from_columns(job, op, machine, pt, due, release=release)
+
+    def write_routing(self, path, version=None):
+        """
+        Schreibt eine Version als routing.csv, blockweise aus der Basisdatei.
+
+        Im Speicher liegen nur die Änderungen, nicht die ganze Datei.
+
+        Args:
+            path (str | Path): Zieldatei (nicht die Basisdatei selbst).
+            version (int | None): Versionsnummer; None = aktuelle Version.
+
+        Returns:
+            Path: Der Pfad der geschriebenen Datei.
+        """
+        from pandas.api.types import is_integer_dtype
+
+        path = Path(path)
+        latest = {}
+        for c in self.iter_changes(until=version):
+            latest[(c["job"], c["op"])] = c
+
+        header = True
+        columns, due_of, release_of = None, {}, {}
+        jobs = {k[0] for k in latest}
+        for chunk in iter_routing_chunks(self.routing_path, self.chunksize):
+            columns = list(chunk.columns)
+            if COL_DUE in chunk.columns:
+                for j, d in zip(chunk[COL_JOB].tolist(), chunk[COL_DUE].tolist()):
+                    if j in jobs:
+                        due_of[j] = d
+            if COL_RELEASE in chunk.columns:
+                for j, r in zip(chunk[COL_JOB].tolist(), chunk[COL_RELEASE].tolist()):
+                    if j in jobs:
+                        release_of[j] = r
+            keys = list(zip(chunk[COL_JOB].tolist(), chunk[COL_OP].tolist()))
+            hit = [i for i, key in enumerate(keys) if key in latest]
+            if hit:
+                numeric = is_integer_dtype(chunk[COL_MACHINE].dtype)
+                rows = chunk.index[hit]
+                chunk.loc[rows, COL_MACHINE] = [
+                    int(latest[keys[i]]["machine"]) if numeric else latest[keys[i]]["machine"] for i in hit]
+                chunk.loc[rows, COL_PT] = [latest[keys[i]]["pt"] for i in hit]
+                for i in hit:
+                    del latest[keys[i]]
+            chunk.to_csv(path, mode="w" if header else "a", header=header, index=False)
+            header = False
+
+        # Operationen, die es in der Basis noch nicht gab, hinten anhängen
+        if latest:
+            if columns is None:
+                columns = [COL_JOB, COL_OP, COL_MACHINE, COL_PT]
+            with open(path, mode="a", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+                if header:
+                    writer.writeheader()
+                for (job_id, op_id), c in latest.items():
+                    if COL_DUE in columns and job_id not in due_of:
+                        raise ValueError(f"Keine Fälligkeit für neuen Job {job_id}")
+                    writer.writerow({COL_JOB: job_id, COL_OP: op_id, COL_MACHINE: c["machine"],
+                                     COL_PT: c["pt"], COL_DUE: due_of.get(job_id),
+                                     COL_RELEASE: release_of.get(job_id, 0)})
+        return path
+
+    def compact(self):
+        """
+        Schreibt die aktuelle Version in die Basisdatei und leert das Protokoll.
+
+        Returns:
+            Path: Die Basisdatei.
+        """
+        tmp = self.routing_path.with_name(f".{self.routing_path.name}.tmp")
+        self.write_routing(tmp)
+        tmp.replace(self.routing_path)
+        if self.log_path.is_file():
+            self.log_path.unlink()
+        self._rows = self._due = self._release = self._version = None
+        return self.routing_path
+
+
+def load_latest(routing_path):
+    """
+    Aktuelle Version einer routing.csv: Basisdatei plus angehängte Änderungen.
+
+    Args:
+        routing_path (str | Path): Basisdatei; das Protokoll liegt daneben
+            (siehe RoutingChangeLog).
+
+    Returns:
+        tuple: (Routing, Version); Version 0 = Basisdatei ohne Änderungen.
+    """
+    changelog = RoutingChangeLog(routing_path)
+    version = changelog.latest()
+    if version == 0:
+        return load_routing(routing_path), 0
+    return changelog.materialize(version), version
@@ -0,0 +1,530 @@
+# ==============================================================
+# Kommandozeile für den Batch-Betrieb
+# ==============================================================
+"""
+Kommandozeile ``gfalgo`` für den Einsatz ohne Bildschirm (z.B. per Cron).
+
+- Alle Parameter kommen als Argumente, es gibt keine ``input()``-Abfrage.
+- Es öffnet sich nie ein Fenster; Grafiken werden nur auf Wunsch
+  (``--gantt`` / ``--plot``) als Datei geschrieben.
+- matplotlib wird erst importiert, wenn eine Grafik angefordert ist.
+- routing.csv wird wie in gt_koz.py/gt_mininv.py zusammen mit den von
+  randx.py angehängten Änderungen gelesen (gfalgo.changelog).
+
+Aufruf:
+    gfalgo schedule routing.csv --rule koz --out previous_schedule.json --gantt gantt.png
+    gfalgo schedule routing.csv --rule deviation --prev schedule_store --store schedule_store --sigma 0.2
+    gfalgo schedule routing.csv --rule mwkr --improve tabu --improve-time 10 --out previous_schedule.json
+    gfalgo schedule routing.csv --rule koz --prev schedule_store --profile profile.json
+    gfalgo schedule routing.csv --rule mst --calendar calendar.csv --objective tardiness
+    gfalgo reschedule routing.csv --prev schedule_store --changes routing_changes.csv --store schedule_store
+    gfalgo rolling gt_v2/routing.csv --sigma 0.1 --shifts 22 --seed 1 --plot verlauf.png
+    gfalgo rolling gt_v2/routing.csv --sigma 0.1 --shifts 22 --repair-threshold 30
+    gfalgo montecarlo gt_v2/routing.csv --sigmas 0.05 0.1 --seeds 20
+    gfalgo optimize routing.csv --method bnb --time-limit 60 --out previous_schedule.json
+    gfalgo optimize routing.csv --method beam --time-limit 30 --rule mwkr --rule fifo --seeds 1 2 3
+    gfalgo generate routing_big.csv --jobs 10000 --machines 20 --structure taillard --seed 1
+    gfalgo analyze routing.csv --schedule previous_schedule.json --csv slack.csv
+    gfalgo batch szenarien/*.csv --rule koz --rule mwkr --prev schedule_store --out-dir plaene --csv batch.csv
+
+``--rule deviation`` ist eine GT-Variante mit Abweichungsschlüssel und
+liefert nicht den Plan von gt_mininv.py; dessen Schleife rechnet
+``gfalgo reschedule``.
+
+Ohne Installation: ``python -m gfalgo ...``.
+"""
+import argparse
+import json
+import sys
+
+__all__ = ["main", "build_parser"]
+
+
+def _use_headless_backend():
+    """Agg-Backend, damit auch ohne Display nie ein Fenster geöffnet wird."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _cmd_schedule(args):
+    from .portfolio import run_portfolio
+    from .prev_schedule import PreviousSchedule
+    from .profiling import Profiler
+    from .sampling import DurationSampler
+
+    if args.calendar and args.improve:
+        raise ValueError("--improve berücksichtigt keine Maschinenkalender (--calendar)")
+    profiler = Profiler(enabled=bool(args.profile))
+    routing, routing_version = _load_routing(args.routing)
+    if args.sigma > 0:
+        sampler = DurationSampler(args.sigma, seed=args.sampling_seed, dist=args.dist)
+        routing = routing.with_pt(sampler.sample(routing.pt))
+
+    prev_schedule = PreviousSchedule.load(args.prev) if args.prev else None
+    calendars = _load_calendars(args)
+    profiler.lap("load")
+    best, results = run_portfolio(
+        routing.to_jobs(),
+        rules=args.rule or ["koz"],
+        seeds=args.seeds or [None],
+        objective=args.objective,
+        prev_schedule=prev_schedule,
+        due_dates=routing.due_date_map(),
+        workers=args.workers,
+        profiler=profiler,
+        calendars=calendars,
+        release_dates=routing.release_date_map(),
+    )
+    profiler.lap("portfolio")
+
+    improved = None
+    if args.improve:
+        from .local_search import improve_schedule
+        from .stability import calculate_metrics
+
+        improved = improve_schedule(routing.to_jobs(), best["schedule"], method=args.improve,
+                                    neighborhood=args.neighborhood, iterations=args.improve_iterations,
+                                    time_limit=args.improve_time, prev_schedule=prev_schedule,
+                                    stability_weight=args.stability_weight)
+        time_dev, seq_dev = calculate_metrics(improved["schedule"], prev_schedule or [])
+        best = dict(best, schedule=improved["schedule"], makespan=improved["makespan"],
+                    time_dev=time_dev, seq_dev=seq_dev, tardiness=None)
+        profiler.lap("improve")
+
+    if not args.quiet:
+        if len(results) > 1:
+            due = routing.due_dates is not None  # mit Fälligkeiten zusätzlich die Verspätung
+            print(f"{'Regel':<10} | {'Seed':>6} | {'Makespan':>8} | {'Zeit-Abw.':>10} | {'Seq-Abw.':>8}"
+                  + (f" | {'Verspätung':>10}" if due else ""))
+            print("-" * (67 if due else 54))
+            for r in results:
+                seed = "-" if r["seed"] is None else r["seed"]
+                print(f"{r['rule']:<10} | {seed:>6} | {r['makespan']:8d} | "
+                      f"{r['time_dev']:10d} | {r['seq_dev']:8d}" + (f" | {r['tardiness']:10d}" if due else ""))
+            print()
+        if improved is not None:
+            print(f"Lokale Suche ({args.improve}, {args.neighborhood}): Makespan {improved['initial_makespan']} "
+                  f"-> {improved['makespan']} in {improved['iterations']} Zügen, {improved['seconds']:.2f} s")
+        print(f"Regel: {best['rule']}  Makespan: {best['makespan']}  "
+              f"Startzeitabweichung: {best['time_dev']}  Sequenzabweichung: {best['seq_dev']}")
+        if routing.due_dates is not None and best["tardiness"] is not None:
+            print(f"Summe der Verspätungen: {best['tardiness']}")
+
+    schedule = sorted(best["schedule"], key=lambda s: (s["machine"], s["start"]))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(schedule, f, indent=4)
+        if not args.quiet:
+            print(f"Plan gespeichert als {args.out}")
+
+    if args.store:
+        from .store import ScheduleStore
+
+        version = ScheduleStore(args.store).save(schedule, note=f"gfalgo schedule ({best['rule']})",
+                                                 meta={"routing_version": routing_version})
+        if not args.quiet:
+            print(f"Plan gespeichert in {args.store} (Version {version})")
+    profiler.lap("write")
+
+    if args.gantt:
+        _use_headless_backend()
+        from .gantt import save_gantt
+
+        title = f"Giffler-Thompson ({best['rule'].upper()}) – Makespan {best['makespan']}"
+        save_gantt(schedule, args.gantt, dpi=args.dpi, title=title)
+        if not args.quiet:
+            print(f"Gantt-Diagramm gespeichert als {args.gantt}")
+        profiler.lap("gantt")
+
+    _save_profile(profiler, args)
+    return 0
+
+
+def _load_calendars(args):
+    """Maschinenkalender aus --calendar oder None."""
+    if not args.calendar:
+        return None
+    from .calendars import load_calendars
+
+    return load_calendars(args.calendar, resumable=not args.no_split)
+
+
+def _load_routing(path):
+    """routing.csv plus angehängte Änderungen von randx.py (gfalgo.changelog); Rückgabe (Routing, Version)."""
+    from .changelog import load_latest
+
+    return load_latest(path)
+
+
+def _save_profile(profiler, args):
+    """Schreibt das Profil nach --profile (JSON oder CSV), falls angefordert."""
+    if not args.profile:
+        return
+    profiler.save(args.profile)
+    if not args.quiet:
+        print(f"Profil gespeichert als {args.profile}")
+
+
+def _cmd_reschedule(args):
+    from .changelog import RoutingChangeLog
+    from .incremental import load_changes, reschedule_incremental
+    from .prev_schedule import PreviousSchedule
+    from .profiling import Profiler
+    from .store import ScheduleStore
+
+    profiler = Profiler(enabled=bool(args.profile))
+    routing, routing_version = _load_routing(args.routing)
+    prev_schedule = PreviousSchedule.load(args.prev)
+    if args.changes:
+        changes = load_changes(args.changes)
+    else:
+        # Deltas seit der Routing-Version des alten Plans (wie gt_mininv.py)
+        prev_version = None
+        if ScheduleStore.is_store(args.prev):
+            prev_version = ScheduleStore(args.prev).load().meta.get("routing_version")
+        changes = []
+        if prev_version is not None:
+            changelog = RoutingChangeLog(args.routing)
+            changes = [(c["job"], c["op"]) for c in changelog.iter_changes(since=prev_version)]
+    profiler.lap("load")
+    state, affected, cut_time = reschedule_incremental(routing, prev_schedule, changes, profiler=profiler)
+    profiler.lap("reschedule")
+
+    schedule = sorted(state.records(), key=lambda s: (s["machine"], s["start"]))
+    if not args.quiet:
+        if cut_time is None:
+            print("Keine Änderung gegenüber dem alten Plan")
+        else:
+            print(f"{int(affected.sum())} von {routing.n_ops} Operationen ab t={cut_time} neu geplant")
+        print(f"Makespan: {max((s['end'] for s in schedule), default=0)}")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(schedule, f, indent=4)
+        if not args.quiet:
+            print(f"Plan gespeichert als {args.out}")
+
+    if args.store:
+        version = ScheduleStore(args.store).save(schedule, note="gfalgo reschedule (deviation, inkrementell)",
+                                                 meta={"routing_version": routing_version})
+        if not args.quiet:
+            print(f"Plan gespeichert in {args.store} (Version {version})")
+    profiler.lap("write")
+
+    _save_profile(profiler, args)
+    return 0
+
+
+def _cmd_rolling(args):
+    from .montecarlo import write_csv
+    from .rolling import run_simulation
+
+    routing, _ = _load_routing(args.routing)
+    rows = run_simulation(routing, args.shifts, args.sigma, seed=args.seed, dist=args.dist,
+                          repair_threshold=args.repair_threshold)
+
+    if not args.quiet:
+        print(f"{'Schicht':<8} | {'Zeit-Abw.':<12} | {'Seq-Abw.':<10} | {'Makespan':<8}")
+        print("-" * 45)
+        for r in rows:
+            mode = f" | {r['mode']}" if "mode" in r else ""
+            print(f"{r['shift']:02d}       | {r['time_dev']:12d} | {r['seq_dev']:10d} | {r['makespan']:8d}{mode}")
+
+    if args.csv:
+        write_csv(rows, args.csv)
+    if args.plot:
+        _use_headless_backend()
+        from .rolling import plot_history
+
+        plot_history(rows, args.sigma, args.plot, dpi=args.dpi)
+        if not args.quiet:
+            print(f"\nGrafik gespeichert als '{args.plot}'.")
+    return 0
+
+
+def _load_jobs(args):
+    """Routing aus routing.csv (mit Änderungsprotokoll) oder (mit --format) aus einer Benchmark-Datei."""
+    if args.format:
+        from .instances import load_instances
+
+        return load_instances(args.routing, args.format)[0]["routing"]
+    return _load_routing(args.routing)[0]
+
+
+def _cmd_optimize(args):
+    routing = _load_jobs(args)
+    jobs = routing.to_jobs()
+    if args.method == "bnb":
+        from .branch_bound import branch_and_bound
+
+        result = branch_and_bound(jobs, time_limit=args.time_limit)
+        status = "optimal" if result["optimal"] else f"Zeitlimit, untere Schranke {result['lower_bound']}"
+        summary = f"Makespan: {result['makespan']} ({status}, {result['nodes']} Knoten, {result['seconds']:.2f} s)"
+    else:
+        from .beam import beam_search
+
+        result, _ = beam_search(jobs, width=args.width, time_limit=args.time_limit, rules=args.rule or ["mwkr"],
+                                seeds=args.seeds or [None], workers=args.workers)
+        seed = "-" if result["seed"] is None else result["seed"]
+        summary = (f"Makespan: {result['makespan']} (Regel {result['rule']}, Seed {seed}, "
+                   f"Breite {result['width']}, {result['seconds']:.2f} s)")
+
+    schedule = sorted(result["schedule"], key=lambda s: (s["machine"], s["start"]))
+    if not args.quiet:
+        print(summary)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(schedule, f, indent=4)
+        if not args.quiet:
+            print(f"Plan gespeichert als {args.out}")
+    if args.store:
+        from .store import ScheduleStore
+
+        version = ScheduleStore(args.store).save(schedule, note=f"gfalgo optimize ({args.method})")
+        if not args.quiet:
+            print(f"Plan gespeichert in {args.store} (Version {version})")
+    if args.gantt:
+        _use_headless_backend()
+        from .gantt import save_gantt
+
+        save_gantt(schedule, args.gantt, dpi=args.dpi, title=f"{args.method} – Makespan {result['makespan']}")
+        if not args.quiet:
+            print(f"Gantt-Diagramm gespeichert als {args.gantt}")
+    return 0
+
+
+def _cmd_generate(args):
+    from .generator import generate_routing
+    from .routing import save_routing
+
+    routing = generate_routing(args.jobs, args.ops, args.machines, structure=args.structure, seed=args.seed,
+                               pt_low=args.pt[0], pt_high=args.pt[1], skew=args.skew,
+                               due_factor=args.due_factor)
+    save_routing(routing, args.out)
+    if not args.quiet:
+        print(f"{routing.n_jobs} Jobs, {routing.n_ops} Operationen, {routing.n_machines} Maschinen "
+              f"gespeichert als {args.out}")
+    return 0
+
+
+def _cmd_batch(args):
+    from pathlib import Path
+
+    from .batch import schedule_batch
+    from .montecarlo import write_csv
+    from .prev_schedule import PreviousSchedule
+
+    prev_schedule = PreviousSchedule.load(args.prev) if args.prev else None
+    out_dir = Path(args.out_dir) if args.out_dir else None
+    if out_dir is not None:
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+    results = schedule_batch({path: path for path in args.routings}, rules=args.rule or ["koz"],
+                             seeds=args.seeds or [None], objective=args.objective,
+                             prev_schedule=prev_schedule, workers=args.workers,
+                             calendars=_load_calendars(args))
+    rows = []
+    if not args.quiet:
+        print(f"{'Routing':<30} | {'Regel':<8} | {'Makespan':>8} | {'Zeit-Abw.':>10} | {'Seq-Abw.':>8} | {'Sek.':>6}")
+        print("-" * 86)
+    for r in results:  # in der Reihenfolge der Fertigstellung
+        rows.append({k: r[k] for k in ("name", "rule", "seed", "n_ops", "makespan", "time_dev", "seq_dev",
+                                       "tardiness", "seconds")})
+        if out_dir is not None:
+            schedule = sorted(r["schedule"], key=lambda s: (s["machine"], s["start"]))
+            with open(out_dir / (Path(r["name"]).stem + ".json"), "w") as f:
+                json.dump(schedule, f, indent=4)
+        if not args.quiet:
+            print(f"{r['name']:<30} | {r['rule']:<8} | {r['makespan']:8d} | {r['time_dev']:10d} | "
+                  f"{r['seq_dev']:8d} | {r['seconds']:6.2f}", flush=True)
+
+    if args.csv:
+        write_csv(rows, args.csv)
+        if not args.quiet:
+            print(f"Kennzahlen gespeichert als {args.csv}")
+    return 0
+
+
+def _cmd_analyze(args):
+    import csv
+
+    from .disjunctive import DisjunctiveGraph
+
+    graph = DisjunctiveGraph.load(args.routing, args.schedule, use_op_ids=args.op_ids)
+    slack = graph.slack
+    if not args.quiet:
+        print(f"Makespan: {graph.makespan}  kritische Operationen: {int((slack == 0).sum())} von {graph.n}")
+        print("Kritischer Pfad (Blöcke):")
+        for m, block in graph.critical_blocks():
+            print(f"  {m}: {len(block)} Op, {int(graph.head[block[0]])} - "
+                  f"{int(graph.head[block[-1]] + graph.pt[block[-1]])}")
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["job", "op", "machine", "start", "end", "tail", "slack"])
+            for e, tail, sl in zip(graph.records(), graph.tail[:-1].tolist(), slack.tolist()):
+                writer.writerow([e["job"], e["op"], e["machine"], e["start"], e["end"], tail, sl])
+        if not args.quiet:
+            print(f"Köpfe, Schwänze und Schlupf gespeichert als {args.csv}")
+    return 0
+
+
+def _cmd_montecarlo(args):
+    from . import montecarlo
+
+    montecarlo.main(args.args, prog="gfalgo montecarlo")
+    return 0
+
+
+def build_parser():
+    """
+    Argumentparser mit den Unterbefehlen schedule, reschedule, rolling, optimize,
+    generate, batch, analyze und montecarlo.
+    """
+    from .generator import STRUCTURES
+    from .local_search import METHODS, NEIGHBORHOODS
+    from .rules import RULES
+    from .sampling import DISTRIBUTIONS
+
+    parser = argparse.ArgumentParser(prog="gfalgo", description="Giffler-Thompson-Scheduling im Batch-Betrieb")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("schedule", help="einen Plan erzeugen")
+    p.add_argument("routing", help="Pfad zur routing.csv")
+    p.add_argument("--rule", action="append", choices=sorted(RULES),
+                   help="Prioritätsregel (mehrfach angeben = Portfolio), Standard koz; deviation ist "
+                        "eine GT-Variante, nicht die Schleife von gt_mininv.py (dafür: reschedule)")
+    p.add_argument("--seeds", type=int, nargs="+", help="Tie-Break-Seeds für das Portfolio")
+    p.add_argument("--objective", choices=["makespan", "stability", "tardiness"], default="makespan")
+    p.add_argument("--prev", help="Vortagsplan (previous_schedule.json oder Planspeicher) "
+                                  "für deviation und Kennzahlen")
+    p.add_argument("--sigma", type=float, default=0.0, help="Störung der Bearbeitungszeiten (0 = keine)")
+    p.add_argument("--sampling-seed", type=int, default=None, help="Seed der Störungen")
+    p.add_argument("--dist", choices=[d for d in DISTRIBUTIONS if d != "empirical"], default="lognormal")
+    p.add_argument("--workers", type=int, default=None)
+    p.add_argument("--calendar", help="Pausen/Wartung pro Maschine als CSV (Machine, Start, End)")
+    p.add_argument("--no-split", action="store_true",
+                   help="Operationen nicht durch Pausen unterbrechen, sondern in eine freie Lücke legen")
+    p.add_argument("--improve", choices=METHODS, help="besten Plan per lokaler Suche verbessern (tabu, sa)")
+    p.add_argument("--neighborhood", choices=NEIGHBORHOODS, default="n7", help="Nachbarschaft der lokalen Suche")
+    p.add_argument("--improve-iterations", type=int, default=1000)
+    p.add_argument("--improve-time", type=float, default=None, help="Sekunden für die lokale Suche")
+    p.add_argument("--stability-weight", type=float, default=0.0,
+                   help="Strafe pro Zeiteinheit Startzeitabweichung zu --prev in der lokalen Suche")
+    p.add_argument("--out", help="Plan als JSON speichern")
+    p.add_argument("--store", help="Plan als neue Version im Planspeicher (gfalgo.store) ablegen")
+    p.add_argument("--gantt", help="Gantt-Diagramm speichern (PNG/SVG/PDF)")
+    p.add_argument("--dpi", type=int, default=150)
+    p.add_argument("--profile", help="Laufzeiten pro Phase und Zähler speichern (.json oder .csv)")
+    p.add_argument("-q", "--quiet", action="store_true")
+    p.set_defaults(func=_cmd_schedule)
+
+    p = sub.add_parser("reschedule", help="alten Plan nach Routing-Änderungen inkrementell nachführen")
+    p.add_argument("routing", help="Pfad zur geänderten routing.csv")
+    p.add_argument("--prev", required=True, help="alter Plan (previous_schedule.json oder Planspeicher)")
+    p.add_argument("--changes", help="routing_changes.csv von randx.py (sonst Protokoll seit der "
+                                     "Routing-Version des alten Plans im Planspeicher)")
+    p.add_argument("--out", help="Plan als JSON speichern")
+    p.add_argument("--store", help="Plan als neue Version im Planspeicher (gfalgo.store) ablegen")
+    p.add_argument("--profile", help="Laufzeiten pro Phase und Zähler speichern (.json oder .csv)")
+    p.add_argument("-q", "--quiet", action="store_true")
+    p.set_defaults(func=_cmd_reschedule)
+
+    p = sub.add_parser("rolling", help="rollierende Planung über mehrere Schichten")
+    p.add_argument("routing", help="Pfad zur routing.csv")
+    p.add_argument("--sigma", type=float, default=0.1)
+    p.add_argument("--shifts", type=int, default=22)
+    p.add_argument("--seed", type=int, default=None)
+    p.add_argument("--dist", choices=[d for d in DISTRIBUTIONS if d != "empirical"], default="lognormal")
+    p.add_argument("--repair-threshold", type=int, default=None,
+                   help="Right-Shift-Reparatur statt GT, solange keine Operation mehr als so viele "
+                        "Minuten verzögert ist (Standard: jede Schicht mit GT)")
+    p.add_argument("--csv", help="Kennzahlen pro Schicht als CSV speichern")
+    p.add_argument("--plot", help="Verlauf als Grafik speichern")
+    p.add_argument("--dpi", type=int, default=150)
+    p.add_argument("-q", "--quiet", action="store_true")
+    p.set_defaults(func=_cmd_rolling)
+
+    p = sub.add_parser("optimize", help="besseren Plan suchen als ein einzelner GT-Lauf")
+    p.add_argument("routing", help="Pfad zur routing.csv (oder Benchmark-Datei mit --format)")
+    p.add_argument("--format", choices=["orlib", "taillard"], help="Datei ist eine OR-Library-/Taillard-Instanz")
+    p.add_argument("--method", choices=["bnb", "beam"], default="bnb",
+                   help="bnb = Branch-and-Bound über alle Konfliktmengen, beam = Beam Search")
+    p.add_argument("--time-limit", type=float, default=60.0, help="Sekunden, danach bester bisheriger Plan")
+    p.add_argument("--width", type=int, default=8, help="beam: Startbreite (verdoppelt, solange Zeit bleibt)")
+    p.add_argument("--rule", action="append", choices=sorted(RULES), help="beam: Regel (mehrfach = parallel)")
+    p.add_argument("--seeds", type=int, nargs="+", help="beam: Tie-Break-Seeds (je Seed ein Beam)")
+    p.add_argument("--workers", type=int, default=None)
+    p.add_argument("--out", help="Plan als JSON speichern")
+    p.add_argument("--store", help="Plan als neue Version im Planspeicher (gfalgo.store) ablegen")
+    p.add_argument("--gantt", help="Gantt-Diagramm speichern (PNG/SVG/PDF)")
+    p.add_argument("--dpi", type=int, default=150)
+    p.add_argument("-q", "--quiet", action="store_true")
+    p.set_defaults(func=_cmd_optimize)
+
+    p = sub.add_parser("generate", help="synthetische Instanz als routing.csv erzeugen")
+    p.add_argument("out", help="Zieldatei")
+    p.add_argument("--jobs", type=int, default=10)
+    p.add_argument("--ops", type=int, default=None, help="Operationen pro Job (Standard: Anzahl Maschinen)")
+    p.add_argument("--machines", type=int, default=10)
+    p.add_argument("--structure", choices=STRUCTURES, default="random")
+    p.add_argument("--seed", type=int, default=None)
+    p.add_argument("--pt", type=int, nargs=2, default=(10, 100), metavar=("MIN", "MAX"),
+                   help="Bereich der Bearbeitungszeiten")
+    p.add_argument("--skew", type=float, default=0.0, help="Ungleichgewicht der Maschinenlast (0 = keins)")
+    p.add_argument("--due-factor", type=float, default=None, help="Fälligkeit = Faktor * Summe der Job-Dauern")
+    p.add_argument("-q", "--quiet", action="store_true")
+    p.set_defaults(func=_cmd_generate)
+
+    p = sub.add_parser("batch", help="viele Routing-Varianten in einem Prozesspool planen")
+    p.add_argument("routings", nargs="+", help="Pfade der routing.csv-Varianten")
+    p.add_argument("--rule", action="append", choices=sorted(RULES),
+                   help="Prioritätsregel (mehrfach angeben = Portfolio pro Variante), Standard koz")
+    p.add_argument("--seeds", type=int, nargs="+", help="Tie-Break-Seeds für das Portfolio")
+    p.add_argument("--objective", choices=["makespan", "stability", "tardiness"], default="makespan")
+    p.add_argument("--prev", help="gemeinsamer Vortagsplan für deviation und Kennzahlen")
+    p.add_argument("--workers", type=int, default=None)
+    p.add_argument("--calendar", help="Pausen/Wartung pro Maschine als CSV (Machine, Start, End)")
+    p.add_argument("--no-split", action="store_true",
+                   help="Operationen nicht durch Pausen unterbrechen, sondern in eine freie Lücke legen")
+    p.add_argument("--out-dir", help="Plan pro Variante als <name>.json in diesem Verzeichnis speichern")
+    p.add_argument("--csv", help="Kennzahlen pro Variante als CSV speichern")
+    p.add_argument("-q", "--quiet", action="store_true")
+    p.set_defaults(func=_cmd_batch)
+
+    p = sub.add_parser("analyze", help="kritischen Pfad und Schlupf eines Plans berechnen")
+    p.add_argument("routing", help="Pfad zur routing.csv")
+    p.add_argument("--schedule", required=True, help="Plan (previous_schedule.json oder Planspeicher)")
+    p.add_argument("--op-ids", action="store_true", help="op im Plan ist die CSV-Spalte Operation (gt_v2)")
+    p.add_argument("--csv", help="Start, Ende, Schwanz und Schlupf pro Operation als CSV speichern")
+    p.add_argument("-q", "--quiet", action="store_true")
+    p.set_defaults(func=_cmd_analyze)
+
+    # Nur für die Hilfe; die Argumente wertet gfalgo.montecarlo selbst aus (siehe main)
+    sub.add_parser("montecarlo", help="Monte-Carlo-Batch (Argumente wie python -m gfalgo.montecarlo)")
+    return parser
+
+
+def main(argv=None):
+    """
+    Einstiegspunkt der Kommandozeile.
+
+    Returns:
+        int: Exit-Code (0 = ok, 1 = Fehler in den Eingabedaten).
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["montecarlo"]:
+        # Argumente unverändert weiterreichen (inkl. --help)
+        return _cmd_montecarlo(argparse.Namespace(args=argv[1:]))
+
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError, KeyError) as exc:
+        print(f"gfalgo: Fehler: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
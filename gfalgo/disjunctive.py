@@ -0,0 +1,336 @@
+# ==============================================================
+# Disjunktiver Graph eines Plans (Köpfe, Schwänze, kritischer Pfad)
+# ==============================================================
+"""
+Explizite Vorrangstruktur eines Plans.
+
+Knoten sind die Operationen des Routings (globale Op-Nummer, CSR-Reihenfolge
+wie in gfalgo.routing). Kanten:
+
+- konjunktiv: Job-Vorgänger -> Job-Nachfolger (aus routing.csv),
+- disjunktiv, festgelegt durch den Plan: Maschinen-Vorgänger ->
+  Maschinen-Nachfolger (Reihenfolge aus previous_schedule.json).
+
+Daraus werden in linearer Zeit berechnet:
+
+- Kopf ``head``: längster Weg bis zum Start der Operation (= Startzeit im
+  semi-aktiven Plan),
+- Schwanz ``tail``: längster Weg vom Ende der Operation bis zum Planende,
+- ``makespan`` = max(head + pt), ``slack`` = makespan - (head + pt + tail),
+- der kritische Pfad (Operationen mit Schlupf 0).
+
+Die Berechnung läuft schichtweise (Kahn): Alle Operationen, deren
+Vorgänger fertig sind, werden als ein NumPy-Block bearbeitet. Jeder
+Knoten und jede Kante wird genau einmal angefasst.
+
+Ändert sich die Reihenfolge einer Maschine (``set_sequence``), werden
+Köpfe nur für die Nachfahren und Schwänze nur für die Vorfahren der
+geänderten Operationen neu berechnet; der Rest des Graphen bleibt stehen.
+So lässt sich eine geänderte Sequenz bewerten, ohne die GT-Schleife neu
+laufen zu lassen.
+"""
+import numpy as np
+
+from .changelog import load_latest
+from .prev_schedule import PreviousSchedule
+
+__all__ = ["DisjunctiveGraph"]
+
+
+class DisjunctiveGraph:
+    """
+    Disjunktiver Graph aus Routing und Maschinenreihenfolgen.
+
+    Args:
+        routing (Routing): Die Stammdaten der Jobs.
+        sequences (dict): {maschine: [globale Op-Nummern in Bearbeitungsreihenfolge]}
+            für jede Maschine des Routings (Originalnamen wie in routing.csv).
+        use_op_ids (bool): "op" in ``records()`` ist die CSV-Spalte Operation
+            (gt_v2) statt der Position im Job + 1 (gt_mininv.py).
+
+    Attributes:
+        head, tail (np.ndarray): Köpfe und Schwänze pro Operation.
+        makespan (int): Länge des längsten Wegs.
+
+    Raises:
+        ValueError: Reihenfolgen passen nicht zum Routing oder erzeugen einen Zyklus.
+    """
+
+    def __init__(self, routing, sequences, use_op_ids=False):
+        n = routing.n_ops
+        self.routing = routing
+        self.n = n
+        self.use_op_ids = use_op_ids
+        self.op_job = routing.op_job_index()
+        self._codes = {name: c for c, name in enumerate(routing.machines)}
+
+        # Index n ist ein Hilfsknoten mit Kopf/Schwanz/Dauer 0 für "kein Vorgänger"
+        self.pt = np.append(np.asarray(routing.pt, dtype=np.int64), 0)
+        offsets = routing.job_offsets
+        self.jp = np.arange(-1, n, dtype=np.int64)
+        self.jp[offsets[:-1]] = n
+        self.jp[n] = n
+        self.js = np.arange(1, n + 2, dtype=np.int64)
+        self.js[offsets[1:] - 1] = n
+        self.js[n] = n
+        self.mp = np.full(n + 1, n, dtype=np.int64)
+        self.ms = np.full(n + 1, n, dtype=np.int64)
+
+        self.sequences = {}
+        for m, ops in sequences.items():
+            code = self._code(m)
+            ops = np.asarray(ops, dtype=np.int64)
+            if (routing.machine_codes[ops] != code).any():
+                raise ValueError(f"Reihenfolge von {m} enthält Operationen anderer Maschinen")
+            self.sequences[code] = ops
+            self._link(ops)
+        counts = np.bincount(routing.machine_codes, minlength=routing.n_machines)
+        listed = np.zeros(routing.n_machines, dtype=np.int64)
+        for code, ops in self.sequences.items():
+            listed[code] = len(ops) if len(np.unique(ops)) == len(ops) else -1
+        if (listed != counts).any():
+            raise ValueError("Reihenfolgen müssen jede Operation genau einmal enthalten")
+
+        self.head = np.zeros(n + 1, dtype=np.int64)
+        self.tail = np.zeros(n + 1, dtype=np.int64)
+        everything = np.arange(n, dtype=np.int64)
+        if not (self._longest(everything, True) and self._longest(everything, False)):
+            raise ValueError("Maschinenreihenfolgen widersprechen der Jobreihenfolge (Zyklus)")
+        self.makespan = self._makespan()
+
+    @classmethod
+    def from_schedule(cls, routing, schedule, use_op_ids=False):
+        """
+        Graph aus einem Plan (Reihenfolge pro Maschine nach Start).
+
+        Args:
+            routing (Routing): Die Stammdaten der Jobs.
+            schedule (iterable): Einträge im Format von previous_schedule.json
+                oder ein PreviousSchedule.
+            use_op_ids (bool): "op" ist die CSV-Spalte Operation statt Position + 1.
+
+        Returns:
+            DisjunctiveGraph
+        """
+        n = routing.n_ops
+        op_job = routing.op_job_index()
+        ops = routing.op_ids if use_op_ids else np.arange(n) - routing.job_offsets[op_job] + 1
+        index = dict(zip(zip(routing.job_ids[op_job].tolist(), ops.tolist()), range(n)))
+
+        start = np.full(n, -1, dtype=np.int64)
+        end = np.zeros(n, dtype=np.int64)
+        for e in schedule:
+            o = index.get((e["job"], e["op"]))
+            if o is None:
+                raise ValueError(f"Operation ({e['job']}, {e['op']}) fehlt im Routing")
+            start[o], end[o] = e["start"], e["end"]
+        if (start < 0).any():
+            raise ValueError(f"Plan enthält nur {int((start >= 0).sum())} von {n} Operationen")
+
+        machine = routing.machine_codes
+        order = np.lexsort((np.arange(n), end, start, machine))
+        bounds = np.searchsorted(machine[order], np.arange(routing.n_machines + 1))
+        sequences = {name: order[lo:hi] for name, lo, hi in zip(routing.machines, bounds[:-1], bounds[1:])}
+        return cls(routing, sequences, use_op_ids=use_op_ids)
+
+    @classmethod
+    def load(cls, routing_path, schedule_path, use_op_ids=False):
+        """
+        Graph aus routing.csv und previous_schedule.json (oder einem Planspeicher).
+
+        Args:
+            routing_path (str | Path): Pfad zur routing.csv (samt Änderungsprotokoll,
+                siehe gfalgo.changelog.load_latest).
+            schedule_path (str | Path): previous_schedule.json oder Verzeichnis von gfalgo.store.
+            use_op_ids (bool): "op" ist die CSV-Spalte Operation statt Position + 1.
+
+        Returns:
+            DisjunctiveGraph
+        """
+        return cls.from_schedule(load_latest(routing_path)[0], PreviousSchedule.load(schedule_path), use_op_ids)
+
+    # ----------------------------------------------------------
+    # Längste Wege
+    # ----------------------------------------------------------
+    def _code(self, m):
+        code = self._codes.get(m)
+        if code is None:
+            raise ValueError(f"Unbekannte Maschine {m!r}")
+        return code
+
+    def _link(self, ops):
+        """Maschinen-Vorgänger und -Nachfolger für eine Reihenfolge setzen."""
+        if len(ops):
+            self.mp[ops] = np.concatenate(([self.n], ops[:-1]))
+            self.ms[ops] = np.concatenate((ops[1:], [self.n]))
+
+    def _longest(self, nodes, forward):
+        """
+        Köpfe (forward) bzw. Schwänze für nodes, schichtweise nach Kahn.
+
+        Werte außerhalb von nodes gelten als aktuell. nodes muss alle
+        Nachfahren (Köpfe) bzw. Vorfahren (Schwänze) seiner Elemente enthalten.
+
+        Returns:
+            bool: False bei einem Zyklus.
+        """
+        if forward:
+            val, pred1, pred2, succ1, succ2 = self.head, self.jp, self.mp, self.js, self.ms
+        else:
+            val, pred1, pred2, succ1, succ2 = self.tail, self.js, self.ms, self.jp, self.mp
+        pt = self.pt
+        member = np.zeros(self.n + 1, dtype=bool)
+        member[nodes] = True
+        degree = np.zeros(self.n + 1, dtype=np.int64)
+        degree[nodes] = member[pred1[nodes]].astype(np.int64) + member[pred2[nodes]]
+        frontier = nodes[degree[nodes] == 0]
+        done = 0
+        while frontier.size:
+            done += frontier.size
+            p1, p2 = pred1[frontier], pred2[frontier]
+            val[frontier] = np.maximum(val[p1] + pt[p1], val[p2] + pt[p2])
+            succ = np.concatenate((succ1[frontier], succ2[frontier]))
+            succ = succ[member[succ]]
+            np.subtract.at(degree, succ, 1)
+            frontier = np.unique(succ[degree[succ] == 0])
+        return done == len(nodes)
+
+    def _reachable(self, seeds, forward):
+        """Alle Nachfahren (forward) bzw. Vorfahren von seeds inklusive seeds, sortiert."""
+        succ1, succ2 = (self.js, self.ms) if forward else (self.jp, self.mp)
+        seen = np.zeros(self.n + 1, dtype=bool)
+        seen[self.n] = True
+        frontier = np.unique(seeds)
+        seen[frontier] = True
+        while frontier.size:
+            nxt = np.concatenate((succ1[frontier], succ2[frontier]))
+            nxt = np.unique(nxt[~seen[nxt]])
+            seen[nxt] = True
+            frontier = nxt
+        seen[self.n] = False
+        return np.flatnonzero(seen)
+
+    def _makespan(self):
+        return int((self.head[:-1] + self.pt[:-1]).max()) if self.n else 0
+
+    # ----------------------------------------------------------
+    # Abfragen
+    # ----------------------------------------------------------
+    @property
+    def slack(self):
+        """Gesamtschlupf pro Operation: so weit kann sie sich verzögern, ohne den Makespan zu ändern."""
+        return self.makespan - (self.head[:-1] + self.pt[:-1] + self.tail[:-1])
+
+    @property
+    def critical(self):
+        """Maske der kritischen Operationen (Schlupf 0)."""
+        return self.slack == 0
+
+    def sequence(self, m):
+        """Reihenfolge auf Maschine m als Array globaler Op-Nummern."""
+        return self.sequences.get(self._code(m), np.empty(0, dtype=np.int64)).copy()
+
+    def critical_path(self):
+        """
+        Ein kritischer Pfad vom Planstart bis zum Planende.
+
+        Bei Gleichstand wird der Maschinen-Vorgänger bevorzugt, damit die
+        Blöcke auf derselben Maschine zusammenhängend bleiben.
+
+        Returns:
+            np.ndarray: Globale Op-Nummern in Pfadreihenfolge.
+        """
+        if not self.n:
+            return np.empty(0, dtype=np.int64)
+        head, pt, jp, mp = self.head, self.pt, self.jp, self.mp
+        o = int(np.argmax(head[:-1] + pt[:-1]))
+        path = [o]
+        while head[o] > 0:
+            p = mp[o]
+            if head[p] + pt[p] != head[o]:
+                p = jp[o]
+            o = int(p)
+            path.append(o)
+        return np.array(path[::-1], dtype=np.int64)
+
+    def critical_blocks(self):
+        """
+        Blöcke des kritischen Pfads (aufeinanderfolgende Operationen auf derselben Maschine).
+
+        Returns:
+            list: [(maschine, np.ndarray der Op-Nummern), ...] in Pfadreihenfolge.
+        """
+        path = self.critical_path()
+        if not path.size:
+            return []
+        cut = np.flatnonzero(self.mp[path[1:]] != path[:-1]) + 1
+        names = self.routing.machines
+        codes = self.routing.machine_codes
+        return [(names[codes[block[0]]], block) for block in np.split(path, cut)]
+
+    # ----------------------------------------------------------
+    # Änderungen
+    # ----------------------------------------------------------
+    def set_sequence(self, m, ops):
+        """
+        Setzt eine neue Reihenfolge für Maschine m und aktualisiert Köpfe und Schwänze.
+
+        Neu berechnet werden nur die Nachfahren (Köpfe) bzw. Vorfahren
+        (Schwänze) des geänderten Abschnitts.
+
+        Args:
+            m: Maschine (Name wie in routing.csv).
+            ops (array-like): Dieselben Operationen in neuer Reihenfolge.
+
+        Returns:
+            int: Neuer Makespan.
+
+        Raises:
+            ValueError: Andere Operationen als bisher oder die Reihenfolge erzeugt
+                einen Zyklus (der Graph bleibt dann unverändert).
+        """
+        code = self._code(m)
+        old = self.sequences.get(code, np.empty(0, dtype=np.int64))
+        new = np.asarray(ops, dtype=np.int64)
+        if len(new) != len(old) or not np.array_equal(np.sort(new), np.sort(old)):
+            raise ValueError(f"Neue Reihenfolge von {m} muss dieselben Operationen enthalten")
+        diff = np.flatnonzero(new != old)
+        if not diff.size:
+            return self.makespan
+        lo, hi = int(diff[0]), int(diff[-1])
+
+        # Köpfe ändern sich ab dem geänderten Abschnitt (plus dessen Nachfolger),
+        # Schwänze bis zum geänderten Abschnitt (plus dessen Vorgänger)
+        self.sequences[code] = new
+        self._link(new)
+        heads = self._reachable(new[lo:hi + 2], True)
+        tails = self._reachable(new[max(lo - 1, 0):hi + 1], False)
+        saved_head, saved_tail = self.head[heads], self.tail[tails]
+        if not (self._longest(heads, True) and self._longest(tails, False)):
+            self.sequences[code] = old
+            self._link(old)
+            self.head[heads], self.tail[tails] = saved_head, saved_tail
+            raise ValueError(f"Neue Reihenfolge von {m} erzeugt einen Zyklus")
+        self.makespan = self._makespan()
+        return self.makespan
+
+    # ----------------------------------------------------------
+    # Ausgabe
+    # ----------------------------------------------------------
+    def records(self):
+        """Semi-aktiver Plan (Start = Kopf) im Format von previous_schedule.json, Reihenfolge des Routings."""
+        routing = self.routing
+        n = self.n
+        job_ids = routing.job_ids[self.op_job].tolist()
+        if self.use_op_ids:
+            ops = routing.op_ids.tolist()
+        else:
+            ops = (np.arange(n) - routing.job_offsets[self.op_job] + 1).tolist()
+        names = routing.machines
+        machines = [names[c] for c in routing.machine_codes.tolist()]
+        starts = self.head[:-1].tolist()
+        ends = (self.head[:-1] + self.pt[:-1]).tolist()
+        return [
+            {"job": j, "op": op, "machine": m, "start": s, "end": e}
+            for j, op, m, s, e in zip(job_ids, ops, machines, starts, ends)
+        ]
@@ -0,0 +1,211 @@
+# ==============================================================
+# Skalierbares Gantt-Diagramm
+# ==============================================================
+"""
+Gantt-Diagramm für große Pläne.
+
+Die Skripte zeichnen jede Operation mit einem eigenen ``ax.barh`` und
+``ax.text``. Das ist bei einigen tausend Operationen schon minutenlang und
+die Beschriftungen überlagern sich. Hier wird jede Maschine als **eine**
+``PolyCollection`` gezeichnet, die Rechtecke werden mit NumPy aufgebaut.
+
+Level of Detail (abhängig von Bildbreite, dpi und sichtbarem Zeitfenster):
+
+- Operationen, die schmaler als ``min_px`` Pixel wären, werden pro
+  Pixelspalte zu einem Block zusammengefasst (Farbe ``aggregate_color``).
+- Beschriftungen ("Job 7") gibt es nur für Balken ab ``label_px`` Pixeln,
+  höchstens ``max_labels`` Stück.
+- Rahmenlinien nur, solange eine Maschine nicht dichter belegt ist als
+  ``edge_px`` Pixel pro Balken.
+- Mit ``xlim`` wird nur ein Zeitfenster gezeichnet (Zoom), Operationen
+  außerhalb werden vorher aussortiert.
+
+matplotlib wird erst beim Zeichnen importiert.
+"""
+import numpy as np
+
+__all__ = ["plot_gantt", "save_gantt", "default_job_colors", "PALETTE"]
+
+PALETTE = ['tab:blue', 'tab:orange', 'tab:green', 'tab:red', 'tab:purple',
+           'tab:brown', 'tab:pink', 'tab:gray', 'tab:olive', 'tab:cyan']
+
+
+def default_job_colors(job_ids, palette=PALETTE):
+    """Feste Farbe pro Job wie in gt_koz.py (sortierte Job-IDs, Palette zyklisch)."""
+    return {job_id: palette[i % len(palette)] for i, job_id in enumerate(sorted(set(job_ids)))}
+
+
+def _lane_pixels(ax):
+    """Breite der Zeichenfläche in Pixeln (für das Level of Detail)."""
+    fig = ax.figure
+    return max(1.0, ax.get_position().width * fig.get_figwidth() * fig.dpi)
+
+
+def _aggregate(starts, ends, bin_width):
+    """
+    Fasst aufeinanderfolgende Operationen pro Zeit-Bin zu Blöcken zusammen.
+
+    Args:
+        starts, ends (np.ndarray): Nach Start sortierte Intervalle einer Maschine.
+        bin_width (float): Breite eines Bins (= eine Pixelspalte) in Zeiteinheiten.
+
+    Returns:
+        tuple: (starts, ends) der Blöcke.
+    """
+    bins = np.floor(starts / bin_width)
+    first = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+    return starts[first], np.maximum.reduceat(ends, first)
+
+
+def _rects(starts, ends, y, height):
+    """Rechtecke als Vertex-Array (n, 4, 2) für eine PolyCollection."""
+    n = len(starts)
+    verts = np.empty((n, 4, 2))
+    y0, y1 = y - height / 2, y + height / 2
+    verts[:, 0, 0] = verts[:, 1, 0] = starts
+    verts[:, 2, 0] = verts[:, 3, 0] = ends
+    verts[:, 0, 1] = verts[:, 3, 1] = y0
+    verts[:, 1, 1] = verts[:, 2, 1] = y1
+    return verts
+
+
+def plot_gantt(schedule, ax=None, job_colors=None, title=None, lane_label="Maschine {}",
+               job_label="Job {}", xlim=None, markers=None, height=0.8, min_px=1.0,
+               label_px=30.0, max_labels=2000, edge_px=4.0, aggregate_color="0.4",
+               fontsize=9, figsize=(10, 5)):
+    """
+    Zeichnet einen Plan als Gantt-Diagramm (eine Collection pro Maschine).
+
+    Args:
+        schedule (list): Einträge {"job", "machine", "start", "end", ...}
+            wie in previous_schedule.json.
+        ax (Axes | None): Ziel-Achse; None = neue Figure mit ``figsize``.
+        job_colors (dict | None): {job_id: Farbe}; None = default_job_colors.
+        title (str | None): Diagrammtitel.
+        lane_label (str): Format der Maschinenbeschriftung.
+        job_label (str | None): Format der Balkenbeschriftung; None = keine.
+        xlim (tuple | None): Sichtbares Zeitfenster (t_von, t_bis).
+        markers (list | None): [(maschine, zeit), ...] als rote, gestrichelte
+            Linien (z.B. Start im Vortagsplan).
+        height (float): Balkenhöhe (Abstand der Maschinen = 1).
+        min_px (float): Schmalere Operationen werden zusammengefasst.
+        label_px (float): Mindestbreite eines Balkens für eine Beschriftung.
+        max_labels (int): Obergrenze für Beschriftungen im ganzen Diagramm.
+        edge_px (float): Rahmenlinien nur bei mindestens so vielen Pixeln pro Balken.
+        aggregate_color: Farbe der zusammengefassten Blöcke.
+        fontsize (int): Schriftgröße der Balkenbeschriftung.
+        figsize (tuple): Größe einer neuen Figure.
+
+    Returns:
+        Axes: Die Achse mit dem Diagramm.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.colors import to_rgba_array
+
+    if ax is None:
+        _, ax = plt.subplots(figsize=figsize)
+
+    n = len(schedule)
+    jobs = [s["job"] for s in schedule]
+    machines = [s["machine"] for s in schedule]
+    starts = np.fromiter((s["start"] for s in schedule), dtype=float, count=n)
+    ends = np.fromiter((s["end"] for s in schedule), dtype=float, count=n)
+
+    # Maschinen in Reihenfolge des ersten Auftretens (wie ax.barh mit Kategorien)
+    lanes = list(dict.fromkeys(machines))
+    lane_of = {m: i for i, m in enumerate(lanes)}
+    lane_idx = np.fromiter((lane_of[m] for m in machines), dtype=np.int64, count=n)
+
+    # Farben einmal pro Job auflösen, danach nur noch Indexzugriffe
+    if job_colors is None:
+        job_colors = default_job_colors(jobs)
+    job_keys = list(dict.fromkeys(jobs))
+    job_code = {j: i for i, j in enumerate(job_keys)}
+    job_idx = np.fromiter((job_code[j] for j in jobs), dtype=np.int64, count=n)
+    color_table = to_rgba_array([job_colors[j] for j in job_keys]) if job_keys else np.empty((0, 4))
+
+    # Sichtbares Zeitfenster
+    if xlim is None:
+        xlim = (0.0, float(ends.max()) * 1.02 if n else 1.0)  # etwas Rand rechts
+    t_from, t_to = xlim
+    if t_to <= t_from:
+        t_to = t_from + 1.0
+    visible = (ends > t_from) & (starts < t_to)
+    px_per_time = _lane_pixels(ax) / (t_to - t_from)
+    bin_width = min_px / px_per_time
+
+    labels_left = max_labels if job_label else 0
+    for lane in range(len(lanes)):
+        sel = np.flatnonzero(visible & (lane_idx == lane))
+        if len(sel) == 0:
+            continue
+        sel = sel[np.argsort(starts[sel], kind="stable")]
+        s, e = starts[sel], ends[sel]
+        wide = (e - s) >= bin_width
+
+        verts = [_rects(s[wide], e[wide], lane, height)]
+        facecolors = [color_table[job_idx[sel[wide]]]]
+        if not wide.all():
+            agg_s, agg_e = _aggregate(s[~wide], e[~wide], bin_width)
+            verts.append(_rects(agg_s, agg_e, lane, height))
+            facecolors.append(to_rgba_array([aggregate_color] * len(agg_s)))
+        verts = np.concatenate(verts)
+        facecolors = np.concatenate(facecolors)
+
+        dense = len(verts) * edge_px > (min(e[-1], t_to) - max(s[0], t_from)) * px_per_time
+        ax.add_collection(PolyCollection(
+            verts, facecolors=facecolors, edgecolors="black",
+            linewidths=0 if dense else 0.8,
+        ))
+
+        # Beschriftungen nur für ausreichend breite Balken
+        if labels_left > 0:
+            visible_w = np.minimum(e, t_to) - np.maximum(s, t_from)
+            big = np.flatnonzero(visible_w * px_per_time >= label_px)[:labels_left]
+            labels_left -= len(big)
+            for k in big:
+                x = (max(s[k], t_from) + min(e[k], t_to)) / 2
+                ax.text(x, lane, job_label.format(jobs[sel[k]]), va='center', ha='center',
+                        color='white', fontsize=fontsize, clip_on=True)
+
+    if markers:
+        segments = [[(t, lane_of[m] - height / 2), (t, lane_of[m] + height / 2)]
+                    for m, t in markers if m in lane_of]
+        ax.add_collection(LineCollection(segments, colors='red', linewidths=2, linestyles='--'))
+
+    ax.set_xlim(t_from, t_to)
+    ax.set_ylim(-0.5, len(lanes) - 0.5)
+    ax.set_yticks(range(len(lanes)))
+    ax.set_yticklabels([lane_label.format(m) for m in lanes])
+    ax.set_xlabel("Zeit")
+    ax.set_ylabel("Maschinen")
+    if title:
+        ax.set_title(title)
+    ax.grid(True, axis='x', linestyle='--', alpha=0.6)
+    return ax
+
+
+def save_gantt(schedule, path, dpi=150, **kwargs):
+    """
+    Zeichnet den Plan und speichert ihn (PNG, SVG, PDF je nach Endung).
+
+    Die Figure wird danach geschlossen; es öffnet sich kein Fenster.
+
+    Args:
+        schedule (list): Plan wie bei plot_gantt.
+        path (str | Path): Zieldatei.
+        dpi (int): Auflösung für Rastergrafiken.
+        **kwargs: Weitere Argumente für plot_gantt.
+
+    Returns:
+        str: Der Pfad der gespeicherten Datei.
+    """
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=kwargs.pop("figsize", (10, 5)), dpi=dpi)
+    plot_gantt(schedule, ax=ax, **kwargs)
+    fig.tight_layout()
+    fig.savefig(path, dpi=dpi)
+    plt.close(fig)
+    return str(path)
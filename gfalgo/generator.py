@@ -0,0 +1,96 @@
+# ==============================================================
+# Synthetische Instanzen beliebiger Größe
+# ==============================================================
+"""
+Seedbarer Generator für Routing-Instanzen (Verallgemeinerung von randx.py).
+
+Strukturen:
+
+- ``"random"``: wie randx.py, jede Operation wählt ihre Maschine zufällig
+  (Wiederholungen im Job erlaubt), beliebig viele Operationen pro Job.
+- ``"taillard"``: klassischer Job-Shop nach Taillard, jeder Job besucht
+  jede Maschine genau einmal in zufälliger Reihenfolge.
+- ``"flowshop"``: alle Jobs besuchen die Maschinen in derselben Reihenfolge.
+
+``skew`` erzeugt ungleich ausgelastete Maschinen (Engpässe): Maschine ``i``
+bekommt das Gewicht ``(i + 1) ** -skew``. Bei ``"random"`` steuert das die
+Maschinenwahl, bei den beiden Permutations-Strukturen (jede Maschine einmal
+pro Job) werden stattdessen die Bearbeitungszeiten mit dem Gewicht
+skaliert (Mittelwert 1). ``skew=0`` ist gleichverteilt.
+
+Derselbe Seed liefert immer dieselbe Instanz.
+"""
+import numpy as np
+
+from .routing import Routing
+
+__all__ = ["generate_routing", "machine_names", "STRUCTURES"]
+
+STRUCTURES = ("random", "taillard", "flowshop")
+
+
+def machine_names(num_machines):
+    """Maschinennamen wie in randx.py: M00, M01, ... (breiter ab 100 Maschinen)."""
+    width = max(2, len(str(num_machines - 1)))
+    return [f"M{i:0{width}d}" for i in range(num_machines)]
+
+
+def _machine_weights(num_machines, skew):
+    w = np.arange(1, num_machines + 1, dtype=float) ** -float(skew)
+    return w / w.sum()
+
+
+def generate_routing(num_jobs, num_operations=None, num_machines=10, structure="random", seed=None,
+                     pt_low=10, pt_high=100, skew=0.0, due_factor=None):
+    """
+    Erzeugt eine Instanz als Routing.
+
+    Args:
+        num_jobs (int): Anzahl Jobs (Routing_ID 0 .. num_jobs - 1).
+        num_operations (int | None): Operationen pro Job; None = num_machines.
+            Bei "taillard" und "flowshop" muss es num_machines sein.
+        num_machines (int): Anzahl Maschinen (Namen siehe machine_names).
+        structure (str): "random", "taillard" oder "flowshop".
+        seed (int | None): Seed; None = nicht reproduzierbar.
+        pt_low, pt_high (int): Bearbeitungszeiten gleichverteilt in [pt_low, pt_high].
+        skew (float): Ungleichgewicht der Maschinenlast (0 = keins).
+        due_factor (float | None): Wenn gesetzt, Fälligkeit pro Job =
+            due_factor * Summe seiner Bearbeitungszeiten (Spalte "Due Date").
+
+    Returns:
+        Routing
+
+    Raises:
+        ValueError: Unbekannte Struktur oder unpassende Operationsanzahl.
+    """
+    if structure not in STRUCTURES:
+        raise ValueError(f"Unbekannte Struktur {structure!r}, erlaubt: {', '.join(STRUCTURES)}")
+    if num_operations is None:
+        num_operations = num_machines
+    if structure != "random" and num_operations != num_machines:
+        raise ValueError(f"{structure}: jeder Job besucht jede Maschine einmal, "
+                         f"num_operations muss {num_machines} sein")
+
+    rng = np.random.default_rng(seed)
+    shape = (num_jobs, num_operations)
+    weights = _machine_weights(num_machines, skew)
+
+    if structure == "random":
+        machine = rng.choice(num_machines, size=shape, p=weights)
+    elif structure == "taillard":
+        machine = rng.permuted(np.tile(np.arange(num_machines), (num_jobs, 1)), axis=1)
+    else:
+        machine = np.tile(np.arange(num_machines), (num_jobs, 1))
+
+    pt = rng.integers(pt_low, pt_high, size=shape, endpoint=True)
+    if structure != "random" and skew:
+        # Jede Maschine kommt in jedem Job vor: Last über die Dauer verschieben
+        pt = np.maximum(1, np.rint(pt * (weights * num_machines)[machine])).astype(np.int64)
+
+    names = np.array(machine_names(num_machines), dtype=object)
+    job = np.repeat(np.arange(num_jobs), num_operations)
+    op = np.tile(np.arange(num_operations), num_jobs)
+    due = None
+    if due_factor is not None:
+        due = np.repeat(np.rint(pt.sum(axis=1) * due_factor).astype(np.int64), num_operations)
+    return Routing.from_columns(job, op, names[machine.ravel()], pt.ravel(), due)
@@ -0,0 +1,443 @@
+# ==============================================================
+# Giffler-Thompson Kern mit Prioritätswarteschlangen pro Maschine
+# ==============================================================
+"""
+Wiederverwendbarer Giffler-Thompson-Kern.
+
+Statt in jeder Iteration alle einplanbaren Operationen neu zu bewerten,
+hält jede Maschine ihre Kandidaten in zwei Heaps:
+
+- ``waiting``: Operationen, deren technologischer Freigabezeitpunkt ``t``
+  nicht nach der Maschinen-Ready-Time liegt. Ihr frühestes Ende ist
+  ``ready + pt``, die Reihenfolge hängt also nur von ``pt`` ab.
+- ``pending``: Operationen mit ``t > ready``. Ihr frühestes Ende ist
+  ``t + pt``. Ein zweiter Heap nach ``t`` verschiebt sie nach ``waiting``,
+  sobald die Maschine aufgeholt hat.
+
+Ein globaler Heap enthält pro Maschine das kleinste frühestes Ende.
+Veraltete Einträge werden nicht gelöscht, sondern über eine Versionsnummer
+beim Herausnehmen verworfen (lazy invalidation). Pro Schritt werden nur
+die Maschine der eingeplanten Operation und die Maschine des
+Job-Nachfolgers neu bewertet.
+
+Gleichstände werden wie in gt_koz.py aufgelöst: maßgeblich ist die
+Reihenfolge, in der die Operationen einplanbar wurden (Position in ``S``).
+
+Maschinenkalender (gfalgo.calendars) und Job-Freigabezeitpunkte sind
+optional. Mit Kalender ist das früheste Ende nicht mehr ``t + pt``, sondern
+das Ende laut Kalender (Binärsuche); es ist weiterhin monoton in ``t`` und
+``pt``, die Heaps bleiben also gültig. ``pending_d`` wird beim Freigeben
+mit dem Kalenderende belegt, und die Konfliktmenge enthält nur Operationen,
+die laut Kalender vor ``dmin`` beginnen können.
+"""
+import heapq
+import random
+import time
+
+from .profiling import active
+
+__all__ = ["GTEngine", "giffler_thompson", "koz"]
+
+# Zustände einer Operation
+_BLOCKED = 0   # Vorgänger noch nicht eingeplant
+_WAITING = 1   # einplanbar, t <= Maschinen-Ready-Time
+_PENDING = 2   # einplanbar, t > Maschinen-Ready-Time
+_DONE = 3      # eingeplant
+
+
+def koz(engine, o):
+    """
+    KOZ-Regel (Kürzeste Operationszeit) als Prioritätsschlüssel.
+
+    Args:
+        engine (GTEngine): Der laufende Kern.
+        o (int): Interne Operationsnummer.
+
+    Returns:
+        int: Bearbeitungszeit (kleiner = höhere Priorität).
+    """
+    return engine.pt[o]
+
+
+class _MachineQueue:
+    """Kandidaten einer Maschine (siehe Moduldokumentation)."""
+
+    __slots__ = ("ready", "waiting", "waiting_ops", "pending_t", "pending_d", "version", "calendar")
+
+    def __init__(self, calendar=None):
+        self.ready = 0
+        self.waiting = []       # (pt, seq, o)
+        self.waiting_ops = {}   # o -> None, für die Konfliktmenge
+        self.pending_t = []     # (t, seq, o)
+        self.pending_d = []     # (t + pt, seq, o), mit Kalender (Ende laut Kalender, seq, o)
+        self.version = 0
+        self.calendar = calendar  # MachineCalendar oder None = durchgehend verfügbar
+
+
+class GTEngine:
+    """
+    Giffler-Thompson-Algorithmus mit frei wählbarer Prioritätsregel.
+
+    Args:
+        jobs (dict): {job_id: [(maschine, bearbeitungszeit), ...]} wie in gt_koz.py.
+        rule (callable): Prioritätsschlüssel ``rule(engine, o)``; aus der
+            Konfliktmenge wird die Operation mit dem kleinsten Schlüssel gewählt
+            (siehe gfalgo.rules).
+        prev_schedule (PreviousSchedule | None): Vortagsplan für stabilitätsorientierte Regeln.
+        due_dates (dict | None): {job_id: Fälligkeit} für terminorientierte Regeln.
+        seed (int | None): Zufällige Gleichstandsauflösung; None = Reihenfolge
+            des Einplanbarwerdens wie in gt_koz.py.
+        profiler (Profiler | None): Misst in ``run`` die Phasen "gt.conflict_set",
+            "gt.rule" und "gt.commit" und zählt Iterationen, Konfliktmengen und
+            Regelauswertungen (siehe gfalgo.profiling).
+        calendars (dict | None): {maschine: MachineCalendar} mit Pausen und
+            Wartung; Maschinen ohne Kalender sind durchgehend verfügbar.
+        release_dates (dict | None): {job_id: Freigabezeitpunkt}; fehlende Jobs ab 0.
+    """
+
+    def __init__(self, jobs, rule=koz, prev_schedule=None, due_dates=None, seed=None, profiler=None,
+                 calendars=None, release_dates=None):
+        self.rule = rule
+        self.profiler = profiler
+        self.prev_schedule = prev_schedule
+        self.due_dates = due_dates
+        self.release_dates = release_dates
+
+        # Operationen durchnummerieren (Job für Job, in Reihenfolge)
+        self.op_job = []
+        self.op_index = []
+        self.machine = []
+        self.pt = []
+        self.job_first = {}
+        for job, ops in jobs.items():
+            self.job_first[job] = len(self.pt)
+            for i, (m, p) in enumerate(ops):
+                self.op_job.append(job)
+                self.op_index.append(i)
+                self.machine.append(m)
+                self.pt.append(p)
+
+        n = len(self.pt)
+
+        # Restarbeit des Jobs ab Operation o (inklusive), für MWKR
+        self.work_remaining = [0] * n
+        for o in range(n - 1, -1, -1):
+            nxt = o + 1
+            same_job = nxt < n and self.op_job[nxt] == self.op_job[o]
+            self.work_remaining[o] = self.pt[o] + (self.work_remaining[nxt] if same_job else 0)
+
+        self.tiebreak = None
+        if seed is not None:
+            rng = random.Random(seed)
+            self.tiebreak = [rng.random() for _ in range(n)]
+
+        self.t = [0] * n
+        self.seq = [0] * n
+        self.state = [_BLOCKED] * n
+        self.start = [None] * n
+        self.end = [None] * n
+        self.order = []  # eingeplante Operationen in Einplanungsreihenfolge
+
+        self.queues = {}
+        for m in self.machine:
+            if m not in self.queues:
+                self.queues[m] = _MachineQueue(calendars.get(m) if calendars else None)
+
+        self._heap = []
+        self._next_seq = 0
+
+    # ----------------------------------------------------------
+    # Hilfsfunktionen
+    # ----------------------------------------------------------
+    def _release(self, o, t):
+        """Operation o wird mit Freigabezeit t einplanbar."""
+        q = self.queues[self.machine[o]]
+        self.t[o] = t
+        self.seq[o] = self._next_seq
+        self._next_seq += 1
+        if t <= q.ready:
+            self.state[o] = _WAITING
+            heapq.heappush(q.waiting, (self.pt[o], self.seq[o], o))
+            q.waiting_ops[o] = None
+        else:
+            self.state[o] = _PENDING
+            d = t + self.pt[o] if q.calendar is None else q.calendar.schedule(t, self.pt[o])[1]
+            heapq.heappush(q.pending_t, (t, self.seq[o], o))
+            heapq.heappush(q.pending_d, (d, self.seq[o], o))
+
+    def _refresh(self, m):
+        """Bestes frühestes Ende der Maschine m neu in den globalen Heap legen."""
+        q = self.queues[m]
+        state = self.state
+
+        # Operationen, deren Freigabe die Maschine eingeholt hat, umhängen
+        while q.pending_t and q.pending_t[0][0] <= q.ready:
+            _, s, o = heapq.heappop(q.pending_t)
+            if state[o] == _PENDING:
+                state[o] = _WAITING
+                heapq.heappush(q.waiting, (self.pt[o], s, o))
+                q.waiting_ops[o] = None
+
+        while q.waiting and state[q.waiting[0][2]] != _WAITING:
+            heapq.heappop(q.waiting)
+        while q.pending_d and state[q.pending_d[0][2]] != _PENDING:
+            heapq.heappop(q.pending_d)
+
+        best = None
+        if q.waiting:
+            # Kleinste Dauer = frühestes Ende, auch mit Kalender (monoton in pt)
+            p, s, _ = q.waiting[0]
+            best = (q.ready + p if q.calendar is None else q.calendar.schedule(q.ready, p)[1], s)
+        if q.pending_d:
+            d, s, _ = q.pending_d[0]
+            if best is None or (d, s) < best:
+                best = (d, s)
+
+        q.version += 1
+        if best is not None:
+            heapq.heappush(self._heap, (best[0], best[1], q.version, m))
+
+    def conflict_set(self, m, dmin):
+        """
+        Konfliktmenge K der Maschine m: alle Kandidaten mit t < dmin,
+        sortiert nach der Reihenfolge, in der sie einplanbar wurden.
+
+        Bei unterbrechbarem Kalender kann jede Operation mit t < dmin auch
+        vor dmin beginnen (dmin ist ein Ende, davor arbeitet die Maschine).
+        Nur bei nicht unterbrechbarem Kalender wird der Start laut Kalender
+        geprüft; zu späte Operationen bleiben Kandidaten.
+        """
+        q = self.queues[m]
+        t = self.t
+        K = [o for o in q.waiting_ops if t[o] < dmin]
+        while q.pending_t and q.pending_t[0][0] < dmin:
+            _, _, o = heapq.heappop(q.pending_t)
+            if self.state[o] == _PENDING:
+                K.append(o)
+        cal = q.calendar
+        if cal is not None and not cal.resumable:
+            ready, pt, state = q.ready, self.pt, self.state
+            # Wartende Operationen, die in die aktuelle Lücke passen, starten bei s0
+            s0 = cal.next_free(ready)
+            room = cal.gap_end(s0) - s0 if s0 < dmin else -1
+            fits = []
+            for o in K:
+                if (t[o] <= ready and pt[o] <= room) or cal.start(max(t[o], ready), pt[o]) < dmin:
+                    fits.append(o)
+                elif state[o] == _PENDING:
+                    heapq.heappush(q.pending_t, (t[o], self.seq[o], o))
+            K = fits
+        K.sort(key=self.seq.__getitem__)
+        return K
+
+    def est(self, o):
+        """Frühester Start der einplanbaren Operation o (mit Kalender: laut Kalender)."""
+        q = self.queues[self.machine[o]]
+        t = max(self.t[o], q.ready)
+        return t if q.calendar is None else q.calendar.start(t, self.pt[o])
+
+    def ect(self, o):
+        """Frühestes Ende der einplanbaren Operation o (mit Kalender: laut Kalender)."""
+        q = self.queues[self.machine[o]]
+        t = max(self.t[o], q.ready)
+        if q.calendar is None:
+            return t + self.pt[o]
+        return q.calendar.schedule(t, self.pt[o])[1]
+
+    # ----------------------------------------------------------
+    # Hauptschleife
+    # ----------------------------------------------------------
+    def begin(self):
+        """Gibt die ersten Operationen aller Jobs frei (Start eines Laufs)."""
+        release = self.release_dates or {}
+        for job, o in self.job_first.items():
+            if o < len(self.pt) and self.op_job[o] == job:
+                self._release(o, release.get(job, 0))
+        for m in self.queues:
+            self._refresh(m)
+
+    def next_conflict(self):
+        """
+        Nächster GT-Schritt: Maschine mit dem frühesten möglichen Ende und
+        ihre Konfliktmenge.
+
+        Returns:
+            tuple | None: (m, K) oder None, wenn alles eingeplant ist. K muss
+            mit ``commit`` auf genau diesem Zustand aufgelöst werden.
+        """
+        heap = self._heap
+        while heap:
+            dmin, _, version, m = heapq.heappop(heap)
+            if version == self.queues[m].version:
+                return m, self.conflict_set(m, dmin)
+        return None
+
+    def commit(self, m, K, o_bar):
+        """Plant o_bar aus der Konfliktmenge K der Maschine m ein."""
+        q = self.queues[m]
+        start = max(self.t[o_bar], q.ready)
+        if q.calendar is None:
+            end = start + self.pt[o_bar]
+        else:
+            start, end = q.calendar.schedule(start, self.pt[o_bar])
+        self.start[o_bar] = start
+        self.end[o_bar] = end
+        self.state[o_bar] = _DONE
+        q.waiting_ops.pop(o_bar, None)
+        q.ready = end
+        self.order.append(o_bar)
+
+        # Übrige Operationen der Konfliktmenge warten bis zum Ende
+        for o in K:
+            if o != o_bar:
+                self.t[o] = end
+                if self.state[o] == _PENDING:
+                    self.state[o] = _WAITING
+                    heapq.heappush(q.waiting, (self.pt[o], self.seq[o], o))
+                    q.waiting_ops[o] = None
+
+        # Nachfolger im Job freigeben
+        nxt = o_bar + 1
+        if nxt < len(self.pt) and self.op_job[nxt] == self.op_job[o_bar]:
+            self._release(nxt, end)
+            if self.machine[nxt] != m:
+                self._refresh(self.machine[nxt])
+        self._refresh(m)
+
+    def copy(self):
+        """
+        Unabhängige Kopie des laufenden Zustands (für Verzweigungen, z.B.
+        gfalgo.branch_bound). Unveränderliche Stammdaten werden geteilt.
+        """
+        other = object.__new__(GTEngine)
+        other.__dict__.update(self.__dict__)
+        for name in ("t", "seq", "state", "start", "end", "order", "_heap"):
+            setattr(other, name, list(getattr(self, name)))
+        queues = {}
+        for m, q in self.queues.items():
+            c = _MachineQueue(q.calendar)
+            c.ready = q.ready
+            c.waiting = list(q.waiting)
+            c.waiting_ops = dict(q.waiting_ops)
+            c.pending_t = list(q.pending_t)
+            c.pending_d = list(q.pending_d)
+            c.version = q.version
+            queues[m] = c
+        other.queues = queues
+        return other
+
+    def run(self):
+        """
+        Führt den Giffler-Thompson-Algorithmus vollständig aus.
+
+        Returns:
+            tuple: (start_times, end_times) als Dictionaries {(job, i): zeit}
+            in Einplanungsreihenfolge, wie in gt_koz.py.
+        """
+        self.begin()
+        rule = self.rule
+        tiebreak = self.tiebreak
+        if tiebreak is None:
+            priority = lambda o: rule(self, o)
+        else:
+            priority = lambda o: (rule(self, o), tiebreak[o])
+        if active(self.profiler):
+            self._run_profiled(priority)
+            return self.times()
+        while True:
+            step = self.next_conflict()
+            if step is None:
+                break
+            m, K = step
+            # Konfliktmenge und Prioritätsregel
+            self.commit(m, K, min(K, key=priority))
+
+        return self.times()
+
+    def _run_profiled(self, priority):
+        """Hauptschleife von ``run`` mit Zeitmessung pro Phase (nur mit Profiler)."""
+        profiler = self.profiler
+        clock = time.perf_counter
+        t_conflict = t_rule = t_commit = 0.0
+        iterations = evaluations = 0
+        while True:
+            t0 = clock()
+            step = self.next_conflict()
+            t1 = clock()
+            t_conflict += t1 - t0
+            if step is None:
+                break
+            m, K = step
+            o_bar = min(K, key=priority)
+            t2 = clock()
+            self.commit(m, K, o_bar)
+            t3 = clock()
+            t_rule += t2 - t1
+            t_commit += t3 - t2
+            iterations += 1
+            evaluations += len(K)
+            profiler.count("conflict_size", len(K))
+            profiler.emit("iteration", machine=m, conflict_size=len(K), op=o_bar,
+                          start=self.start[o_bar], end=self.end[o_bar])
+        profiler.add_time("gt.conflict_set", t_conflict, iterations + 1)
+        profiler.add_time("gt.rule", t_rule, iterations)
+        profiler.add_time("gt.commit", t_commit, iterations)
+        profiler.count("iterations", iterations)
+        profiler.count("rule_evaluations", evaluations)
+
+    def times(self):
+        """(start_times, end_times) mit Schlüsseln (job, i) in Einplanungsreihenfolge."""
+        start_times, end_times = {}, {}
+        for o in self.order:
+            key = (self.op_job[o], self.op_index[o])
+            start_times[key] = self.start[o]
+            end_times[key] = self.end[o]
+        return start_times, end_times
+
+    def records(self):
+        """
+        Eingeplante Operationen im Format von previous_schedule.json
+        (op = Position im Job + 1), in Einplanungsreihenfolge.
+        """
+        return [
+            {"job": self.op_job[o], "op": self.op_index[o] + 1, "machine": self.machine[o],
+             "start": self.start[o], "end": self.end[o]}
+            for o in self.order
+        ]
+
+    def makespan(self):
+        return max((self.end[o] for o in self.order), default=0)
+
+    def tardiness(self):
+        """
+        Verspätung pro Job gegenüber den Fälligkeiten (nur eingeplante Jobs).
+
+        Returns:
+            dict: {job_id: max(0, Ende der letzten Operation - Fälligkeit)};
+            leer ohne Fälligkeiten.
+        """
+        if not self.due_dates:
+            return {}
+        completion = {}
+        for o in self.order:
+            job = self.op_job[o]
+            completion[job] = max(completion.get(job, 0), self.end[o])
+        return {job: max(0, c - self.due_dates[job])
+                for job, c in completion.items() if job in self.due_dates}
+
+
+def giffler_thompson(jobs, rule=koz, profiler=None, calendars=None, release_dates=None):
+    """
+    Kurzform für ``GTEngine(jobs, rule).run()``.
+
+    Args:
+        jobs (dict): {job_id: [(maschine, bearbeitungszeit), ...]}.
+        rule (callable): Prioritätsschlüssel, Standard ist die KOZ-Regel.
+        profiler (Profiler | None): Optionale Messung (siehe GTEngine).
+        calendars (dict | None): {maschine: MachineCalendar} (siehe GTEngine).
+        release_dates (dict | None): {job_id: Freigabezeitpunkt}.
+
+    Returns:
+        tuple: (start_times, end_times) mit Schlüsseln (job, i).
+    """
+    return GTEngine(jobs, rule, profiler=profiler, calendars=calendars, release_dates=release_dates).run()
@@ -0,0 +1,191 @@
+# ==============================================================
+# Inkrementelle Umplanung nach Routing-Änderungen
+# ==============================================================
+"""
+Inkrementelle Umplanung für den README-Ablauf (randx.py -> gt_mininv.py).
+
+Statt nach der Änderung eines Jobs alles neu zu rechnen, wird der Anfang
+des alten Plans übernommen, soweit er mit dem vollständigen Neulauf
+(``schedule_deviation``) übereinstimmt, und nur der Rest wird mit der
+DEVIATION-Schleife (gfalgo.mininv) geplant.
+
+Ein Schnitt nach Startzeit reicht dafür nicht: Die DEVIATION-Schleife
+plant nicht in zeitlicher Reihenfolge ein, sondern wählt pro Schritt die
+Maschine mit dem frühesten Ende über die ganze Frontier. Der Neulauf legt
+daher teils Operationen mit späterem Start vor solchen mit früherem fest,
+und ein eingefrorener Zeitabschnitt verändert Frontier und Ready-Times,
+die diese Entscheidungen sehen.
+
+Übernommen wird deshalb die Einplanungsreihenfolge des Neulaufs selbst,
+solange er Operationen des alten Plans unverändert zu ihren alten Starts
+einplant. Meist steht die Entscheidung ohne Auswertung der Regel fest:
+Ist die Frontier-Operation mit dem frühesten Ende eindeutig und beginnt
+sie genau zu ihrem alten Start, hat sie auf ihrer Maschine Abweichung 0
+und das kleinste Ende, und jede andere Maschine liefert ein späteres Ende –
+die DEVIATION-Schleife wählt also genau sie. Die Frontier liegt dafür als
+Heap nach Ende vor, ein solcher Schritt kostet O(log Jobs). Nur wenn das
+nicht greift, wird ein Schritt mit der Regel über alle Kandidaten
+ausgewertet. Bei der ersten Entscheidung, die eine geänderte Operation
+betrifft oder vom alten Start abweicht, plant die DEVIATION-Schleife den
+Rest. Das Ergebnis ist damit immer identisch mit dem Neulauf; der Gewinn
+ist umso größer, je später im Plan die Änderung wirkt.
+"""
+import csv
+import heapq
+import time
+
+import numpy as np
+
+from .mininv import _conflict_sets, _select, run_deviation
+from .profiling import active
+from .schedule_state import ScheduleState
+
+__all__ = ["load_changes", "changed_operations", "reschedule_incremental"]
+
+
+def load_changes(path):
+    """
+    Liest routing_changes.csv (von randx.py geschrieben).
+
+    Args:
+        path (str | Path): Pfad zur Änderungsdatei.
+
+    Returns:
+        list: [(job_id, op_id), ...] der geänderten Operationen
+        (op_id wie in der Spalte Operation der routing.csv).
+    """
+    with open(path, mode="r", newline="") as f:
+        reader = csv.DictReader(f, skipinitialspace=True)
+        return [(int(row["Routing_ID"]), int(row["Operation"])) for row in reader]
+
+
+def changed_operations(routing, previous_schedule, changes=()):
+    """
+    Markiert die Operationen, die nicht aus dem alten Plan übernommen werden.
+
+    Args:
+        routing (Routing): Das neue Routing.
+        previous_schedule (PreviousSchedule): Der alte Plan (op = Position im Job + 1).
+        changes (iterable): [(job_id, op_id), ...] aus load_changes; Abweichungen
+            zwischen Routing und altem Plan (Maschine, Dauer, neue Operation)
+            werden zusätzlich selbst erkannt.
+
+    Returns:
+        np.ndarray: Maske pro globaler Op-Nummer (True = geändert oder neu).
+    """
+    n = routing.n_ops
+    offsets = routing.job_offsets.tolist()
+    job_ids = routing.job_ids.tolist()
+    op_ids = routing.op_ids.tolist()
+    machine = routing.machine_codes.tolist()
+    pt = routing.pt.tolist()
+    code_of = {name: c for c, name in enumerate(routing.machines)}
+
+    changed = np.zeros(n, dtype=bool)
+    op_index = {}
+    for k, job in enumerate(job_ids):
+        for o in range(offsets[k], offsets[k + 1]):
+            op_index[(job, op_ids[o])] = o
+            e = previous_schedule.get(job, o - offsets[k] + 1)
+            if e is None or code_of.get(e["machine"]) != machine[o] or e["end"] - e["start"] != pt[o]:
+                changed[o] = True
+    for key in changes:
+        o = op_index.get(tuple(key))
+        if o is not None:
+            changed[o] = True
+    return changed
+
+
+def _replay_prefix(state, previous_schedule, changed):
+    """
+    Übernimmt den Anfang des alten Plans in der Reihenfolge des Neulaufs.
+
+    Args:
+        state (ScheduleState): Leerer Planzustand des neuen Routings.
+        previous_schedule (PreviousSchedule): Der alte Plan.
+        changed (np.ndarray): Maske aus changed_operations.
+
+    Returns:
+        int: Anzahl übernommener Operationen (Entscheidungsregel siehe oben).
+    """
+    routing = state.routing
+    job_list = routing.job_ids.tolist()
+    job_starts = routing.job_offsets.tolist()
+    pt = state.pt.tolist()
+    changed = changed.tolist()
+    frontier = state.frontier
+
+    # Frontier nach Ende; Enden wachsen nur (Ready-Times steigen), veraltete
+    # oder schon eingeplante Einträge werden erst an der Spitze bereinigt
+    heap = [(state.est(o) + pt[o], k, o) for k, o in frontier.items()]
+    heapq.heapify(heap)
+
+    def refresh():
+        while heap:
+            end, k, o = heap[0]
+            if frontier.get(k) != o:
+                heapq.heappop(heap)
+                continue
+            current = state.est(o) + pt[o]
+            if current == end:
+                return
+            heapq.heapreplace(heap, (current, k, o))
+
+    taken = 0
+    while frontier:
+        refresh()
+        end, k, o = heap[0]
+        start = end - pt[o]
+        decided = previous_schedule.start(job_list[k], o - job_starts[k] + 1) == start
+        if decided:
+            # Frühestes Ende muss eindeutig sein, sonst entscheidet die Regel
+            top = heapq.heappop(heap)
+            refresh()
+            decided = not heap or heap[0][0] > end
+            heapq.heappush(heap, top)
+        if not decided:
+            # Ein Schritt der DEVIATION-Schleife über alle Kandidaten
+            conflict_ops_per_machine = _conflict_sets(state, job_list, job_starts)
+            job_id, idx, o, start, end = _select(conflict_ops_per_machine, previous_schedule)
+            k = int(state.op_job[o])
+            if previous_schedule.start(job_id, idx + 1) != start:
+                break  # Neulauf weicht vom alten Plan ab
+        if changed[o]:
+            break
+        state.schedule(o, start)
+        taken += 1
+        nxt = frontier.get(k)
+        if nxt is not None:
+            heapq.heappush(heap, (state.est(nxt) + pt[nxt], k, nxt))
+    return taken
+
+
+def reschedule_incremental(routing, previous_schedule, changes=(), profiler=None):
+    """
+    Plant nur den Teil neu, der nicht aus dem alten Plan übernommen werden kann.
+
+    Args:
+        routing (Routing): Das neue Routing.
+        previous_schedule (PreviousSchedule): Der alte Plan.
+        changes (iterable): [(job_id, op_id), ...] aus load_changes; Abweichungen
+            zwischen Routing und altem Plan werden zusätzlich selbst erkannt.
+        profiler (Profiler | None): Optionale Messung; die Übernahme läuft als
+            Phase "incremental.replay", der Rest wie in gfalgo.mininv.run_deviation.
+
+    Returns:
+        tuple: (ScheduleState, affected, cut_time) mit dem fertigen Plan
+        (identisch mit ``schedule_deviation``), der Maske der von der
+        DEVIATION-Schleife geplanten Operationen und deren frühestem Start
+        (None = alter Plan vollständig übernommen).
+    """
+    state = ScheduleState(routing)
+    changed = changed_operations(routing, previous_schedule, changes)
+    t0 = time.perf_counter()
+    _replay_prefix(state, previous_schedule, changed)
+    if active(profiler):
+        profiler.add_time("incremental.replay", time.perf_counter() - t0)
+
+    affected = state.start < 0
+    run_deviation(state, previous_schedule, profiler)
+    cut_time = int(state.start[affected].min()) if affected.any() else None
+    return state, affected, cut_time
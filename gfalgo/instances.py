@@ -0,0 +1,178 @@
+# ==============================================================
+# Standard-Benchmarks (OR-Library, Taillard) einlesen
+# ==============================================================
+"""
+Loader für klassische Job-Shop-Benchmarks.
+
+Unterstützte Formate:
+
+- **OR-Library** (jobshop1.txt und Einzeldateien wie ft06.txt): Kopfzeile
+  ``n m``, danach pro Job eine Zeile mit ``m`` Paaren ``maschine dauer``,
+  Maschinen ab 0. Mehrere Instanzen in einer Datei werden über die
+  Zeilen ``instance <name>`` getrennt; Kommentar- und Textzeilen werden
+  übersprungen.
+- **Taillard** (tai15_15.txt usw.): pro Instanz die Kopfzeile
+  ``Nb of jobs, Nb of Machines, Time seed, Machine seed, Upper bound,
+  Lower bound`` mit Werten, dann ``Times`` (n Zeilen mit m Dauern) und
+  ``Machines`` (n Zeilen mit m Maschinen ab 1). Die Kurzform ohne
+  Überschriften (``n m``, n Zeilen Dauern, n Zeilen Maschinen) geht auch.
+
+Jede Instanz wird zu einem ``Routing`` mit Maschinennamen wie in
+routing.csv (M00, M01, ...); ``routing.to_jobs()`` liefert das Format von
+gt_koz.py, ``save_routing`` schreibt sie als routing.csv.
+
+``BEST_KNOWN`` enthält die bewiesenen Optima gängiger Instanzen für die
+Gap-Berechnung; Taillard-Dateien bringen ihre obere Schranke selbst mit.
+"""
+import re
+from pathlib import Path
+
+import numpy as np
+
+from .generator import machine_names
+from .routing import Routing
+
+__all__ = ["read_orlib", "read_taillard", "load_instances", "optimality_gap", "BEST_KNOWN"]
+
+# Bewiesene optimale Makespans (Fisher/Thompson, Lawrence, Adams/Balas/Zawack, Taillard)
+BEST_KNOWN = {
+    "ft06": 55, "ft10": 930, "ft20": 1165,
+    "la01": 666, "la02": 655, "la03": 597, "la04": 590, "la05": 593,
+    "la06": 926, "la07": 890, "la08": 863, "la09": 951, "la10": 958,
+    "la11": 1222, "la12": 1039, "la13": 1150, "la14": 1292, "la15": 1207,
+    "la16": 945, "la17": 784, "la18": 848, "la19": 842, "la20": 902,
+    "abz5": 1234, "abz6": 943,
+    "ta01": 1231, "ta02": 1244, "ta03": 1218, "ta04": 1175, "ta05": 1224,
+    "ta06": 1238, "ta07": 1227, "ta08": 1217, "ta09": 1274, "ta10": 1241,
+}
+
+_INT_LINE = re.compile(r"^\s*-?\d+(\s+-?\d+)*\s*$")
+
+
+def _int_rows(lines):
+    """(Zeilenindex, [ints]) für alle Zeilen, die nur aus ganzen Zahlen bestehen."""
+    return [(i, [int(v) for v in line.split()]) for i, line in enumerate(lines) if _INT_LINE.match(line)]
+
+
+def _build(name, machines, times, best=None, lower_bound=None):
+    """Instanz-Dict aus (n, m)-Arrays für Maschinen (ab 0) und Dauern."""
+    machines = np.asarray(machines, dtype=np.int64)
+    times = np.asarray(times, dtype=np.int64)
+    n, m = times.shape
+    names = np.array(machine_names(int(machines.max()) + 1), dtype=object)
+    routing = Routing.from_columns(np.repeat(np.arange(n), m), np.tile(np.arange(m), n),
+                                   names[machines.ravel()], times.ravel())
+    if best is None:
+        best = BEST_KNOWN.get(name)
+    return {"name": name, "routing": routing, "best": best, "lower_bound": lower_bound}
+
+
+def _parse_orlib_block(name, lines):
+    rows = _int_rows(lines)
+    header = next((r for _, r in rows if len(r) == 2), None)
+    if header is None:
+        raise ValueError(f"{name}: Kopfzeile 'Jobs Maschinen' fehlt")
+    n, m = header
+    data = [r for _, r in rows if len(r) == 2 * m][:n]
+    if len(data) < n:
+        raise ValueError(f"{name}: {n} Jobs erwartet, {len(data)} gefunden")
+    pairs = np.array(data, dtype=np.int64).reshape(n, m, 2)
+    return _build(name, pairs[:, :, 0], pairs[:, :, 1])
+
+
+def read_orlib(path):
+    """
+    Liest eine Datei im OR-Library-Format.
+
+    Args:
+        path (str | Path): Einzelinstanz oder Sammeldatei (jobshop1.txt).
+
+    Returns:
+        list: Instanzen {"name", "routing", "best", "lower_bound"}; bei
+        Einzeldateien heißt die Instanz wie die Datei (ohne Endung).
+
+    Raises:
+        ValueError: Datei passt nicht zum Format.
+    """
+    path = Path(path)
+    lines = path.read_text().splitlines()
+    starts = [(i, line.split(None, 1)[1].strip()) for i, line in enumerate(lines)
+              if line.strip().startswith("instance ") and len(line.split()) == 2]
+    if not starts:
+        return [_parse_orlib_block(path.stem, [ln for ln in lines if not ln.lstrip().startswith("#")])]
+    bounds = [i for i, _ in starts[1:]] + [len(lines)]
+    return [_parse_orlib_block(name, lines[i + 1:end]) for (i, name), end in zip(starts, bounds)]
+
+
+def read_taillard(path):
+    """
+    Liest eine Datei im Taillard-Format (eine oder mehrere Instanzen).
+
+    Args:
+        path (str | Path): Pfad zur Datei.
+
+    Returns:
+        list: Instanzen {"name", "routing", "best", "lower_bound"}. Bei mehreren
+        Instanzen heißen sie ``<datei>_1``, ``<datei>_2``, ...; "best" ist die
+        obere Schranke aus der Datei, sonst der Eintrag in BEST_KNOWN.
+
+    Raises:
+        ValueError: Datei passt nicht zum Format.
+    """
+    path = Path(path)
+    lines = path.read_text().splitlines()
+    rows = _int_rows(lines)
+    found = []
+    k = 0
+    while k < len(rows):
+        header = rows[k][1]
+        if len(header) not in (2, 6):
+            raise ValueError(f"{path}: unerwartete Kopfzeile {header}")
+        n, m = header[:2]
+        ub, lb = (header[4], header[5]) if len(header) == 6 else (None, None)
+        block = [r for _, r in rows[k + 1:k + 1 + 2 * n]]
+        if len(block) < 2 * n or any(len(r) != m for r in block):
+            raise ValueError(f"{path}: {n} Zeilen Dauern und {n} Zeilen Maschinen mit je {m} Werten erwartet")
+        found.append((np.array(block[:n]), np.array(block[n:]) - 1, ub, lb))
+        k += 1 + 2 * n
+
+    instances = []
+    for i, (times, machines, ub, lb) in enumerate(found):
+        name = path.stem if len(found) == 1 else f"{path.stem}_{i + 1}"
+        instances.append(_build(name, machines, times, best=ub, lower_bound=lb))
+    return instances
+
+
+def load_instances(path, fmt=None):
+    """
+    Liest eine Benchmark-Datei und erkennt das Format selbst.
+
+    Args:
+        path (str | Path): Pfad zur Datei.
+        fmt (str | None): "orlib" oder "taillard"; None = automatisch
+            (Taillard, wenn "Times" vorkommt oder die Datenzeilen m statt 2m Werte haben).
+
+    Returns:
+        list: Instanzen wie bei read_orlib / read_taillard.
+    """
+    if fmt is None:
+        text = Path(path).read_text()
+        if re.search(r"^\s*Times\b", text, re.MULTILINE):
+            fmt = "taillard"
+        else:
+            rows = _int_rows(text.splitlines())
+            header = next((r for _, r in rows if len(r) == 2), None)
+            first = next((r for _, r in rows if len(r) != 2), None)
+            fmt = "taillard" if header and first and len(first) == header[1] else "orlib"
+    if fmt == "orlib":
+        return read_orlib(path)
+    if fmt == "taillard":
+        return read_taillard(path)
+    raise ValueError(f"Unbekanntes Format {fmt!r}, erlaubt: orlib, taillard")
+
+
+def optimality_gap(makespan, best):
+    """Abstand zum besten bekannten Makespan in Prozent (None, wenn unbekannt)."""
+    if not best:
+        return None
+    return 100.0 * (makespan - best) / best
@@ -0,0 +1,460 @@
+# ==============================================================
+# Lokale Suche (Tabu Search / Simulated Annealing) nach dem GT-Lauf
+# ==============================================================
+"""
+Verbesserungsstufe für fertige Pläne beliebiger GT-Regeln.
+
+Der Plan wird als Maschinenreihenfolgen gelesen (Einträge im Format von
+previous_schedule.json, z.B. ``GTEngine.records()``). Jede Operation hat
+höchstens zwei Vorgänger (Job, Maschine) und zwei Nachfolger. Daraus:
+
+- Kopf r(o): längster Weg vom Start bis zum Beginn von o (= Startzeit im
+  semi-aktiven Plan),
+- Schwanz q(o): längster Weg vom Ende von o bis zum Ende des Plans,
+- Makespan = max r(o) + p(o) + q(o); kritisch ist o, wenn Gleichheit gilt.
+
+Nachbarschaften auf den Blöcken eines kritischen Pfads (aufeinanderfolgende
+kritische Operationen auf derselben Maschine):
+
+- ``n5`` (Nowicki/Smutnicki): Tausch der ersten bzw. letzten beiden
+  Operationen eines Blocks (nicht am Anfang des ersten und am Ende des
+  letzten Blocks).
+- ``n7`` (Zhang u.a.): Verschieben einer inneren Operation an den Anfang
+  bzw. das Ende des Blocks und der ersten/letzten Operation nach innen.
+  Verschiebungen, die einen Zyklus erzeugen könnten, werden über die
+  Bedingungen von Balas/Vazacopoulos ausgelassen.
+
+Bewertung eines Zugs ohne Neuberechnung: Für die verschobenen Operationen
+werden neue Köpfe und Schwänze aus den unveränderten Werten ihrer Job-
+und Maschinennachbarn geschätzt (Tausch: O(1), Verschiebung: O(Länge des
+verschobenen Abschnitts)). Erst der gewählte Zug wird ausgeführt; danach
+werden Köpfe und Schwänze nur ab den geänderten Operationen weitergereicht,
+bis sich nichts mehr ändert.
+
+Zielfunktion: Makespan + ``stability_weight`` * Startzeitabweichung zum
+Vortagsplan (Summe der absoluten Differenzen wie in gfalgo.stability).
+Damit bleibt die Verbesserung mit dem minimalinvasiven Ansatz von
+gt_mininv.py verträglich; mit Gewicht 0 zählt nur der Makespan.
+"""
+import math
+import random
+import time
+from collections import deque
+
+__all__ = ["improve_schedule", "METHODS", "NEIGHBORHOODS"]
+
+METHODS = ("tabu", "sa")
+NEIGHBORHOODS = ("n5", "n7")
+
+
+class _Graph:
+    """Maschinenreihenfolgen mit Köpfen und Schwänzen (siehe Moduldokumentation)."""
+
+    def __init__(self, jobs, schedule, prev_schedule=None):
+        self.op_job, self.op_index, self.machine, self.pt = [], [], [], []
+        job_first = {}
+        for job, ops in jobs.items():
+            job_first[job] = len(self.pt)
+            for i, (m, p) in enumerate(ops):
+                self.op_job.append(job)
+                self.op_index.append(i)
+                self.machine.append(m)
+                self.pt.append(p)
+        n = len(self.pt)
+        self.n = n
+
+        # Job-Vorgänger und -Nachfolger stehen fest
+        self.jp = [-1] * n
+        self.js = [-1] * n
+        for o in range(1, n):
+            if self.op_job[o] == self.op_job[o - 1]:
+                self.jp[o] = o - 1
+                self.js[o - 1] = o
+
+        # Maschinenreihenfolgen aus dem Plan (nach Start, bei Gleichstand nach Listenreihenfolge)
+        entries = []
+        for k, e in enumerate(schedule):
+            first = job_first.get(e["job"])
+            if first is None or not 1 <= e["op"] <= len(jobs[e["job"]]):
+                raise ValueError(f"Operation ({e['job']}, {e['op']}) fehlt im Routing")
+            entries.append((e["start"], k, first + e["op"] - 1))
+        if len(entries) != n or len({o for _, _, o in entries}) != n:
+            raise ValueError(f"Plan enthält {len(entries)} Einträge, das Routing {n} Operationen")
+        entries.sort()
+        self.seq = {}
+        for _, _, o in entries:
+            self.seq.setdefault(self.machine[o], []).append(o)
+        self.pos = [0] * n
+        self.mp = [-1] * n
+        self.ms = [-1] * n
+        for seq in self.seq.values():
+            self._link(seq, 0, len(seq) - 1)
+
+        # Startzeiten des Vortagsplans für die Stabilitätsstrafe
+        self.prev_start = [None] * n
+        if prev_schedule is not None:
+            for o in range(n):
+                self.prev_start[o] = prev_schedule.start(self.op_job[o], self.op_index[o] + 1)
+
+        self.r = [0] * n
+        self.q = [0] * n
+        self.deviation = 0
+        if not self.recompute():
+            raise ValueError("Maschinenreihenfolgen widersprechen der Jobreihenfolge (Zyklus)")
+
+    # ----------------------------------------------------------
+    # Köpfe und Schwänze
+    # ----------------------------------------------------------
+    def _link(self, seq, lo, hi):
+        """Positionen und Maschinennachbarn für seq[lo..hi] (inkl. Rändern) setzen."""
+        lo, hi = max(lo, 0), min(hi, len(seq) - 1)
+        for k in range(lo, hi + 1):
+            o = seq[k]
+            self.pos[o] = k
+            self.mp[o] = seq[k - 1] if k > 0 else -1
+            self.ms[o] = seq[k + 1] if k + 1 < len(seq) else -1
+
+    def recompute(self):
+        """Alle Köpfe und Schwänze in topologischer Reihenfolge; False bei Zyklus."""
+        n, pt, jp, mp, js, ms = self.n, self.pt, self.jp, self.mp, self.js, self.ms
+        indeg = [(jp[o] >= 0) + (mp[o] >= 0) for o in range(n)]
+        order = [o for o in range(n) if indeg[o] == 0]
+        for o in order:
+            for s in (js[o], ms[o]):
+                if s >= 0:
+                    indeg[s] -= 1
+                    if indeg[s] == 0:
+                        order.append(s)
+        if len(order) < n:
+            return False
+        r, q = self.r, self.q
+        for o in order:
+            h = 0
+            for p in (jp[o], mp[o]):
+                if p >= 0 and r[p] + pt[p] > h:
+                    h = r[p] + pt[p]
+            r[o] = h
+        for o in reversed(order):
+            t = 0
+            for s in (js[o], ms[o]):
+                if s >= 0 and q[s] + pt[s] > t:
+                    t = q[s] + pt[s]
+            q[o] = t
+        prev = self.prev_start
+        self.deviation = sum(abs(r[o] - prev[o]) for o in range(n) if prev[o] is not None)
+        return True
+
+    def _propagate(self, start, forward):
+        """
+        Reicht Köpfe (forward) bzw. Schwänze ab den Operationen in start weiter.
+
+        Returns:
+            bool: False, wenn die Änderung nach 4n Schritten nicht zur Ruhe kommt
+            (vermutlich ein Zyklus; der Aufrufer rechnet dann vollständig neu).
+        """
+        pt = self.pt
+        if forward:
+            val, pred1, pred2, succ1, succ2 = self.r, self.jp, self.mp, self.js, self.ms
+        else:
+            val, pred1, pred2, succ1, succ2 = self.q, self.js, self.ms, self.jp, self.mp
+        prev = self.prev_start
+        queue = deque(start)
+        queued = set(start)
+        limit = 4 * self.n + len(start)
+        steps = 0
+        while queue:
+            steps += 1
+            if steps > limit:
+                return False
+            o = queue.popleft()
+            queued.discard(o)
+            v = 0
+            p = pred1[o]
+            if p >= 0:
+                v = val[p] + pt[p]
+            p = pred2[o]
+            if p >= 0 and val[p] + pt[p] > v:
+                v = val[p] + pt[p]
+            if v == val[o]:
+                continue
+            if forward and prev[o] is not None:
+                self.deviation += abs(v - prev[o]) - abs(val[o] - prev[o])
+            val[o] = v
+            for s in (succ1[o], succ2[o]):
+                if s >= 0 and s not in queued:
+                    queued.add(s)
+                    queue.append(s)
+        return True
+
+    def apply(self, m, lo, new):
+        """
+        Ersetzt seq[m][lo:lo+len(new)] durch new und aktualisiert Köpfe/Schwänze.
+
+        Returns:
+            bool: False, wenn der Zug einen Zyklus erzeugt hätte (er wird zurückgenommen).
+        """
+        seq = self.seq[m]
+        hi = lo + len(new) - 1
+        old = seq[lo:hi + 1]
+        seq[lo:hi + 1] = new
+        self._link(seq, lo - 1, hi + 1)
+        heads = list(new) + ([seq[hi + 1]] if hi + 1 < len(seq) else [])
+        tails = list(reversed(new)) + ([seq[lo - 1]] if lo > 0 else [])
+        if self._propagate(heads, True) and self._propagate(tails, False):
+            return True
+        if self.recompute():  # Weiterreichen zu lang: vollständig neu rechnen
+            return True
+        seq[lo:hi + 1] = old
+        self._link(seq, lo - 1, hi + 1)
+        self.recompute()
+        return False
+
+    # ----------------------------------------------------------
+    # Kritischer Pfad und Nachbarschaft
+    # ----------------------------------------------------------
+    def makespan(self):
+        r, pt = self.r, self.pt
+        return max((r[o] + pt[o] for o in range(self.n)), default=0)
+
+    def critical_blocks(self):
+        """Blöcke eines kritischen Pfads als [(maschine, erste Position, letzte Position), ...]."""
+        r, pt, jp, mp = self.r, self.pt, self.jp, self.mp
+        if not self.n:
+            return []
+        o = max(range(self.n), key=lambda x: r[x] + pt[x])
+        path = [o]
+        while r[o] > 0:
+            p = mp[o]
+            if p < 0 or r[p] + pt[p] != r[o]:
+                p = jp[o]
+            path.append(p)
+            o = p
+        path.reverse()
+
+        blocks = []
+        path_prev = -1
+        for o in path:
+            if blocks and self.mp[o] == path_prev:
+                m, a, _ = blocks[-1]
+                blocks[-1] = (m, a, self.pos[o])
+            else:
+                blocks.append((self.machine[o], self.pos[o], self.pos[o]))
+            path_prev = o
+        return blocks
+
+    def _after_ok(self, u, v):
+        """u direkt hinter v verschieben erzeugt keinen Zyklus (Balas/Vazacopoulos)."""
+        s = self.js[u]
+        return s < 0 or self.pt[v] + self.q[v] >= self.pt[s] + self.q[s]
+
+    def _before_ok(self, v, u):
+        """v direkt vor u verschieben erzeugt keinen Zyklus (Balas/Vazacopoulos)."""
+        p = self.jp[v]
+        return p < 0 or self.r[u] + self.pt[u] >= self.r[p] + self.pt[p]
+
+    def moves(self, neighborhood):
+        """
+        Züge als (maschine, lo, neuer Abschnitt, verschobene Op, übersprungene Ops, nach vorn).
+        """
+        blocks = self.critical_blocks()
+        found = []
+        last = len(blocks) - 1
+        for k, (m, a, b) in enumerate(blocks):
+            if b == a:
+                continue
+            seq = self.seq[m]
+            if neighborhood == "n5":
+                if k > 0:
+                    found.append((m, a, [seq[a + 1], seq[a]], seq[a + 1], [seq[a]], True))
+                if k < last and (b - a > 1 or k == 0):
+                    found.append((m, b - 1, [seq[b], seq[b - 1]], seq[b], [seq[b - 1]], True))
+                continue
+            seen = set()
+            block = seq[a:b + 1]
+            for i in range(1, len(block)):
+                # innere (und letzte) Operation an den Anfang
+                if i == 1 or self._before_ok(block[i], block[0]):
+                    new = [block[i]] + block[:i]
+                    found.append((m, a, new, block[i], block[:i], True))
+                    seen.add((a, tuple(new)))
+            for i in range(len(block) - 1):
+                # Operation ans Ende
+                if i == len(block) - 2 or self._after_ok(block[i], block[-1]):
+                    new = block[i + 1:] + [block[i]]
+                    if (a + i, tuple(new)) not in seen:
+                        found.append((m, a + i, new, block[i], block[i + 1:], False))
+            for i in range(1, len(block) - 1):
+                # erste Operation hinter eine innere, letzte vor eine innere
+                if self._after_ok(block[0], block[i]):
+                    found.append((m, a, block[1:i + 1] + [block[0]], block[0], block[1:i + 1], False))
+                if self._before_ok(block[-1], block[i]):
+                    found.append((m, a + i, [block[-1]] + block[i:-1], block[-1], block[i:-1], True))
+        return found
+
+    def estimate(self, m, lo, new):
+        """
+        Geschätzter Makespan durch den Abschnitt und Änderung der Abweichung nach dem Zug.
+
+        Köpfe und Schwänze der Nachbarn werden als unverändert angenommen.
+        """
+        r, q, pt, jp, js, prev = self.r, self.q, self.pt, self.jp, self.js, self.prev_start
+        seq = self.seq[m]
+        hi = lo + len(new) - 1
+        t = 0
+        if lo > 0:
+            p = seq[lo - 1]
+            t = r[p] + pt[p]
+        heads = []
+        delta = 0
+        for x in new:
+            p = jp[x]
+            h = t if p < 0 else max(t, r[p] + pt[p])
+            heads.append(h)
+            if prev[x] is not None:
+                delta += abs(h - prev[x]) - abs(r[x] - prev[x])
+            t = h + pt[x]
+        t = 0
+        if hi + 1 < len(seq):
+            s = seq[hi + 1]
+            t = q[s] + pt[s]
+        longest = 0
+        for x, h in zip(reversed(new), reversed(heads)):
+            s = js[x]
+            tail = t if s < 0 else max(t, q[s] + pt[s])
+            longest = max(longest, h + pt[x] + tail)
+            t = tail + pt[x]
+        return longest, delta
+
+    def snapshot(self):
+        return {m: list(seq) for m, seq in self.seq.items()}
+
+    def restore(self, seqs):
+        self.seq = {m: list(seq) for m, seq in seqs.items()}
+        for seq in self.seq.values():
+            self._link(seq, 0, len(seq) - 1)
+        self.recompute()
+
+    def records(self):
+        """Plan im Format von previous_schedule.json, nach Start sortiert."""
+        r, pt = self.r, self.pt
+        out = [{"job": self.op_job[o], "op": self.op_index[o] + 1, "machine": self.machine[o],
+                "start": r[o], "end": r[o] + pt[o]} for o in range(self.n)]
+        out.sort(key=lambda e: e["start"])
+        return out
+
+
+def _tabu_pairs(move):
+    """Reihenfolgen (a vor b), die der Zug herstellt."""
+    _, _, _, v, jumped, forward = move
+    return [(v, y) for y in jumped] if forward else [(y, v) for y in jumped]
+
+
+def improve_schedule(jobs, schedule, method="tabu", neighborhood="n7", iterations=1000, time_limit=None,
+                     prev_schedule=None, stability_weight=0.0, tenure=None, max_stall=None,
+                     temperature=None, cooling=0.995, seed=None):
+    """
+    Verbessert einen fertigen Plan per Tabu Search oder Simulated Annealing.
+
+    Args:
+        jobs (dict): {job_id: [(maschine, pt), ...]} wie in gt_koz.py.
+        schedule (list): Plan im Format von previous_schedule.json (op = Position
+            im Job + 1), z.B. ``GTEngine.records()`` oder ``ScheduleState.records()``.
+        method (str): "tabu" oder "sa".
+        neighborhood (str): "n5" oder "n7".
+        iterations (int): Höchstzahl an Zügen.
+        time_limit (float | None): Sekunden; None = nur iterations.
+        prev_schedule (PreviousSchedule | None): Vortagsplan für die Stabilitätsstrafe.
+        stability_weight (float): Gewicht der Startzeitabweichung in der Zielfunktion.
+        tenure (int | None): Tabu-Dauer in Zügen; None = 10 + Operationen / Maschinen.
+        max_stall (int | None): Tabu: Abbruch nach so vielen Zügen ohne neues Bestes.
+        temperature (float | None): SA-Starttemperatur; None = mittlere Bearbeitungszeit.
+        cooling (float): SA-Abkühlfaktor pro Zug.
+        seed (int | None): Seed für Zufallsentscheidungen.
+
+    Returns:
+        dict: {"method", "makespan", "deviation", "objective", "initial_makespan",
+        "initial_objective", "iterations", "seconds", "schedule"}; "schedule" ist
+        der beste gefundene Plan im Format von previous_schedule.json.
+
+    Raises:
+        ValueError: Unbekannte Methode/Nachbarschaft oder Plan passt nicht zum Routing.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unbekannte Methode {method!r}, erlaubt: {', '.join(METHODS)}")
+    if neighborhood not in NEIGHBORHOODS:
+        raise ValueError(f"Unbekannte Nachbarschaft {neighborhood!r}, erlaubt: {', '.join(NEIGHBORHOODS)}")
+
+    t0 = time.perf_counter()
+    deadline = None if time_limit is None else t0 + time_limit
+    rng = random.Random(seed)
+    graph = _Graph(jobs, schedule, prev_schedule)
+    w = stability_weight
+
+    def objective():
+        return graph.makespan() + w * graph.deviation
+
+    initial_makespan = graph.makespan()
+    initial_objective = best = objective()
+    best_seqs = graph.snapshot()
+    if tenure is None:
+        tenure = 10 + graph.n // max(1, len(graph.seq))
+    if temperature is None:
+        temperature = sum(graph.pt) / max(1, graph.n)
+    tabu = {}
+    stall = 0
+
+    it = 0
+    while it < iterations:
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        moves = graph.moves(neighborhood)
+        if not moves:
+            break  # ein einziger Block: Makespan = Maschinenlast, nicht verbesserbar
+        it += 1
+        makespan = graph.makespan()
+
+        if method == "tabu":
+            chosen, chosen_value = None, None
+            for move in moves:
+                longest, delta = graph.estimate(*move[:3])
+                value = longest + w * (graph.deviation + delta)
+                allowed = all(tabu.get(pair, 0) < it for pair in _tabu_pairs(move)) or value < best
+                if allowed and (chosen is None or value < chosen_value):
+                    chosen, chosen_value = move, value
+            if chosen is None:
+                chosen = rng.choice(moves)  # alles tabu: zufälliger Zug
+        else:
+            chosen = rng.choice(moves)
+            longest, delta = graph.estimate(*chosen[:3])
+            diff = longest - makespan + w * delta
+            temperature *= cooling
+            if diff > 0 and rng.random() >= math.exp(-diff / max(temperature, 1e-9)):
+                continue
+
+        if not graph.apply(*chosen[:3]):
+            for pair in _tabu_pairs(chosen):
+                tabu[pair] = it + tenure
+            continue
+        for x, y in _tabu_pairs(chosen):
+            tabu[(y, x)] = it + tenure  # Rücktausch verboten
+
+        current = objective()
+        if current < best:
+            best, best_seqs, stall = current, graph.snapshot(), 0
+        else:
+            stall += 1
+            if method == "tabu" and max_stall is not None and stall >= max_stall:
+                break
+
+    graph.restore(best_seqs)
+    return {
+        "method": method,
+        "makespan": graph.makespan(),
+        "deviation": graph.deviation if prev_schedule is not None else None,
+        "objective": objective(),
+        "initial_makespan": initial_makespan,
+        "initial_objective": initial_objective,
+        "iterations": it,
+        "seconds": time.perf_counter() - t0,
+        "schedule": graph.records(),
+    }
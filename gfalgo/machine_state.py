@@ -0,0 +1,74 @@
+# ==============================================================
+# Maschinenzustand mit O(1) Ready-Time
+# ==============================================================
+"""
+Gemeinsamer Maschinenzustand für gt_mininv.py und gt_v2.
+
+Bisher wurde die Verfügbarkeit einer Maschine für jeden Kandidaten mit
+``max([o["end"] for o in machines[m]], default=0)`` berechnet. Hier wird
+die Ready-Time beim Einplanen fortgeschrieben und ist danach in O(1)
+abrufbar. Die eingeplanten Operationen bleiben pro Maschine erhalten.
+"""
+
+__all__ = ["MachineState"]
+
+
+class MachineState:
+    """
+    Ready-Time und Belegung aller Maschinen.
+
+    Args:
+        machines (iterable): Maschinen-IDs, die von Anfang an bekannt sind.
+    """
+
+    __slots__ = ("ready", "ops")
+
+    def __init__(self, machines=()):
+        self.ready = {}
+        self.ops = {}
+        for m in machines:
+            self.add_machine(m)
+
+    def add_machine(self, m):
+        """Legt Maschine m an, falls sie noch nicht existiert."""
+        if m not in self.ready:
+            self.ready[m] = 0
+            self.ops[m] = []
+
+    def __contains__(self, m):
+        return m in self.ready
+
+    def __iter__(self):
+        return iter(self.ready)
+
+    def __len__(self):
+        return len(self.ready)
+
+    def ready_time(self, m):
+        """
+        Zeitpunkt, ab dem Maschine m wieder frei ist.
+
+        Args:
+            m: Maschinen-ID.
+
+        Returns:
+            int: Größtes Ende aller auf m eingeplanten Operationen (0 wenn leer).
+        """
+        return self.ready[m]
+
+    def book(self, m, op, end):
+        """
+        Trägt eine eingeplante Operation auf Maschine m ein.
+
+        Args:
+            m: Maschinen-ID.
+            op: Beliebiges Objekt für die Belegungsliste (z.B. das Operations-Dict).
+            end (int): Endzeitpunkt der Operation.
+        """
+        self.ops[m].append(op)
+        if end > self.ready[m]:
+            self.ready[m] = end
+
+    def scheduled(self, m):
+        """Liste der auf m eingeplanten Operationen in Einplanungsreihenfolge."""
+        return self.ops[m]
@@ -0,0 +1,158 @@
+# ==============================================================
+# Minimalinvasive Planung (DEVIATION) aus gt_mininv.py
+# ==============================================================
+"""
+Hauptschleife von gt_mininv.py als Bibliotheksfunktion.
+
+Pro Schritt werden die einplanbaren Operationen (Frontier) nach Maschine
+gruppiert. Je Maschine gewinnt die Operation mit der kleinsten
+quadratischen Abweichung vom Start im Vortagsplan (bei Gleichstand
+frühestes Ende, dann Job-ID); unter diesen wird die mit dem frühesten
+Ende eingeplant.
+
+``run_deviation`` setzt auf einem beliebigen ``ScheduleState`` auf. Damit
+kann die Schleife auch nur den Rest eines Plans rechnen, dessen Anfang
+bereits feststeht (siehe gfalgo.incremental).
+
+Mit ``profiler`` (gfalgo.profiling) läuft eine eigene Schleife, die die
+Phasen "deviation.conflict_set" (Schritte 1-2), "deviation.rule"
+(Schritte 3-4) und "deviation.commit" misst sowie Iterationen,
+Konfliktmengen (Kandidaten der gewählten Maschine, wie beim GT-Zähler)
+und Abweichungsberechnungen (ganze Frontier) zählt.
+"""
+import time
+
+from .profiling import active
+from .schedule_state import ScheduleState
+
+__all__ = ["run_deviation", "schedule_deviation"]
+
+
+def _conflict_sets(state, job_list, job_starts):
+    """
+    Gruppiert die Frontier nach Maschine.
+
+    Returns:
+        dict: {maschinencode: [(job_id, idx, o, start, ende), ...]}, idx = Position im Job.
+    """
+    conflict_ops_per_machine = {}
+    for k, o in state.frontier.items():
+        start_time = state.est(o)
+        end_time = start_time + int(state.pt[o])
+        m = int(state.machine[o])
+        if m not in conflict_ops_per_machine:
+            conflict_ops_per_machine[m] = []
+        conflict_ops_per_machine[m].append((job_list[k], o - job_starts[k], o, start_time, end_time))
+    return conflict_ops_per_machine
+
+
+def _select(conflict_ops_per_machine, previous_schedule):
+    """
+    DEVIATION-Entscheidung eines Schritts.
+
+    Returns:
+        tuple: (job_id, idx, o, start, ende) der einzuplanenden Operation.
+    """
+    # Pro Maschine kleinste quadratische Abweichung (dann Ende, Job-ID)
+    selected_ops = []
+    for m, candidates in conflict_ops_per_machine.items():
+        deviations = []
+        for cand in candidates:
+            job_id, idx, o, start_time, end_time = cand
+            prev_start = previous_schedule.start(job_id, idx + 1)
+            if prev_start is not None:
+                deviation = abs(prev_start - start_time) ** 2
+            else:
+                deviation = float('inf')  # neue Operationen nur, wenn es keine andere Wahl gibt
+            deviations.append((deviation, end_time, job_id, idx, cand))
+        best = min(deviations, key=lambda x: (x[0], x[1], x[2]))
+        selected_ops.append(best[4])
+
+    # Unter allen Maschinen: frühestes Ende
+    return min(selected_ops, key=lambda x: x[4])
+
+
+def run_deviation(state, previous_schedule, profiler=None):
+    """
+    Plant alle noch offenen Operationen von state mit der DEVIATION-Regel ein.
+
+    Args:
+        state (ScheduleState): Planzustand; bereits eingeplante Operationen bleiben.
+        previous_schedule (PreviousSchedule): Vortagsplan (op = Position im Job + 1).
+        profiler (Profiler | None): Optionale Messung der Phasen (siehe oben).
+
+    Returns:
+        ScheduleState: Derselbe Zustand, vollständig eingeplant.
+    """
+    if active(profiler):
+        return _run_deviation_profiled(state, previous_schedule, profiler)
+    routing = state.routing
+    job_list = routing.job_ids.tolist()
+    job_starts = routing.job_offsets.tolist()
+
+    while not state.all_scheduled():
+        # 1.-2. Frontier und Konfliktmenge pro Maschine
+        conflict_ops_per_machine = _conflict_sets(state, job_list, job_starts)
+        if not conflict_ops_per_machine:
+            break
+
+        # 3.-4. DEVIATION pro Maschine, dann frühestes Ende
+        job_id, idx, o, start_time, end_time = _select(conflict_ops_per_machine, previous_schedule)
+
+        # 5. Einplanen
+        state.schedule(o, start_time)
+    return state
+
+
+def _run_deviation_profiled(state, previous_schedule, profiler):
+    """Wie run_deviation, mit Zeitmessung pro Phase und Zählern (eigene Schleife)."""
+    routing = state.routing
+    job_list = routing.job_ids.tolist()
+    job_starts = routing.job_offsets.tolist()
+    clock = time.perf_counter
+    t_conflict = t_rule = t_commit = 0.0
+    iterations = evaluations = 0
+
+    while not state.all_scheduled():
+        t0 = clock()
+        conflict_ops_per_machine = _conflict_sets(state, job_list, job_starts)
+        if not conflict_ops_per_machine:
+            break
+        t1 = clock()
+        job_id, idx, o, start_time, end_time = _select(conflict_ops_per_machine, previous_schedule)
+        t2 = clock()
+        state.schedule(o, start_time)
+        t_conflict += t1 - t0
+        t_rule += t2 - t1
+        t_commit += clock() - t2
+
+        # Konfliktmenge = Kandidaten der gewählten Maschine; bewertet wird die ganze Frontier
+        m = int(state.machine[o])
+        conflict_size = len(conflict_ops_per_machine[m])
+        iterations += 1
+        evaluations += sum(len(c) for c in conflict_ops_per_machine.values())
+        profiler.count("conflict_size", conflict_size)
+        profiler.emit("iteration", machine=routing.machines[m],
+                      conflict_size=conflict_size, op=o, start=start_time, end=end_time)
+
+    profiler.add_time("deviation.conflict_set", t_conflict, iterations)
+    profiler.add_time("deviation.rule", t_rule, iterations)
+    profiler.add_time("deviation.commit", t_commit, iterations)
+    profiler.count("iterations", iterations)
+    profiler.count("rule_evaluations", evaluations)
+    return state
+
+
+def schedule_deviation(routing, previous_schedule, profiler=None):
+    """
+    Kompletter Lauf wie gt_mininv.py.
+
+    Args:
+        routing (Routing): Das geladene Routing.
+        previous_schedule (PreviousSchedule): Vortagsplan.
+        profiler (Profiler | None): Optionale Messung (siehe run_deviation).
+
+    Returns:
+        ScheduleState: Der fertige Plan.
+    """
+    return run_deviation(ScheduleState(routing), previous_schedule, profiler)
@@ -0,0 +1,177 @@
+# ==============================================================
+# Monte-Carlo-Batch der rollierenden Planung
+# ==============================================================
+"""
+Monte-Carlo-Auswertung der rollierenden Planung (gt_test_rollierend.py).
+
+Für jede Kombination aus Sigma und Seed wird eine komplette Folge von
+Schichten simuliert (eine Replikation). Die Replikationen laufen parallel
+in einem Prozesspool; jede ist über ihren Seed reproduzierbar
+(DurationSampler mit eigenem Generator). Derselbe Seed erzeugt für alle Sigmas dieselben
+Zufallszahlen (Common Random Numbers), die Sigmas sind also direkt
+vergleichbar.
+
+Aufruf:
+    python -m gfalgo.montecarlo gt_v2/routing.csv --sigmas 0.05 0.1 0.2 --seeds 20
+"""
+import argparse
+import csv
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .changelog import load_latest
+from .rolling import run_simulation
+
+__all__ = ["run_batch", "summarize", "format_table", "write_csv", "METRICS"]
+
+METRICS = ("time_dev", "seq_dev", "makespan")
+
+# Routing pro Worker-Prozess (wird in _init_worker gesetzt)
+_routing = None
+
+
+def _init_worker(routing):
+    global _routing
+    _routing = routing
+
+
+def _run_replication(task):
+    sigma, seed, num_shifts, dist, dist_params = task
+    return [{"sigma": sigma, "seed": seed, **row}
+            for row in run_simulation(_routing, num_shifts, sigma, seed, dist, **dist_params)]
+
+
+def run_batch(routing, sigmas, seeds, num_shifts=22, workers=None, dist="lognormal", **dist_params):
+    """
+    Simuliert alle Kombinationen aus Sigma und Seed.
+
+    Args:
+        routing (Routing): Die Stammdaten der Jobs.
+        sigmas (iterable): Störungsstärken.
+        seeds (iterable): Seeds der Replikationen.
+        num_shifts (int): Schichten pro Replikation.
+        workers (int | None): Anzahl Prozesse; None = os.cpu_count(), 1 = ohne Pool.
+        dist (str): Verteilung der Störfaktoren (siehe gfalgo.sampling).
+        **dist_params: Weitere Parameter des DurationSampler (z.B. low/mode/high).
+
+    Returns:
+        list: Eine Zeile pro (sigma, seed, shift) mit time_dev, seq_dev, makespan,
+        sortiert nach sigma, seed, shift.
+    """
+    tasks = [(sigma, seed, num_shifts, dist, dist_params)
+             for sigma, seed in itertools.product(sigmas, seeds)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(tasks)))
+
+    rows = []
+    if workers == 1:
+        _init_worker(routing)
+        for task in tasks:
+            rows.extend(_run_replication(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(routing,)) as pool:
+            for future in as_completed([pool.submit(_run_replication, t) for t in tasks]):
+                rows.extend(future.result())
+
+    rows.sort(key=lambda r: (r["sigma"], r["seed"], r["shift"]))
+    return rows
+
+
+def summarize(rows, skip_first_shift=True):
+    """
+    Verdichtet die Verteilungen pro Sigma über alle Seeds und Schichten.
+
+    Args:
+        rows (list): Ergebnis von run_batch.
+        skip_first_shift (bool): Schicht 1 weglassen; sie hat keinen
+            Referenzplan und damit immer Abweichung 0.
+
+    Returns:
+        list: Eine Zeile pro Sigma mit n sowie mean/std/p05/p50/p95/max je Kennzahl.
+    """
+    by_sigma = {}
+    for r in rows:
+        if skip_first_shift and r["shift"] == 1:
+            continue
+        by_sigma.setdefault(r["sigma"], []).append(r)
+
+    table = []
+    for sigma in sorted(by_sigma):
+        group = by_sigma[sigma]
+        entry = {"sigma": sigma, "n": len(group)}
+        for metric in METRICS:
+            values = np.array([r[metric] for r in group], dtype=float)
+            p05, p50, p95 = np.percentile(values, [5, 50, 95])
+            entry[f"{metric}_mean"] = float(values.mean())
+            entry[f"{metric}_std"] = float(values.std(ddof=1)) if len(values) > 1 else 0.0
+            entry[f"{metric}_p05"] = float(p05)
+            entry[f"{metric}_p50"] = float(p50)
+            entry[f"{metric}_p95"] = float(p95)
+            entry[f"{metric}_max"] = float(values.max())
+        table.append(entry)
+    return table
+
+
+def format_table(table):
+    """Ergebnistabelle als Text (Mittelwert ± Std und p95 je Kennzahl)."""
+    header = f"{'Sigma':>6} | {'n':>5}"
+    for metric in METRICS:
+        header += f" | {metric + ' mean±std':>22} | {'p95':>9}"
+    lines = [header, "-" * len(header)]
+    for e in table:
+        line = f"{e['sigma']:6.3f} | {e['n']:5d}"
+        for metric in METRICS:
+            mean_std = f"{e[metric + '_mean']:.1f} ± {e[metric + '_std']:.1f}"
+            line += f" | {mean_std:>22} | {e[metric + '_p95']:9.1f}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def write_csv(rows, path):
+    """Schreibt Zeilen (Liste von Dicts mit gleichen Schlüsseln) als CSV."""
+    if not rows:
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Monte-Carlo-Batch der rollierenden Planung")
+    parser.add_argument("routing", help="Pfad zur routing.csv")
+    parser.add_argument("--sigmas", type=float, nargs="+", default=[0.05, 0.1, 0.2, 0.3])
+    parser.add_argument("--seeds", type=int, default=10, help="Anzahl Replikationen pro Sigma (Seeds 0..n-1)")
+    parser.add_argument("--seed-offset", type=int, default=0, help="erster Seed")
+    parser.add_argument("--shifts", type=int, default=22, help="Schichten pro Replikation")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--dist", choices=["lognormal", "triangular"], default="lognormal",
+                        help="Verteilung der Störfaktoren")
+    parser.add_argument("--triangular", type=float, nargs=3, default=[1.0, 1.0, 1.5],
+                        metavar=("LOW", "MODE", "HIGH"), help="Faktoren der Dreiecksverteilung")
+    parser.add_argument("--raw-csv", help="alle Einzelergebnisse als CSV speichern")
+    parser.add_argument("--summary-csv", help="verdichtete Tabelle als CSV speichern")
+    args = parser.parse_args(argv)
+
+    routing, _ = load_latest(args.routing)  # routing.csv plus Änderungsprotokoll
+    seeds = range(args.seed_offset, args.seed_offset + args.seeds)
+    dist_params = {}
+    if args.dist == "triangular":
+        dist_params = dict(zip(("low", "mode", "high"), args.triangular))
+    rows = run_batch(routing, args.sigmas, seeds, args.shifts, args.workers, args.dist, **dist_params)
+    table = summarize(rows)
+    print(format_table(table))
+
+    if args.raw_csv:
+        write_csv(rows, args.raw_csv)
+    if args.summary_csv:
+        write_csv(table, args.summary_csv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# ==============================================================
+# Portfolio: mehrere Regeln und Tie-Break-Seeds parallel
+# ==============================================================
+"""
+Portfolio-Lauf des Giffler-Thompson-Kerns.
+
+Für dasselbe Routing wird jede Kombination aus Prioritätsregel und
+Tie-Break-Seed in einem Prozesspool gerechnet. Zurückgegeben wird der
+beste Plan nach Makespan oder nach Stabilität gegenüber dem Vortagsplan.
+
+Das Routing, der Vortagsplan, Maschinenkalender und Freigabezeitpunkte
+werden jedem Worker nur einmal beim Start übergeben, pro Aufgabe wandern
+nur (Regelname, Seed) über die Prozessgrenze.
+"""
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .gt_core import GTEngine
+from .profiling import Profiler, active
+from .rules import get_rule
+from .stability import calculate_metrics
+
+__all__ = ["DEFAULT_RULES", "OBJECTIVES", "run_portfolio"]
+
+DEFAULT_RULES = ("koz", "lpt", "mwkr", "fifo")
+
+# Sortierschlüssel je Zielgröße (kleiner = besser)
+OBJECTIVES = {
+    "makespan": lambda r: (r["makespan"], r["time_dev"], r["seq_dev"]),
+    "stability": lambda r: (r["time_dev"], r["seq_dev"], r["makespan"]),
+    "tardiness": lambda r: (r["tardiness"], r["makespan"], r["time_dev"]),
+}
+
+# Kontext pro Worker-Prozess (wird in _init_worker gesetzt)
+_jobs = None
+_prev_schedule = None
+_due_dates = None
+_profiler = None
+_calendars = None
+_release_dates = None
+
+
+def _init_worker(jobs, prev_schedule, due_dates, profiler=None, calendars=None, release_dates=None):
+    global _jobs, _prev_schedule, _due_dates, _profiler, _calendars, _release_dates
+    _jobs = jobs
+    _prev_schedule = prev_schedule
+    _due_dates = due_dates
+    _profiler = profiler
+    _calendars = calendars
+    _release_dates = release_dates
+
+
+def _run_task(task):
+    """Ein GT-Lauf für (Regelname, Seed, Profil messen)."""
+    rule_name, seed, profile = task
+    # Im Prozesspool misst jede Aufgabe in einen eigenen Profiler und gibt ihn mit zurück
+    profiler = _profiler if _profiler is not None or not profile else Profiler()
+    engine = GTEngine(_jobs, get_rule(rule_name), prev_schedule=_prev_schedule,
+                      due_dates=_due_dates, seed=seed, profiler=profiler,
+                      calendars=_calendars, release_dates=_release_dates)
+    engine.run()
+    schedule = engine.records()
+    time_dev, seq_dev = calculate_metrics(schedule, _prev_schedule or [])
+    result = {
+        "rule": rule_name,
+        "seed": seed,
+        "makespan": engine.makespan(),
+        "time_dev": time_dev,
+        "seq_dev": seq_dev,
+        "tardiness": sum(engine.tardiness().values()),
+        "schedule": schedule,
+    }
+    if profiler is not None and profiler is not _profiler:
+        result["profile"] = profiler.to_dict()
+    return result
+
+
+def run_portfolio(jobs, rules=DEFAULT_RULES, seeds=(None,), objective="makespan",
+                  prev_schedule=None, due_dates=None, workers=None, profiler=None,
+                  calendars=None, release_dates=None):
+    """
+    Rechnet alle Kombinationen aus Regeln und Seeds und wählt den besten Plan.
+
+    Args:
+        jobs (dict): {job_id: [(maschine, pt), ...]} (z.B. ``Routing.to_jobs()``).
+        rules (iterable): Regelnamen aus gfalgo.rules.RULES.
+        seeds (iterable): Tie-Break-Seeds; None = deterministisch wie gt_koz.py.
+        objective (str): "makespan", "stability" oder "tardiness" (Summe der Verspätungen).
+        prev_schedule (PreviousSchedule | None): Vortagsplan für "deviation"
+            und für die Stabilitätskennzahlen.
+        due_dates (dict | None): {job_id: Fälligkeit} für "edd", "mst" und "tardiness".
+        workers (int | None): Anzahl Prozesse; None = os.cpu_count(),
+            1 = ohne Prozesspool im aktuellen Prozess.
+        profiler (Profiler | None): Sammelt die GT-Phasen und Zähler aller
+            Läufe (siehe gfalgo.profiling); der Callback wird nur ohne
+            Prozesspool aufgerufen.
+        calendars (dict | None): {maschine: MachineCalendar} (gfalgo.calendars).
+        release_dates (dict | None): {job_id: Freigabezeitpunkt}.
+
+    Returns:
+        tuple: (bester Lauf, alle Läufe sortiert nach Zielgröße). Ein Lauf ist
+        ein Dict mit "rule", "seed", "makespan", "time_dev", "seq_dev",
+        "tardiness" und "schedule".
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unbekannte Zielgröße '{objective}', verfügbar: {', '.join(OBJECTIVES)}")
+    for name in rules:
+        get_rule(name)  # unbekannte Regeln vor dem Start melden
+
+    profile = active(profiler)
+    tasks = [(rule, seed, profile) for rule, seed in itertools.product(rules, seeds)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(tasks)))
+
+    if workers == 1:
+        _init_worker(jobs, prev_schedule, due_dates, profiler if profile else None, calendars, release_dates)
+        results = [_run_task(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(jobs, prev_schedule, due_dates, None, calendars, release_dates)) as pool:
+            results = list(pool.map(_run_task, tasks))
+        for r in results:
+            if "profile" in r:
+                profiler.merge(r.pop("profile"))
+
+    results.sort(key=OBJECTIVES[objective])
+    return results[0], results
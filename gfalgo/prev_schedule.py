@@ -0,0 +1,136 @@
+# ==============================================================
+# Indizierter Vortagsplan (Previous Schedule)
+# ==============================================================
+"""
+Vortagsplan als indizierter Speicher.
+
+Der Plan wird einmal geladen und danach über zwei Indizes abgefragt:
+
+- nach (job, op) in O(1), z.B. für die Startzeit in der DEVIATION-Regel,
+- nach Maschine und Zeitfenster über nach Start sortierte Listen und
+  binäre Suche.
+
+Die Einträge haben das Format von previous_schedule.json:
+``{"job": ..., "op": ..., "machine": ..., "start": ..., "end": ...}``.
+"""
+import json
+from bisect import bisect_left
+from pathlib import Path
+
+from .store import ScheduleStore
+
+__all__ = ["PreviousSchedule"]
+
+
+class PreviousSchedule:
+    """
+    Indizierter Vortagsplan.
+
+    Args:
+        entries (iterable): Einträge im Format von previous_schedule.json.
+    """
+
+    def __init__(self, entries=()):
+        self.entries = list(entries)
+        self._by_key = {}
+        by_machine = {}
+        for e in self.entries:
+            self._by_key.setdefault((e["job"], e["op"]), e)
+            by_machine.setdefault(e["machine"], []).append(e)
+
+        # Pro Maschine nach Start sortiert (stabil, bei Gleichstand Dateireihenfolge)
+        self._machine_entries = {}
+        self._machine_starts = {}
+        self._machine_max_pt = {}
+        for m, lst in by_machine.items():
+            lst.sort(key=lambda e: e["start"])
+            self._machine_entries[m] = lst
+            self._machine_starts[m] = [e["start"] for e in lst]
+            self._machine_max_pt[m] = max(e["end"] - e["start"] for e in lst)
+
+        self.makespan = max((e["end"] for e in self.entries), default=0)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Liest einen Plan aus einer JSON-Datei oder der aktuellen Version
+        eines Planspeichers (gfalgo.store). Existiert beides nicht, wird ein
+        leerer Plan zurückgegeben.
+
+        Args:
+            path (str | Path): Pfad zu previous_schedule.json oder zum Speicherverzeichnis.
+
+        Returns:
+            PreviousSchedule: Der indizierte Plan.
+        """
+        path = Path(path)
+        if ScheduleStore.is_store(path):
+            return cls(ScheduleStore(path).records())
+        if not path.is_file():
+            return cls()
+        with open(path, "r") as f:
+            return cls(json.load(f))
+
+    # ----------------------------------------------------------
+    # Abfragen nach (job, op)
+    # ----------------------------------------------------------
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __contains__(self, key):
+        return key in self._by_key
+
+    def get(self, job, op):
+        """Eintrag von (job, op) oder None."""
+        return self._by_key.get((job, op))
+
+    def start(self, job, op):
+        """Startzeit von (job, op) im alten Plan oder None."""
+        e = self._by_key.get((job, op))
+        return None if e is None else e["start"]
+
+    # ----------------------------------------------------------
+    # Abfragen nach Maschine und Zeitfenster
+    # ----------------------------------------------------------
+    @property
+    def machines(self):
+        """Alle Maschinen, die im Plan vorkommen."""
+        return list(self._machine_entries)
+
+    def has_machine(self, m):
+        """True, wenn auf Maschine m etwas eingeplant war."""
+        return m in self._machine_entries
+
+    def machine_sequence(self, m):
+        """
+        Reihenfolge auf Maschine m.
+
+        Returns:
+            list: [(job, op), ...] nach Startzeit sortiert.
+        """
+        return [(e["job"], e["op"]) for e in self._machine_entries.get(m, [])]
+
+    def query(self, m, t_from, t_to):
+        """
+        Alle Operationen auf Maschine m, die das Zeitfenster [t_from, t_to)
+        berühren (end > t_from und start < t_to).
+
+        Args:
+            m: Maschinen-ID.
+            t_from (int): Fensteranfang.
+            t_to (int): Fensterende (exklusiv).
+
+        Returns:
+            list: Einträge nach Startzeit sortiert.
+        """
+        starts = self._machine_starts.get(m)
+        if not starts:
+            return []
+        entries = self._machine_entries[m]
+        # Keine Operation dauert länger als max_pt, früher kann also nichts überlappen
+        lo = bisect_left(starts, t_from - self._machine_max_pt[m])
+        hi = bisect_left(starts, t_to)
+        return [e for e in entries[lo:hi] if e["end"] > t_from]
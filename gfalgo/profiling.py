@@ -0,0 +1,183 @@
+# ==============================================================
+# Profiling: Laufzeiten pro Phase, Zähler und Callback
+# ==============================================================
+"""
+Messpunkte für langsame Läufe.
+
+Ein ``Profiler`` sammelt
+
+- **Phasen**: Aufrufe und Sekunden pro Name, z.B. "csv", "json", "gantt"
+  aus den Skripten oder "gt.conflict_set", "gt.rule", "gt.commit" aus der
+  GT-Schleife (``GTEngine(..., profiler=p)``) bzw. "deviation.*" aus
+  ``gfalgo.mininv.run_deviation``.
+- **Zähler**: Anzahl, Summe und Maximum pro Name, z.B. "iterations",
+  "conflict_size" (Kandidaten auf der Maschine, die im Schritt einplant)
+  und "rule_evaluations" (Auswertungen der Regel).
+
+Phasen werden entweder als Block (``with p.phase("json"): ...``) oder als
+Zwischenzeit (``p.lap("csv")`` = Zeit seit dem letzten ``lap``) gemessen;
+mit ``lap`` lassen sich bestehende Skripte ohne Umbau markieren.
+
+Optional wird pro GT-Iteration ``callback(event, data)`` aufgerufen
+(Fortschrittsanzeige, eigene Statistik). Ohne Profiler (``None``) oder mit
+``Profiler(enabled=False)`` laufen die Schleifen unverändert: Die
+Messungen stecken in eigenen Schleifen (``GTEngine._run_profiled``,
+``gfalgo.mininv._run_deviation_profiled``), die nur bei aktivem Profiler
+benutzt werden.
+
+Export mit ``save`` als JSON (verschachtelt) oder CSV (eine Zeile pro
+Phase bzw. Zähler) für Auswertungen über mehrere Läufe.
+"""
+import csv
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+__all__ = ["Profiler", "active"]
+
+
+def active(profiler):
+    """True, wenn profiler gesetzt und eingeschaltet ist."""
+    return profiler is not None and profiler.enabled
+
+
+class Profiler:
+    """
+    Sammelt Phasenzeiten und Zähler eines Laufs.
+
+    Args:
+        callback (callable | None): ``callback(event, data)`` für Ereignisse
+            der Schleifen, z.B. ("iteration", {"machine", "conflict_size", "op", ...}).
+        enabled (bool): False = alle Methoden tun nichts (für Skripte, die
+            den Profiler per Konfiguration ein- und ausschalten).
+    """
+
+    def __init__(self, callback=None, enabled=True):
+        self.callback = callback
+        self.enabled = enabled
+        self.phases = {}    # name -> [Aufrufe, Sekunden]
+        self.counters = {}  # name -> [Anzahl, Summe, Maximum]
+        self._last = time.perf_counter()
+        self._t0 = self._last
+
+    # ----------------------------------------------------------
+    # Phasen
+    # ----------------------------------------------------------
+    def add_time(self, name, seconds, calls=1):
+        """Rechnet seconds auf die Phase name an."""
+        if not self.enabled:
+            return
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = [calls, seconds]
+        else:
+            entry[0] += calls
+            entry[1] += seconds
+
+    @contextmanager
+    def phase(self, name):
+        """Misst den Block als Phase name."""
+        if not self.enabled:
+            yield
+            return
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self.add_time(name, now - t)
+            self._last = now
+
+    def lap(self, name):
+        """Bucht die Zeit seit dem letzten ``lap`` (bzw. Start) auf die Phase name."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.add_time(name, now - self._last)
+        self._last = now
+
+    # ----------------------------------------------------------
+    # Zähler und Ereignisse
+    # ----------------------------------------------------------
+    def count(self, name, value=1):
+        """Erhöht den Zähler name um value (Anzahl +1, Summe +value, Maximum)."""
+        if not self.enabled:
+            return
+        entry = self.counters.get(name)
+        if entry is None:
+            self.counters[name] = [1, value, value]
+        else:
+            entry[0] += 1
+            entry[1] += value
+            if value > entry[2]:
+                entry[2] = value
+
+    def emit(self, event, **data):
+        """Ruft den Callback auf, falls gesetzt."""
+        if self.enabled and self.callback is not None:
+            self.callback(event, data)
+
+    def merge(self, other):
+        """
+        Übernimmt die Werte eines anderen Profilers oder seines ``to_dict``
+        (z.B. aus einem Worker-Prozess).
+        """
+        if not self.enabled:
+            return
+        data = other.to_dict() if isinstance(other, Profiler) else other
+        for name, p in data["phases"].items():
+            self.add_time(name, p["seconds"], p["calls"])
+        for name, c in data["counters"].items():
+            entry = self.counters.get(name)
+            if entry is None:
+                self.counters[name] = [c["count"], c["sum"], c["max"]]
+            else:
+                entry[0] += c["count"]
+                entry[1] += c["sum"]
+                entry[2] = max(entry[2], c["max"])
+
+    # ----------------------------------------------------------
+    # Export
+    # ----------------------------------------------------------
+    def to_dict(self):
+        """{"total_seconds", "phases": {name: {"calls", "seconds"}}, "counters": {name: {"count", "sum", "max"}}}."""
+        return {
+            "total_seconds": time.perf_counter() - self._t0,
+            "phases": {name: {"calls": c, "seconds": s} for name, (c, s) in self.phases.items()},
+            "counters": {name: {"count": n, "sum": s, "max": m} for name, (n, s, m) in self.counters.items()},
+        }
+
+    def rows(self):
+        """Eine Zeile pro Phase bzw. Zähler: {"kind", "name", "count", "value", "max"}."""
+        rows = [{"kind": "phase", "name": name, "count": c, "value": round(s, 6), "max": ""}
+                for name, (c, s) in self.phases.items()]
+        rows += [{"kind": "counter", "name": name, "count": n, "value": s, "max": m}
+                 for name, (n, s, m) in self.counters.items()]
+        return rows
+
+    def save(self, path):
+        """
+        Speichert das Profil; das Format folgt der Endung (.csv, sonst JSON).
+
+        Returns:
+            Path: Der geschriebene Pfad.
+        """
+        path = Path(path)
+        if path.suffix.lower() == ".csv":
+            with open(path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=["kind", "name", "count", "value", "max"])
+                writer.writeheader()
+                writer.writerows(self.rows())
+        else:
+            with open(path, "w") as f:
+                json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def summary(self):
+        """Kurze Textübersicht, Phasen nach Zeit absteigend."""
+        lines = [f"{name:24} {s:9.3f} s  ({c} Aufrufe)"
+                 for name, (c, s) in sorted(self.phases.items(), key=lambda x: -x[1][1])]
+        lines += [f"{name:24} {total:>11}  (max {m}, n={n})"
+                  for name, (n, total, m) in self.counters.items()]
+        return "\n".join(lines)
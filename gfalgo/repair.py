@@ -0,0 +1,210 @@
+# ==============================================================
+# Right-Shift-Reparatur für die rollierende Planung
+# ==============================================================
+"""
+Reparatur eines Plans nach beobachteten Verzögerungen (Right Shift).
+
+Statt nach jeder Störung das ganze Routing mit GT neu zu planen, bleiben
+die Maschinenreihenfolgen des alten Plans erhalten. Jede verzögerte
+Operation endet später; ihre Job- und Maschinennachfolger werden nur so
+weit nach rechts geschoben, wie es nötig ist:
+
+    Start(o) = max(alter Start(o), Ende Job-Vorgänger, Ende Maschinen-Vorgänger)
+
+Operationen starten nie früher als im alten Plan (Stabilität). Die
+Verschiebung wird über einen Heap nach altem Start (topologische
+Reihenfolge des alten Plans) weitergereicht und bricht ab, sobald eine
+Operation nicht mehr verschoben wird. Der Aufwand hängt also nur von der
+Anzahl der betroffenen Operationen ab (O(k log k)), nicht von der Größe
+des Plans.
+
+Da nichts früher startet, dürfen Reparaturen nicht aufeinander aufbauen:
+Verzögerungen einer Schicht blieben sonst im Plan und summierten sich
+über die Schichten. Die rollierende Planung (gfalgo.rolling.iter_shifts)
+hält deshalb den letzten GT-Plan als Basis und repariert pro Schicht eine
+Kopie davon (``copy``). Für große Störungen ist ein Rechtsschieben nicht
+mehr sinnvoll; sie plant mit GT neu, sobald eine Operation um mehr als
+``repair_threshold`` Minuten länger dauert als in dieser Basis.
+"""
+import heapq
+
+import numpy as np
+
+__all__ = ["RightShiftRepair"]
+
+
+class RightShiftRepair:
+    """
+    Plan als Arrays (Start, Ende, Maschinennachbarn) für schnelle Reparaturen.
+
+    Reparaturen ändern den Plan in place. Für mehrere unabhängige
+    Reparaturen desselben Plans (z.B. eine pro Schicht) jeweils mit
+    ``copy()`` beginnen.
+
+    Args:
+        routing (Routing): Die Stammdaten der Jobs.
+        schedule (list): Plan im Format von previous_schedule.json mit allen
+            Operationen des Routings, z.B. von ``run_single_shift``.
+        pt (array-like | None): Dauern, mit denen der Plan gerechnet wurde;
+            Standard: Ende - Start aus dem Plan.
+        use_op_ids (bool): "op" ist die CSV-Spalte Operation (gt_v2) statt
+            der Position im Job + 1 (gt_mininv.py).
+
+    Raises:
+        ValueError: Plan und Routing passen nicht zusammen.
+    """
+
+    def __init__(self, routing, schedule, pt=None, use_op_ids=True):
+        self.routing = routing
+        self.use_op_ids = use_op_ids
+        n = routing.n_ops
+        self.op_job = routing.op_job_index()
+        offsets = routing.job_offsets
+        ops = routing.op_ids if use_op_ids else np.arange(n) - offsets[self.op_job] + 1
+        self._index = dict(zip(zip(routing.job_ids[self.op_job].tolist(), ops.tolist()), range(n)))
+
+        start = np.full(n, -1, dtype=np.int64)
+        end = np.zeros(n, dtype=np.int64)
+        for e in schedule:
+            o = self._index.get((e["job"], e["op"]))
+            if o is None:
+                raise ValueError(f"Operation ({e['job']}, {e['op']}) fehlt im Routing")
+            start[o], end[o] = e["start"], e["end"]
+        if (start < 0).any():
+            raise ValueError(f"Plan enthält nur {int((start >= 0).sum())} von {n} Operationen")
+
+        # Maschinenreihenfolge: nach (Maschine, Start, Ende, Operation)
+        machine = routing.machine_codes
+        order = np.lexsort((np.arange(n), end, start, machine))
+        same = machine[order[1:]] == machine[order[:-1]]
+        mnext = np.full(n, -1, dtype=np.int64)
+        mprev = np.full(n, -1, dtype=np.int64)
+        mnext[order[:-1][same]] = order[1:][same]
+        mprev[order[1:][same]] = order[:-1][same]
+
+        # Job-Nachbarn: Nachbar im CSR-Array, wenn er zum selben Job gehört
+        jnext = np.arange(1, n + 1, dtype=np.int64)
+        jnext[offsets[1:] - 1] = -1
+        jprev = np.arange(-1, n - 1, dtype=np.int64)
+        jprev[offsets[:-1]] = -1
+
+        # Skalare Zugriffe in der Schleife sind auf Listen schneller als auf Arrays
+        self.start = start.tolist()
+        self.end = end.tolist()
+        self.pt = (end - start).tolist() if pt is None else np.asarray(pt, dtype=np.int64).tolist()
+        self.mnext, self.mprev = mnext.tolist(), mprev.tolist()
+        self.jnext, self.jprev = jnext.tolist(), jprev.tolist()
+
+    def copy(self):
+        """Unabhängige Kopie von Start, Ende und Dauern (Nachbarn werden geteilt)."""
+        other = object.__new__(RightShiftRepair)
+        other.__dict__.update(self.__dict__)
+        other.start = self.start.copy()
+        other.end = self.end.copy()
+        other.pt = self.pt.copy()
+        return other
+
+    def delays(self, pt):
+        """
+        Verzögerung pro Operation gegenüber den Dauern dieses Plans als Array.
+
+        Auf einem noch nicht reparierten Plan (z.B. dem letzten GT-Plan) ist
+        das die Verzögerung gegenüber den Dauern, mit denen er gerechnet
+        wurde; nach ``apply`` gegenüber den zuletzt übernommenen Dauern.
+        """
+        return np.asarray(pt, dtype=np.int64) - np.asarray(self.pt, dtype=np.int64)
+
+    def apply(self, pt):
+        """
+        Übernimmt neue Dauern für alle Operationen und repariert den Plan.
+
+        Args:
+            pt (array-like): Dauern pro globaler Op-Nummer (z.B. eine Schicht
+                aus ``DurationSampler.sample``).
+
+        Returns:
+            dict: {"changed", "shifted", "max_shift"} wie bei ``repair``.
+        """
+        pt = np.asarray(pt, dtype=np.int64)
+        changed = np.flatnonzero(pt != np.asarray(self.pt, dtype=np.int64))
+        return self.repair(dict(zip(changed.tolist(), pt[changed].tolist())))
+
+    def apply_delays(self, delays):
+        """
+        Übernimmt gemeldete Verzögerungen, z.B. Rückmeldungen aus der Fertigung.
+
+        Args:
+            delays (dict): {(job, op): zusätzliche Minuten}.
+
+        Returns:
+            dict: {"changed", "shifted", "max_shift"} wie bei ``repair``.
+        """
+        changes = {}
+        for key, delay in delays.items():
+            o = self._index.get(key)
+            if o is None:
+                raise ValueError(f"Operation {key} fehlt im Plan")
+            changes[o] = self.pt[o] + int(delay)
+        return self.repair(changes)
+
+    def repair(self, changes):
+        """
+        Setzt neue Dauern und schiebt alle betroffenen Operationen nach rechts.
+
+        Args:
+            changes (dict): {globale Op-Nummer: neue Dauer}.
+
+        Returns:
+            dict: {"changed": Anzahl geänderter Dauern, "shifted": Anzahl
+            verschobener Operationen, "max_shift": größte Verschiebung eines Starts}.
+        """
+        start, end, pt = self.start, self.end, self.pt
+        jprev, mprev, jnext, mnext = self.jprev, self.mprev, self.jnext, self.mnext
+        for o, p in changes.items():
+            pt[o] = p
+
+        # Heap nach altem (Start, Ende, Op) = topologische Reihenfolge des alten Plans
+        heap = [(start[o], end[o], o) for o in changes]
+        heapq.heapify(heap)
+        queued = set(changes)
+        shifted, max_shift = 0, 0
+        while heap:
+            _, _, o = heapq.heappop(heap)
+            s = start[o]
+            p = jprev[o]
+            if p >= 0 and end[p] > s:
+                s = end[p]
+            p = mprev[o]
+            if p >= 0 and end[p] > s:
+                s = end[p]
+            e = s + pt[o]
+            if e == end[o] and s == start[o]:
+                continue
+            if s > start[o]:
+                shifted += 1
+                max_shift = max(max_shift, s - start[o])
+            start[o], end[o] = s, e
+            for x in (jnext[o], mnext[o]):
+                if x >= 0 and x not in queued:
+                    queued.add(x)
+                    heapq.heappush(heap, (start[x], end[x], x))
+        return {"changed": len(changes), "shifted": shifted, "max_shift": max_shift}
+
+    def makespan(self):
+        return max(self.end, default=0)
+
+    def records(self):
+        """Plan im Format von previous_schedule.json (Reihenfolge des Routings)."""
+        routing = self.routing
+        n = routing.n_ops
+        job_ids = routing.job_ids[self.op_job].tolist()
+        if self.use_op_ids:
+            ops = routing.op_ids.tolist()
+        else:
+            ops = (np.arange(n) - routing.job_offsets[self.op_job] + 1).tolist()
+        names = routing.machines
+        machines = [names[c] for c in routing.machine_codes.tolist()]
+        return [
+            {"job": j, "op": op, "machine": m, "start": s, "end": e}
+            for j, op, m, s, e in zip(job_ids, ops, machines, self.start, self.end)
+        ]
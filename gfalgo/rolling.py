@@ -0,0 +1,229 @@
+# ==============================================================
+# Rollierende Planung: eine Schicht bzw. eine Folge von Schichten
+# ==============================================================
+"""
+Rollierende Planung unter stochastischen Bearbeitungszeiten (Delay-Only).
+
+Enthält die Schicht-Planung aus gt_v2/gt_test_rollierend.py als
+Bibliotheksfunktionen, damit Einzelläufe und der Monte-Carlo-Batch
+(gfalgo.montecarlo) denselben Code verwenden. Die Störungen aller
+Schichten werden vorab als ein Block gezogen (gfalgo.sampling); mit einem
+Seed ist jeder Lauf reproduzierbar.
+
+Mit ``repair_threshold`` wird eine Schicht nicht neu geplant, sondern der
+letzte GT-Plan mit den Dauern der Schicht per Right Shift repariert
+(gfalgo.repair). GT läuft nur noch, wenn eine Operation um mehr als
+``repair_threshold`` Minuten länger dauert als in diesem Plan.
+"""
+import numpy as np
+
+from .prev_schedule import PreviousSchedule
+from .repair import RightShiftRepair
+from .sampling import DurationSampler
+from .schedule_state import ScheduleState
+from .stability import calculate_metrics
+
+__all__ = ["run_single_shift", "iter_shifts", "run_simulation", "plot_history"]
+
+
+def run_single_shift(routing, prev_schedule, pt):
+    """
+    Führt die komplette Planung für EINE Schicht durch.
+    
+    Ablauf:
+    1. Übernimmt die simulierten Bearbeitungszeiten der Schicht (DurationSampler).
+    2. Führt den Giffler-Thompson-Algorithmus aus.
+    3. Wählt Prioritätsregeln:
+       - Lauf 1: KOZ (Kürzeste Operationszeit) für Initialisierung.
+       - Lauf >1: Minimalinvasive Regel (Deviation Insert), um alten Plan zu halten.
+       
+    Args:
+        routing (Routing): Die Stammdaten der Jobs (aus CSV).
+        prev_schedule (PreviousSchedule): Der Plan der vorherigen Schicht (für Referenzzeiten).
+        pt (array-like): Simulierte Bearbeitungszeiten der Schicht (pro globaler Op-Nummer).
+        
+    Returns:
+        list: Der neu berechnete Schedule (Liste von Operationen).
+    """
+    
+    # --- 1. Datenvorbereitung & Störungssimulation ---
+    # Hier wird die Unsicherheit angewendet! Der Planzustand liegt in Arrays (pro globaler Op-Nummer).
+    state = ScheduleState(routing, pt=pt)
+    job_list = routing.job_ids.tolist()
+    op_ids = routing.op_ids.tolist()
+
+    # --- 2. Giffler-Thompson Algorithmus ---
+    while not state.all_scheduled():
+        # A) Menge der startbaren Operationen finden: (job_id, o, est, eft)
+        startable = []
+        
+        # (nur die Frontier: erste offene Operation pro Job, deren Vorgänger fertig ist)
+        for k, o in state.frontier.items():
+            # Technologische und Maschinen-Restriktion (Vorgänger fertig? Maschine frei?)
+            actual_est = state.est(o)
+            startable.append((job_list[k], o, actual_est, actual_est + int(state.pt[o])))
+        
+        if not startable: break
+        
+        # B) Konfliktmenge bestimmen
+        min_eft = min(startable, key=lambda x: x[3]) #earliest finish time
+        m_curr = state.machine[min_eft[1]]
+        c_min = min_eft[3]
+        conflict = [c for c in startable if state.machine[c[1]] == m_curr and c[2] < c_min]
+        
+        # C) Entscheidung treffen (Prioritätsregel)
+        
+        # Aufteilung in "Alte Bekannte" und "Neue Jobs" (falls Insert nötig wäre)
+        k_old = []
+        k_new = []
+        for c in conflict:
+            ps = prev_schedule.start(c[0], op_ids[c[1]]) # "Soll-Startzeit" über den Index
+            if ps is not None:
+                k_old.append((ps, c))
+            else:
+                k_new.append(c)
+        
+        selected = None
+        
+        # Fallunterscheidung: Erster Lauf vs. Folgelauf
+        if not prev_schedule:
+            # Runde 1: KOZ (Kürzeste Operationszeit) -> Effizienz
+            selected = min(conflict, key=lambda x: (state.pt[x[1]], x[0]))
+        else:
+            # Runde X: Minimalinvasiv -> Stabilität
+            best_old = min(k_old, key=lambda x: (x[0], x[1][0])) if k_old else None
+            best_new = min(k_new, key=lambda x: (state.pt[x[1]], x[0])) if k_new else None
+            
+            if best_old and best_new:
+                # Prüfen, ob der neue Job "dazwischenpasst"
+                if (best_old[0] - best_new[3]) >= 0: selected = best_new
+                else: selected = best_old[1]
+            elif best_old: selected = best_old[1]
+            elif best_new: selected = best_new
+            else: selected = conflict[0]
+            
+        # D) Ausgewählte Operation fest einplanen
+        state.schedule(selected[1], selected[2])
+        
+    return state.records(use_op_ids=True)
+
+
+def iter_shifts(routing, num_shifts, sampler, repair_threshold=None):
+    """
+    Simuliert num_shifts Schichten nacheinander; der Plan einer Schicht ist
+    der Referenzplan der nächsten.
+
+    Mit repair_threshold ist der letzte GT-Plan (mit den Dauern, für die er
+    gerechnet wurde) die Basis jeder Reparatur: Jede Schicht repariert eine
+    Kopie davon mit ihren eigenen Dauern. Die Dauern werden pro Schicht
+    unabhängig gezogen, Verzögerungen früherer Schichten bleiben also nicht
+    im Plan stehen.
+
+    Args:
+        routing (Routing): Die Stammdaten der Jobs.
+        num_shifts (int): Anzahl der Simulations-Runden.
+        sampler (DurationSampler): Zieht die Störungen aller Schichten als einen Block.
+        repair_threshold (int | None): Größte Verzögerung einer Operation (Minuten
+            gegenüber den Dauern des letzten GT-Plans), bis zu der per Right
+            Shift repariert wird; None = jede Schicht mit GT neu planen.
+
+    Yields:
+        dict: {"shift", "time_dev", "seq_dev", "makespan", "schedule"} pro Schicht,
+        mit repair_threshold zusätzlich "mode" ("gt" oder "repair").
+    """
+    sim_pts = sampler.sample(routing.pt, num_shifts)  # Form (num_shifts, n_ops)
+    prev_schedule = PreviousSchedule()
+    base = None  # letzter GT-Plan als Ausgangspunkt jeder Reparatur
+    for shift in range(1, num_shifts + 1):
+        pt = sim_pts[shift - 1]
+        mode = "gt"
+        if base is not None and int(np.max(base.delays(pt), initial=0)) <= repair_threshold:
+            repair = base.copy()
+            repair.apply(pt)
+            new_schedule = repair.records()
+            mode = "repair"
+        else:
+            new_schedule = run_single_shift(routing, prev_schedule, pt)
+            if repair_threshold is not None:
+                base = RightShiftRepair(routing, new_schedule, pt=pt)
+        t_dev, s_dev = calculate_metrics(new_schedule, prev_schedule)
+        row = {
+            "shift": shift,
+            "time_dev": t_dev,
+            "seq_dev": s_dev,
+            "makespan": max((s["end"] for s in new_schedule), default=0),
+            "schedule": new_schedule,
+        }
+        if repair_threshold is not None:
+            row["mode"] = mode
+        yield row
+        # Der aktuelle Plan wird zum "Alten Plan" für die nächste Runde
+        prev_schedule = PreviousSchedule(new_schedule)
+
+
+def run_simulation(routing, num_shifts, sigma, seed=None, dist="lognormal", repair_threshold=None, **dist_params):
+    """
+    Eine reproduzierbare Replikation der rollierenden Planung.
+
+    Args:
+        routing (Routing): Die Stammdaten der Jobs.
+        num_shifts (int): Anzahl der Simulations-Runden.
+        sigma (float): Stärke der Störungen.
+        seed (int | None): Seed der Replikation.
+        dist (str): Verteilung der Störfaktoren (siehe gfalgo.sampling).
+        repair_threshold (int | None): Right-Shift-Reparatur bis zu dieser
+            Verzögerung (siehe iter_shifts); None = immer GT.
+        **dist_params: Weitere Parameter des DurationSampler.
+
+    Returns:
+        list: [{"shift", "time_dev", "seq_dev", "makespan"}, ...] ohne Pläne
+        (mit repair_threshold zusätzlich "mode").
+    """
+    sampler = DurationSampler(sigma, seed=seed, dist=dist, **dist_params)
+    rows = []
+    for row in iter_shifts(routing, num_shifts, sampler, repair_threshold):
+        del row["schedule"]
+        rows.append(row)
+    return rows
+
+
+def plot_history(rows, sigma, path=None, dpi=300):
+    """
+    Verlauf der Abweichungen über die Schichten (Grafik aus gt_test_rollierend.py).
+
+    matplotlib wird erst hier importiert; ohne ``path`` bleibt die Figure offen.
+
+    Args:
+        rows (list): Ergebnis von run_simulation bzw. iter_shifts.
+        sigma (float): Störungsstärke für den Titel.
+        path (str | Path | None): Zieldatei; die Figure wird danach geschlossen.
+        dpi (int): Auflösung beim Speichern.
+
+    Returns:
+        Figure: Die erzeugte Figure.
+    """
+    import matplotlib.pyplot as plt
+
+    shifts = [r["shift"] for r in rows]
+    fig, ax1 = plt.subplots(figsize=(10, 6))
+
+    color = 'tab:blue'
+    ax1.set_xlabel('Schicht')
+    ax1.set_ylabel('Startzeitabweichung (Min)', color=color)
+    ax1.plot(shifts, [r["time_dev"] for r in rows], color=color, marker='o', label='Startzeit-Abw.')
+    ax1.tick_params(axis='y', labelcolor=color)
+    ax1.grid(True, linestyle='--', alpha=0.5)
+
+    ax2 = ax1.twinx()
+    color = 'tab:red'
+    ax2.set_ylabel('Sequenzabweichung (Anzahl Swaps)', color=color)
+    ax2.plot(shifts, [r["seq_dev"] for r in rows], color=color, marker='x', linestyle='--',
+             label='Sequenz-Abw.')
+    ax2.tick_params(axis='y', labelcolor=color)
+
+    ax1.set_title(f"Rollierende Planung (Sigma={sigma}, Only Delays)")
+    fig.tight_layout()
+    if path is not None:
+        fig.savefig(path, dpi=dpi)
+        plt.close(fig)
+    return fig
@@ -0,0 +1,270 @@
+# ==============================================================
+# Routing laden: routing.csv -> zusammenhängende NumPy-Arrays
+# ==============================================================
+"""
+Gemeinsamer Loader für routing.csv.
+
+Die Datei wird in einem Schritt in Spalten-Arrays gelesen und danach im
+CSR-Format abgelegt: Die Operationen aller Jobs liegen hintereinander,
+``job_offsets[k]:job_offsets[k + 1]`` ist der Bereich von Job ``job_ids[k]``.
+Maschinen (``"M01"`` oder ganzzahlige IDs) werden auf dichte Codes
+0 .. n_machines - 1 abgebildet; ``machines[code]`` liefert den Originalnamen.
+
+Reihenfolge wie bisher beim Einlesen mit ``df.iterrows()``: Jobs in der
+Reihenfolge ihres ersten Auftretens, Operationen in Dateireihenfolge.
+"""
+from pathlib import Path
+
+import numpy as np
+
+__all__ = ["Routing", "load_routing", "save_routing", "iter_routing_chunks", "intern_machines"]
+
+# Spaltennamen in routing.csv
+COL_JOB = "Routing_ID"
+COL_OP = "Operation"
+COL_MACHINE = "Machine"
+COL_PT = "Processing Time"
+COL_DUE = "Due Date"
+COL_RELEASE = "Release Date"
+
+
+def intern_machines(values):
+    """
+    Bildet Maschinennamen auf dichte Codes ab (sortiert nach Name).
+
+    Args:
+        values (array-like): Maschinennamen oder -IDs pro Operation.
+
+    Returns:
+        tuple: (codes als int32-Array, Liste der Namen als Python-Objekte)
+    """
+    names, codes = np.unique(np.asarray(values), return_inverse=True)
+    return codes.astype(np.int32).reshape(-1), names.tolist()
+
+
+class Routing:
+    """
+    Routing im CSR-Format.
+
+    Attributes:
+        job_ids (np.ndarray): Job-IDs in Reihenfolge des ersten Auftretens.
+        job_offsets (np.ndarray): Länge n_jobs + 1, Start jeder Operationsliste.
+        op_ids (np.ndarray): Operationsnummer aus der CSV pro Operation.
+        machine_codes (np.ndarray): Dichter Maschinencode pro Operation.
+        pt (np.ndarray): Bearbeitungszeit pro Operation.
+        machines (list): Originalname pro Maschinencode (sortiert).
+        due_dates (np.ndarray | None): Fälligkeit pro Job, falls vorhanden.
+        release_dates (np.ndarray | None): Freigabezeitpunkt pro Job, falls vorhanden.
+    """
+
+    def __init__(self, job_ids, job_offsets, op_ids, machine_codes, pt, machines, due_dates=None,
+                 release_dates=None):
+        self.job_ids = job_ids
+        self.job_offsets = job_offsets
+        self.op_ids = op_ids
+        self.machine_codes = machine_codes
+        self.pt = pt
+        self.machines = machines
+        self.due_dates = due_dates
+        self.release_dates = release_dates
+
+    @classmethod
+    def from_columns(cls, job, op, machine, pt, due=None, sort_ops=False, release=None):
+        """
+        Baut das CSR-Routing aus Spalten (eine Zeile pro Operation).
+
+        Args:
+            job, op, machine, pt (array-like): Spalten der Routing-Tabelle.
+            due (array-like | None): Optionale Fälligkeit pro Zeile.
+            sort_ops (bool): Operationen eines Jobs nach Operationsnummer
+                sortieren statt in Dateireihenfolge zu lassen.
+            release (array-like | None): Optionaler Freigabezeitpunkt pro Zeile.
+
+        Returns:
+            Routing
+        """
+        job = np.asarray(job, dtype=np.int64)
+        op = np.asarray(op, dtype=np.int64)
+        pt = np.asarray(pt, dtype=np.int64)
+        codes, names = intern_machines(machine)
+
+        # Jobs nach erstem Auftreten ordnen, innerhalb eines Jobs Dateireihenfolge
+        uniq, first, inverse = np.unique(job, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        job_order = np.argsort(first, kind="stable")
+        rank = np.empty_like(job_order)
+        rank[job_order] = np.arange(len(job_order))
+        if sort_ops:
+            perm = np.lexsort((op, rank[inverse]))
+        else:
+            perm = np.argsort(rank[inverse], kind="stable")
+
+        counts = np.bincount(rank[inverse], minlength=len(uniq))
+        offsets = np.zeros(len(uniq) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        due_dates = None
+        if due is not None:
+            due_dates = np.asarray(due, dtype=np.int64)[first[job_order]]
+        release_dates = None
+        if release is not None:
+            release_dates = np.asarray(release, dtype=np.int64)[first[job_order]]
+
+        return cls(
+            job_ids=uniq[job_order],
+            job_offsets=offsets,
+            op_ids=np.ascontiguousarray(op[perm]),
+            machine_codes=np.ascontiguousarray(codes[perm]),
+            pt=np.ascontiguousarray(pt[perm]),
+            machines=names,
+            due_dates=due_dates,
+            release_dates=release_dates,
+        )
+
+    # ----------------------------------------------------------
+    # Kennzahlen
+    # ----------------------------------------------------------
+    @property
+    def n_jobs(self):
+        return len(self.job_ids)
+
+    @property
+    def n_ops(self):
+        return len(self.pt)
+
+    @property
+    def n_machines(self):
+        return len(self.machines)
+
+    def with_pt(self, pt):
+        """Gleiches Routing mit anderen Bearbeitungszeiten (z.B. simulierten Ist-Dauern)."""
+        pt = np.asarray(pt, dtype=np.int64)
+        if pt.shape != self.pt.shape:
+            raise ValueError(f"Erwartet {self.n_ops} Bearbeitungszeiten, erhalten {pt.shape}")
+        return Routing(self.job_ids, self.job_offsets, self.op_ids, self.machine_codes,
+                       pt, self.machines, self.due_dates, self.release_dates)
+
+    def op_job_index(self):
+        """Job-Index (0 .. n_jobs - 1) pro Operation."""
+        return np.repeat(np.arange(self.n_jobs), np.diff(self.job_offsets))
+
+    # ----------------------------------------------------------
+    # Umwandlung in die Formate der Skripte
+    # ----------------------------------------------------------
+    def records(self):
+        """
+        Operationen pro Job als Python-Werte.
+
+        Returns:
+            dict: {job_id: [(op_id, maschine, pt), ...]} mit Originalnamen der Maschinen.
+        """
+        names = self.machines
+        op_ids = self.op_ids.tolist()
+        machines = [names[c] for c in self.machine_codes.tolist()]
+        pts = self.pt.tolist()
+        offsets = self.job_offsets.tolist()
+        return {
+            job: list(zip(op_ids[lo:hi], machines[lo:hi], pts[lo:hi]))
+            for job, lo, hi in zip(self.job_ids.tolist(), offsets[:-1], offsets[1:])
+        }
+
+    def due_date_map(self):
+        """{job_id: Fälligkeit} oder None, wenn die CSV keine "Due Date"-Spalte hat."""
+        if self.due_dates is None:
+            return None
+        return dict(zip(self.job_ids.tolist(), self.due_dates.tolist()))
+
+    def release_date_map(self):
+        """{job_id: Freigabezeitpunkt} oder None, wenn die CSV keine "Release Date"-Spalte hat."""
+        if self.release_dates is None:
+            return None
+        return dict(zip(self.job_ids.tolist(), self.release_dates.tolist()))
+
+    def to_jobs(self):
+        """
+        Format von gt_koz.py bzw. GTEngine.
+
+        Returns:
+            dict: {job_id: [(maschine, pt), ...]}
+        """
+        return {job: [(m, p) for _, m, p in ops] for job, ops in self.records().items()}
+
+
+def load_routing(path, sort_ops=False):
+    """
+    Liest routing.csv in ein CSR-Routing.
+
+    Spaltennamen und Werte dürfen führende Leerzeichen haben
+    (gt_v2/routing.csv ist mit ", " getrennt). Die Spalten "Due Date" und
+    "Release Date" werden übernommen, falls vorhanden.
+
+    Args:
+        path (str | Path): Pfad zur CSV-Datei.
+        sort_ops (bool): Operationen pro Job nach Operationsnummer sortieren.
+
+    Returns:
+        Routing
+    """
+    import pandas as pd  # nur hier gebraucht, der C-Parser ist deutlich schneller als csv
+
+    df = pd.read_csv(path, skipinitialspace=True)
+    df.columns = [c.strip() for c in df.columns]
+    due = df[COL_DUE].to_numpy() if COL_DUE in df.columns else None
+    release = df[COL_RELEASE].to_numpy() if COL_RELEASE in df.columns else None
+    return Routing.from_columns(
+        df[COL_JOB].to_numpy(),
+        df[COL_OP].to_numpy(),
+        df[COL_MACHINE].to_numpy(),
+        df[COL_PT].to_numpy(),
+        due,
+        sort_ops=sort_ops,
+        release=release,
+    )
+
+
+def save_routing(routing, path):
+    """
+    Schreibt ein Routing im Format von routing.csv (mit "Due Date" und
+    "Release Date", falls vorhanden).
+
+    Args:
+        routing (Routing): Das Routing.
+        path (str | Path): Zieldatei.
+
+    Returns:
+        Path: Der Pfad der geschriebenen Datei.
+    """
+    import pandas as pd
+
+    counts = np.diff(routing.job_offsets)
+    columns = {
+        COL_JOB: np.repeat(routing.job_ids, counts),
+        COL_OP: routing.op_ids,
+        COL_MACHINE: np.asarray(routing.machines, dtype=object)[routing.machine_codes],
+        COL_PT: routing.pt,
+    }
+    if routing.due_dates is not None:
+        columns[COL_DUE] = np.repeat(routing.due_dates, counts)
+    if routing.release_dates is not None:
+        columns[COL_RELEASE] = np.repeat(routing.release_dates, counts)
+    pd.DataFrame(columns).to_csv(path, index=False)
+    return Path(path)
+
+
+def iter_routing_chunks(path, chunksize=100_000):
+    """
+    Liest routing.csv stückweise, für Dateien, die nicht in den Speicher passen.
+
+    Args:
+        path (str | Path): Pfad zur CSV-Datei.
+        chunksize (int): Zeilen pro Block.
+
+    Yields:
+        DataFrame: Block mit bereinigten Spaltennamen (wie in load_routing).
+    """
+    import pandas as pd
+
+    with pd.read_csv(path, skipinitialspace=True, chunksize=chunksize) as reader:
+        for chunk in reader:
+            chunk.columns = [c.strip() for c in chunk.columns]
+            yield chunk
@@ -0,0 +1,100 @@
+# ==============================================================
+# Prioritätsregeln für die Konfliktmenge
+# ==============================================================
+"""
+Prioritätsregeln für den Giffler-Thompson-Kern.
+
+Jede Regel ist ein Prioritätsschlüssel ``rule(engine, o)``: Aus der
+Konfliktmenge wird die Operation mit dem kleinsten Schlüssel eingeplant.
+Gleichstände löst der Kern über die Reihenfolge des Einplanbarwerdens oder
+über einen zufälligen Tie-Break (``seed``) auf.
+
+Die Regeln sind Funktionen auf Modulebene und damit für den Prozesspool
+des Portfolios (gfalgo.portfolio) serialisierbar; Kontext wie Vortagsplan
+oder Fälligkeiten liegt im Kern (``engine.prev_schedule``, ``engine.due_dates``).
+"""
+from .gt_core import koz
+
+__all__ = ["RULES", "get_rule", "koz", "spt", "lpt", "mwkr", "fifo", "edd", "mst", "deviation"]
+
+# KOZ = Kürzeste Operationszeit = SPT
+spt = koz
+
+
+def lpt(engine, o):
+    """LPT: Längste Operationszeit zuerst."""
+    return -engine.pt[o]
+
+
+def mwkr(engine, o):
+    """MWKR: Job mit der meisten Restarbeit (inklusive o) zuerst."""
+    return -engine.work_remaining[o]
+
+
+def fifo(engine, o):
+    """FIFO: Operation, die zuerst einplanbar wurde."""
+    return engine.seq[o]
+
+
+def edd(engine, o):
+    """EDD: Job mit der frühesten Fälligkeit zuerst (ohne Fälligkeit zuletzt)."""
+    if engine.due_dates is None:
+        raise ValueError("EDD-Regel benötigt Fälligkeiten (due_dates)")
+    return engine.due_dates.get(engine.op_job[o], float("inf"))
+
+
+def mst(engine, o):
+    """
+    MST: Kleinster Schlupf zuerst, Fälligkeit minus frühester Start minus
+    Restarbeit des Jobs (ohne Fälligkeit zuletzt).
+    """
+    if engine.due_dates is None:
+        raise ValueError("MST-Regel benötigt Fälligkeiten (due_dates)")
+    due = engine.due_dates.get(engine.op_job[o])
+    if due is None:
+        return float("inf")
+    return due - engine.est(o) - engine.work_remaining[o]
+
+
+def deviation(engine, o):
+    """
+    DEVIATION als GT-Prioritätsschlüssel: quadratische Abweichung des
+    möglichen Starts vom Start im Vortagsplan; Operationen ohne alten Start
+    zuletzt, bei Gleichstand frühestes Ende.
+
+    Bewertet wird nur die Konfliktmenge der GT-Maschine. Das ist nicht die
+    Schleife von gt_mininv.py, die pro Maschine über die ganze Frontier
+    auswählt und dann das früheste Ende einplant; deren Pläne liefert
+    gfalgo.mininv.schedule_deviation (bzw. ``gfalgo reschedule``).
+    """
+    est = engine.est(o)
+    prev_start = None
+    if engine.prev_schedule is not None:
+        prev_start = engine.prev_schedule.start(engine.op_job[o], engine.op_index[o] + 1)
+    dev = float("inf") if prev_start is None else (prev_start - est) ** 2
+    return dev, engine.ect(o)
+
+
+RULES = {
+    "koz": koz,
+    "spt": spt,
+    "lpt": lpt,
+    "mwkr": mwkr,
+    "fifo": fifo,
+    "edd": edd,
+    "mst": mst,
+    "deviation": deviation,
+}
+
+
+def get_rule(name):
+    """
+    Regel über ihren Namen holen (Groß-/Kleinschreibung egal).
+
+    Raises:
+        ValueError: Unbekannte Regel.
+    """
+    try:
+        return RULES[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unbekannte Regel '{name}', verfügbar: {', '.join(RULES)}") from None
@@ -0,0 +1,98 @@
+# ==============================================================
+# Vektorisierte Stichproben für Bearbeitungszeiten
+# ==============================================================
+"""
+Stochastische Bearbeitungszeiten als NumPy-Block.
+
+Statt ``random.lognormvariate`` einmal pro Operation aufzurufen, zieht
+``DurationSampler`` alle Störungen einer Schicht oder eines ganzen
+Monte-Carlo-Experiments in einem Aufruf. Wie bisher gilt die
+"Delay-Only"-Regel: ``max(planned, round(planned * factor))``, eine
+Operation wird also nie schneller als geplant.
+
+Verteilungen des Faktors:
+
+- ``"lognormal"``: mu = -sigma²/2, Erwartungswert des Faktors 1.0 (wie bisher).
+- ``"triangular"``: Dreiecksverteilung mit ``low``, ``mode``, ``high``.
+- ``"empirical"``: Ziehen mit Zurücklegen aus beobachteten Faktoren
+  (Ist-Dauer / Plan-Dauer), Parameter ``factors``.
+"""
+import numpy as np
+
+__all__ = ["DurationSampler", "DISTRIBUTIONS"]
+
+DISTRIBUTIONS = ("lognormal", "triangular", "empirical")
+
+
+class DurationSampler:
+    """
+    Seedbarer Sampler für simulierte Bearbeitungszeiten.
+
+    Args:
+        sigma (float): Streuung der Lognormalverteilung (0.1 = wenig, 0.3 = viel).
+        seed (int | None): Seed des Generators; None = nicht reproduzierbar.
+        dist (str): "lognormal", "triangular" oder "empirical".
+        low, mode, high (float): Parameter der Dreiecksverteilung (Faktoren).
+        factors (array-like): Beobachtete Faktoren für "empirical".
+    """
+
+    def __init__(self, sigma=0.1, seed=None, dist="lognormal", low=1.0, mode=1.0, high=1.5, factors=None):
+        if dist not in DISTRIBUTIONS:
+            raise ValueError(f"Unbekannte Verteilung '{dist}', verfügbar: {', '.join(DISTRIBUTIONS)}")
+        if dist == "triangular" and not low <= mode <= high:
+            raise ValueError("Dreiecksverteilung benötigt low <= mode <= high")
+        if dist == "empirical":
+            if factors is None or len(factors) == 0:
+                raise ValueError("Empirische Verteilung benötigt beobachtete Faktoren (factors)")
+            factors = np.asarray(factors, dtype=float)
+
+        self.sigma = sigma
+        self.dist = dist
+        self.low, self.mode, self.high = low, mode, high
+        self.empirical_factors = factors
+        self.rng = np.random.default_rng(seed)
+
+    def is_deterministic(self):
+        """True, wenn keine Störung gezogen wird (lognormal mit sigma <= 0)."""
+        return self.dist == "lognormal" and self.sigma <= 0
+
+    def factors(self, size):
+        """
+        Zieht Störfaktoren.
+
+        Args:
+            size (int | tuple): Form des Ergebnisses.
+
+        Returns:
+            np.ndarray: Faktoren (float).
+        """
+        if self.dist == "lognormal":
+            if self.sigma <= 0:
+                return np.ones(size)
+            mu = -(self.sigma ** 2) / 2  # Erwartungswert des Faktors = 1.0
+            return self.rng.lognormal(mu, self.sigma, size)
+        if self.dist == "triangular":
+            if self.low == self.high:
+                return np.full(size, float(self.low))
+            return self.rng.triangular(self.low, self.mode, self.high, size)
+        return self.rng.choice(self.empirical_factors, size)
+
+    def sample(self, planned, size=()):
+        """
+        Simulierte Dauern für alle Operationen auf einmal.
+
+        Args:
+            planned (array-like): Geplante Dauern (eine pro Operation).
+            size (int | tuple): Vorangestellte Dimensionen, z.B. ``n_shifts``
+                oder ``(n_reps, n_shifts)`` für ein ganzes Experiment.
+
+        Returns:
+            np.ndarray: int64 mit Form ``size + planned.shape``, stets >= planned.
+        """
+        planned = np.asarray(planned, dtype=np.int64)
+        size = (size,) if np.isscalar(size) else tuple(size)
+        shape = size + planned.shape
+        if self.is_deterministic():
+            return np.broadcast_to(planned, shape).copy()
+        simulated = np.rint(planned * self.factors(shape)).astype(np.int64)
+        return np.maximum(planned, simulated)  # Delay-Only: nie schneller als geplant
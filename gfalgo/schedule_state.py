@@ -0,0 +1,142 @@
+# ==============================================================
+# Planzustand als Struct-of-Arrays
+# ==============================================================
+"""
+Kompakter Planzustand für die GT-Varianten.
+
+Statt eines Dictionaries pro Operation ("op", "machine", "pt", "start",
+"end", "job_id") liegen alle Werte in vorab angelegten NumPy-Arrays, die
+über die globale Operationsnummer des Routings (CSR-Reihenfolge)
+indiziert werden. Für die Ausgabe (JSON, Gantt) erzeugt ``records()`` die
+gewohnten Einträge erst am Ende.
+"""
+import numpy as np
+
+from .machine_state import MachineState
+
+__all__ = ["ScheduleState"]
+
+UNSCHEDULED = -1
+
+
+class ScheduleState:
+    """
+    Start-, End- und Freigabezeiten aller Operationen eines Routings.
+
+    Args:
+        routing (Routing): Das geladene Routing.
+        pt (array-like | None): Abweichende Bearbeitungszeiten (z.B. simuliert);
+            Standard sind die geplanten Zeiten des Routings.
+
+    Attributes:
+        start, end (np.ndarray): -1 solange die Operation nicht eingeplant ist.
+        ready (np.ndarray): Technologische Freigabe (Ende des Job-Vorgängers).
+        machines (MachineState): Ready-Time und Belegung pro Maschinencode.
+        order (np.ndarray): Operationsnummern in Einplanungsreihenfolge
+            (gültig bis ``n_scheduled``).
+        cursor (np.ndarray): Pro Job-Index die nächste nicht eingeplante
+            Operation (= Job-Ende, wenn der Job fertig ist).
+        frontier (dict): {job_index: op} aller Jobs mit offenen Operationen,
+            in Job-Reihenfolge. Das sind genau die einplanbaren Operationen.
+    """
+
+    def __init__(self, routing, pt=None):
+        n = routing.n_ops
+        self.routing = routing
+        self.n_ops = n
+        self.pt = np.array(routing.pt if pt is None else pt, dtype=np.int64)
+        self.machine = routing.machine_codes
+        self.op_job = routing.op_job_index()
+        self.job_offsets = routing.job_offsets
+
+        self.start = np.full(n, UNSCHEDULED, dtype=np.int64)
+        self.end = np.full(n, UNSCHEDULED, dtype=np.int64)
+        self.ready = np.zeros(n, dtype=np.int64)
+        self.order = np.empty(n, dtype=np.int64)
+        self.n_scheduled = 0
+        self.machines = MachineState(range(routing.n_machines))
+
+        # Frontier: erste offene Operation pro Job, wird beim Einplanen fortgeschrieben
+        self.cursor = self.job_offsets[:-1].copy()
+        offsets = self.job_offsets.tolist()
+        self.frontier = {k: lo for k, (lo, hi) in enumerate(zip(offsets[:-1], offsets[1:])) if hi > lo}
+
+    # ----------------------------------------------------------
+    # Abfragen
+    # ----------------------------------------------------------
+    def is_scheduled(self, o):
+        return self.start[o] != UNSCHEDULED
+
+    def all_scheduled(self):
+        return self.n_scheduled == self.n_ops
+
+    def job_range(self, k):
+        """Bereich [lo, hi) der Operationen von Job-Index k."""
+        return int(self.job_offsets[k]), int(self.job_offsets[k + 1])
+
+    def est(self, o):
+        """Frühester Start von o: max(Ende Vorgänger, Ready-Time der Maschine)."""
+        return max(int(self.ready[o]), self.machines.ready_time(int(self.machine[o])))
+
+    def makespan(self):
+        return int(self.end.max()) if self.n_ops else 0
+
+    # ----------------------------------------------------------
+    # Einplanen
+    # ----------------------------------------------------------
+    def schedule(self, o, start):
+        """
+        Plant Operation o mit Startzeit start ein.
+
+        Schreibt Start/Ende, bucht die Maschine und gibt den Job-Nachfolger
+        zum Ende der Operation frei. o muss die Frontier-Operation ihres
+        Jobs sein (Operationen eines Jobs werden in Reihenfolge eingeplant).
+
+        Returns:
+            int: Endzeitpunkt.
+        """
+        end = start + int(self.pt[o])
+        self.start[o] = start
+        self.end[o] = end
+        self.machines.book(int(self.machine[o]), o, end)
+        k = int(self.op_job[o])
+        nxt = o + 1
+        self.cursor[k] = nxt
+        if nxt < self.job_offsets[k + 1]:
+            self.ready[nxt] = end
+            self.frontier[k] = nxt  # Position im Dict (Job-Reihenfolge) bleibt erhalten
+        else:
+            del self.frontier[k]
+        self.order[self.n_scheduled] = o
+        self.n_scheduled += 1
+        return end
+
+    # ----------------------------------------------------------
+    # Ausgabe
+    # ----------------------------------------------------------
+    def records(self, use_op_ids=False):
+        """
+        Eingeplante Operationen im Format von previous_schedule.json,
+        in Einplanungsreihenfolge.
+
+        Args:
+            use_op_ids (bool): "op" aus der CSV-Spalte Operation übernehmen
+                (gt_v2). Standard ist die Position im Job + 1 (gt_mininv.py).
+
+        Returns:
+            list: [{"job", "op", "machine", "start", "end"}, ...]
+        """
+        order = self.order[:self.n_scheduled]
+        job_ids = self.routing.job_ids[self.op_job[order]].tolist()
+        if use_op_ids:
+            ops = self.routing.op_ids[order].tolist()
+        else:
+            ops = (order - self.job_offsets[self.op_job[order]] + 1).tolist()
+        names = self.routing.machines
+        machines = [names[c] for c in self.machine[order].tolist()]
+        starts = self.start[order].tolist()
+        ends = self.end[order].tolist()
+        return [
+            {"job": j, "op": op, "machine": m, "start": s, "end": e}
+            for j, op, m, s, e in zip(job_ids, ops, machines, starts, ends)
+        ]
@@ -0,0 +1,141 @@
+# ==============================================================
+# Stabilitätskennzahlen für Pläne beliebiger Scheduler
+# ==============================================================
+"""
+Stabilitätskennzahlen zum Vergleich eines neuen Plans mit einem alten Plan.
+
+Ein Plan ist eine Liste (oder ein PreviousSchedule) von Einträgen im
+Format von previous_schedule.json:
+``{"job": ..., "op": ..., "machine": ..., "start": ..., "end": ...}``.
+
+- Startzeitabweichung (Nervosität): Summe der absoluten Startzeitdifferenzen.
+- Sequenzabweichung: Anzahl der Paare, deren Reihenfolge auf einer Maschine
+  sich umgedreht hat (Kendall-Tau-Distanz pro Maschine).
+
+Die Inversionen werden mit einem Fenwick-Baum in O(n log n) gezählt statt
+mit der bisherigen Doppelschleife über ``list.index()`` (O(n³)).
+"""
+
+__all__ = [
+    "count_inversions",
+    "kendall_tau_distance",
+    "machine_sequences",
+    "start_time_deviation",
+    "sequence_deviation",
+    "calculate_metrics",
+]
+
+
+def count_inversions(values):
+    """
+    Zählt die Paare i < j mit values[i] > values[j].
+
+    Args:
+        values (list): Ganze Zahlen aus 0 .. len(values) - 1 (z.B. Positionen).
+
+    Returns:
+        int: Anzahl der Inversionen.
+    """
+    n = len(values)
+    tree = [0] * (n + 1)  # Fenwick-Baum über die Positionen
+    inversions = 0
+    for seen, v in enumerate(values):
+        # Wie viele bisherige Werte sind <= v?
+        i = v + 1
+        not_greater = 0
+        while i > 0:
+            not_greater += tree[i]
+            i -= i & -i
+        inversions += seen - not_greater
+        # v eintragen
+        i = v + 1
+        while i <= n:
+            tree[i] += 1
+            i += i & -i
+    return inversions
+
+
+def kendall_tau_distance(seq_a, seq_b, normalized=False):
+    """
+    Kendall-Tau-Distanz zweier Reihenfolgen über ihre gemeinsamen Elemente.
+
+    Args:
+        seq_a (list): Alte Reihenfolge, z.B. [(job, op), ...].
+        seq_b (list): Neue Reihenfolge.
+        normalized (bool): Auf [0, 1] normieren (Anteil gedrehter Paare).
+
+    Returns:
+        int | float: Anzahl der Paare, die in seq_b umgekehrt liegen.
+    """
+    common = set(seq_a) & set(seq_b)
+    pos_b = {}
+    for x in seq_b:
+        if x in common and x not in pos_b:
+            pos_b[x] = len(pos_b)
+    values = [pos_b[x] for x in seq_a if x in common]
+    inversions = count_inversions(values)
+    if not normalized:
+        return inversions
+    pairs = len(values) * (len(values) - 1) // 2
+    return inversions / pairs if pairs else 0.0
+
+
+def machine_sequences(schedule):
+    """
+    Reihenfolge pro Maschine (nach Startzeit, bei Gleichstand Listenreihenfolge).
+
+    Args:
+        schedule (iterable): Plan-Einträge.
+
+    Returns:
+        dict: {maschine: [(job, op), ...]}
+    """
+    queues = {}
+    for e in sorted(schedule, key=lambda x: x["start"]):
+        queues.setdefault(e["machine"], []).append((e["job"], e["op"]))
+    return queues
+
+
+def start_time_deviation(new_schedule, old_schedule):
+    """
+    Summe der absoluten Startzeitdifferenzen aller Operationen,
+    die in beiden Plänen vorkommen.
+    """
+    old_starts = {(x["job"], x["op"]): x["start"] for x in old_schedule}
+    time_dev = 0
+    for new_op in new_schedule:
+        old_start = old_starts.get((new_op["job"], new_op["op"]))
+        if old_start is not None:
+            time_dev += abs(new_op["start"] - old_start)
+    return time_dev
+
+
+def sequence_deviation(new_schedule, old_schedule):
+    """
+    Summe der Kendall-Tau-Distanzen über alle Maschinen, die in beiden
+    Plänen vorkommen.
+    """
+    new_queues = machine_sequences(new_schedule)
+    old_queues = machine_sequences(old_schedule)
+    seq_dev = 0
+    for m, new_q in new_queues.items():
+        if m in old_queues:
+            seq_dev += kendall_tau_distance(old_queues[m], new_q)
+    return seq_dev
+
+
+def calculate_metrics(new_schedule, old_schedule):
+    """
+    Vergleicht den aktuellen Plan mit dem vorherigen Plan.
+
+    Args:
+        new_schedule (iterable): Einträge des neuen Plans.
+        old_schedule (iterable): Einträge des alten Plans.
+
+    Returns:
+        tuple: (time_dev, seq_dev); (0, 0) wenn es keinen alten Plan gibt.
+    """
+    if not old_schedule:
+        return 0, 0  # Erste Runde hat keine Referenz -> keine Abweichung
+    return (start_time_deviation(new_schedule, old_schedule),
+            sequence_deviation(new_schedule, old_schedule))
@@ -0,0 +1,245 @@
+# ==============================================================
+# Spaltenbasierter Planspeicher mit Versionen
+# ==============================================================
+"""
+Binärer Planspeicher statt previous_schedule.json.
+
+Jeder gespeicherte Plan ist eine unveränderliche Version (Snapshot) in
+einem eigenen Verzeichnis mit einer ``.npy``-Datei pro Spalte:
+
+    schedule_store/
+        LATEST                  Nummer der aktuellen Version
+        v000001/
+            meta.json           Maschinennamen, Zeitstempel, Notiz
+            job.npy  op.npy  machine.npy  start.npy  end.npy
+        v000002/
+            ...
+
+Gelesen wird per Memory-Mapping (``np.load(mmap_mode="r")``), ein Plan mit
+einer Million Operationen ist also ohne Parsen sofort verfügbar. Alte
+Versionen bleiben erhalten und ersetzen die bisherige Backup-Datei;
+``prune`` räumt auf. ``export_json`` schreibt das alte JSON-Format für
+Skripte, die noch previous_schedule.json erwarten.
+"""
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .routing import intern_machines
+
+__all__ = ["ScheduleColumns", "ScheduleStore"]
+
+COLUMNS = ("job", "op", "machine", "start", "end")
+_LATEST = "LATEST"
+_META = "meta.json"
+
+
+class ScheduleColumns:
+    """
+    Plan als Spalten-Arrays (eine Zeile pro Operation, Reihenfolge wie gespeichert).
+
+    Attributes:
+        job (np.ndarray): Job-ID pro Operation.
+        op (np.ndarray): Operationsnummer wie in previous_schedule.json.
+        machine (np.ndarray): Dichter Maschinencode pro Operation.
+        start, end (np.ndarray): Start- und Endzeit.
+        machines (list): Originalname pro Maschinencode.
+        meta (dict): Zusatzinformationen der Version (leer, wenn nicht gespeichert).
+    """
+
+    def __init__(self, job, op, machine, start, end, machines, meta=None):
+        self.job = job
+        self.op = op
+        self.machine = machine
+        self.start = start
+        self.end = end
+        self.machines = machines
+        self.meta = meta or {}
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Baut die Spalten aus Einträgen {"job", "op", "machine", "start", "end"}.
+
+        Args:
+            records (iterable): Plan im Format von previous_schedule.json.
+
+        Returns:
+            ScheduleColumns
+        """
+        records = list(records)
+        n = len(records)
+        codes, names = intern_machines([r["machine"] for r in records]) if n else (np.empty(0, np.int32), [])
+        return cls(
+            job=np.fromiter((r["job"] for r in records), dtype=np.int64, count=n),
+            op=np.fromiter((r["op"] for r in records), dtype=np.int32, count=n),
+            machine=codes,
+            start=np.fromiter((r["start"] for r in records), dtype=np.int64, count=n),
+            end=np.fromiter((r["end"] for r in records), dtype=np.int64, count=n),
+            machines=names,
+        )
+
+    def __len__(self):
+        return len(self.start)
+
+    @property
+    def makespan(self):
+        return int(self.end.max()) if len(self) else 0
+
+    def records(self):
+        """Plan als Liste von Dicts im Format von previous_schedule.json."""
+        names = self.machines
+        return [
+            {"job": j, "op": o, "machine": names[m], "start": s, "end": e}
+            for j, o, m, s, e in zip(self.job.tolist(), self.op.tolist(), self.machine.tolist(),
+                                     self.start.tolist(), self.end.tolist())
+        ]
+
+
+class ScheduleStore:
+    """
+    Versionierter Planspeicher in einem Verzeichnis (siehe Moduldokumentation).
+
+    Args:
+        root (str | Path): Verzeichnis des Speichers; wird beim ersten
+            Speichern angelegt.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    @staticmethod
+    def is_store(path):
+        """True, wenn path ein Planspeicher-Verzeichnis ist."""
+        return (Path(path) / _LATEST).is_file()
+
+    def _version_dir(self, version):
+        return self.root / f"v{version:06d}"
+
+    # ----------------------------------------------------------
+    # Versionen
+    # ----------------------------------------------------------
+    def versions(self):
+        """Alle gespeicherten Versionen, aufsteigend."""
+        if not self.root.is_dir():
+            return []
+        found = []
+        for p in self.root.iterdir():
+            if p.is_dir() and p.name.startswith("v") and p.name[1:].isdigit():
+                found.append(int(p.name[1:]))
+        return sorted(found)
+
+    def latest(self):
+        """Nummer der aktuellen Version oder None, wenn der Speicher leer ist."""
+        try:
+            return int((self.root / _LATEST).read_text().strip())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def save(self, schedule, note=None, meta=None):
+        """
+        Speichert einen Plan als neue Version und macht sie zur aktuellen.
+
+        Die Version wird erst in ein temporäres Verzeichnis geschrieben und
+        dann umbenannt; ein abgebrochener Lauf hinterlässt keinen halben Plan.
+
+        Args:
+            schedule (list | ScheduleColumns): Plan als Einträge oder Spalten.
+            note (str | None): Freitext, z.B. Regel oder Skriptname.
+            meta (dict | None): Weitere Einträge für meta.json, z.B. die
+                Routing-Version (gfalgo.changelog), aus der der Plan stammt.
+
+        Returns:
+            int: Die neue Versionsnummer.
+        """
+        cols = schedule if isinstance(schedule, ScheduleColumns) else ScheduleColumns.from_records(schedule)
+        self.root.mkdir(parents=True, exist_ok=True)
+        version = max(self.versions(), default=0) + 1
+
+        tmp = self.root / f".tmp-v{version:06d}-{os.getpid()}"
+        if tmp.exists():
+            shutil.rmtree(tmp)
+        tmp.mkdir()
+        for name in COLUMNS:
+            np.save(tmp / f"{name}.npy", np.ascontiguousarray(getattr(cols, name)))
+        info = {
+            "version": version,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "n_ops": len(cols),
+            "makespan": cols.makespan,
+            "machines": cols.machines,
+            "note": note,
+        }
+        info.update(meta or {})
+        with open(tmp / _META, "w") as f:
+            json.dump(info, f, indent=4)
+        os.replace(tmp, self._version_dir(version))
+
+        latest_tmp = self.root / f".{_LATEST}.tmp"
+        latest_tmp.write_text(f"{version}\n")
+        os.replace(latest_tmp, self.root / _LATEST)
+        return version
+
+    def load(self, version=None, mmap=True):
+        """
+        Liest eine Version.
+
+        Args:
+            version (int | None): Versionsnummer; None = aktuelle Version.
+            mmap (bool): Spalten per Memory-Mapping nur lesend einbinden.
+
+        Returns:
+            ScheduleColumns
+
+        Raises:
+            FileNotFoundError: Speicher leer oder Version nicht vorhanden.
+        """
+        if version is None:
+            version = self.latest()
+            if version is None:
+                raise FileNotFoundError(f"Kein Plan im Speicher {self.root}")
+        path = self._version_dir(version)
+        if not path.is_dir():
+            raise FileNotFoundError(f"Version {version} fehlt in {self.root}")
+        with open(path / _META, "r") as f:
+            meta = json.load(f)
+        mode = "r" if mmap else None
+        arrays = {name: np.load(path / f"{name}.npy", mmap_mode=mode) for name in COLUMNS}
+        return ScheduleColumns(machines=meta["machines"], meta=meta, **arrays)
+
+    def records(self, version=None):
+        """Plan einer Version im Format von previous_schedule.json."""
+        return self.load(version).records()
+
+    def export_json(self, path, version=None, indent=4):
+        """
+        Schreibt eine Version als previous_schedule.json (Kompatibilität).
+
+        Returns:
+            Path: Der Pfad der geschriebenen Datei.
+        """
+        path = Path(path)
+        with open(path, "w") as f:
+            json.dump(self.records(version), f, indent=indent)
+        return path
+
+    def prune(self, keep=10):
+        """
+        Löscht alte Versionen, die aktuelle bleibt immer erhalten.
+
+        Args:
+            keep (int): Anzahl der neuesten Versionen, die erhalten bleiben.
+
+        Returns:
+            list: Die gelöschten Versionsnummern.
+        """
+        latest = self.latest()
+        old = self.versions()[:-keep] if keep > 0 else self.versions()
+        removed = [v for v in old if v != latest]
+        for v in removed:
+            shutil.rmtree(self._version_dir(v))
+        return removed
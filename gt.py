@@ -3,6 +3,9 @@
 # ==============================================================
 import matplotlib.pyplot as plt
 
+from gfalgo.branch_bound import branch_and_bound
+from gfalgo.gantt import plot_gantt
+
 # --------------------------------------------------------------
 # Eingabedaten
 # --------------------------------------------------------------
@@ -74,19 +77,22 @@ for job, op, m, start, ende in schedule:
 makespan = max(end_times.values())
 print(f"\nMakespan (Gesamtbearbeitungszeit): {makespan}")
 
+# --------------------------------------------------------------
+# Vergleich: Branch-and-Bound über alle Wahlen in K (alle aktiven Pläne)
+# --------------------------------------------------------------
+bnb = branch_and_bound(jobs, time_limit=10)
+status = "optimal" if bnb["optimal"] else f"Zeitlimit, untere Schranke {bnb['lower_bound']}"
+print(f"Branch-and-Bound: Makespan {bnb['makespan']} ({status}, {bnb['nodes']} Knoten)")
+
 # --------------------------------------------------------------
 # Gantt-Diagramm erzeugen
 # --------------------------------------------------------------
 fig, ax = plt.subplots(figsize=(8, 4))
 colors = ['tab:blue', 'tab:orange', 'tab:green', 'tab:red', 'tab:purple']
 
-for job, op, m, start, ende in schedule:
-    ax.barh(f"Maschine {m}", ende - start, left=start, color=colors[(job - 1) % len(colors)], edgecolor='black')
-    ax.text(start + (ende - start) / 2, f"Maschine {m}", f"Job {job}", va='center', ha='center', color='white', fontsize=9)
-
-ax.set_xlabel("Zeit")
-ax.set_ylabel("Maschinen")
-ax.set_title("Gantt-Diagramm – Giffler-Thompson (KOZ-Regel)")
-ax.grid(True, axis='x', linestyle='--', alpha=0.6)
+records = [{"job": job, "op": op, "machine": m, "start": start, "end": ende}
+           for job, op, m, start, ende in schedule]
+plot_gantt(records, ax=ax, job_colors={j: colors[(j - 1) % len(colors)] for j in jobs},
+           title="Gantt-Diagramm – Giffler-Thompson (KOZ-Regel)")
 plt.tight_layout()
 plt.show()
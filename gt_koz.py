@@ -1,81 +1,39 @@
 # ==============================================================
 # Giffler-Thompson-Algorithmus (KOZ-Regel) mit CSV-Einlesen und Previous-Schedule
 # ==============================================================
-import pandas as pd
-import json
 import matplotlib.pyplot as plt
 from pathlib import Path
 
-# --------------------------------------------------------------
-# CSV-Daten laden
-# --------------------------------------------------------------
-df = pd.read_csv("routing.csv")
-df.columns = [c.strip() for c in df.columns]
-
-# Jobs und Maschinen vorbereiten
-jobs = {}
-machines = {}
-for _, row in df.iterrows():
-    job_id = int(row["Routing_ID"])
-    op_id = int(row["Operation"])
-    machine = row["Machine"]
-    pt = int(row["Processing Time"])
+from gfalgo.calendars import load_calendars
+from gfalgo.changelog import RoutingChangeLog
+from gfalgo.gantt import plot_gantt
+from gfalgo.gt_core import giffler_thompson, koz
+from gfalgo.local_search import improve_schedule
+from gfalgo.profiling import Profiler
+from gfalgo.store import ScheduleStore
 
-    if job_id not in jobs:
-        jobs[job_id] = []
-    jobs[job_id].append((machine, pt))  # (Maschine, Bearbeitungszeit)
+IMPROVE = None  # "tabu" oder "sa": Plan nach dem GT-Lauf per lokaler Suche verbessern (None = aus)
+PROFILE = None  # z.B. "profile_koz.json" oder ".csv": Laufzeiten pro Phase speichern (None = aus)
+CALENDAR = None  # z.B. "calendar.csv" (Machine, Start, End): Pausen/Wartung pro Maschine (None = durchgehend verfügbar)
 
-    if machine not in machines:
-        machines[machine] = 0  # Maschinen-Ready-Time
+profiler = Profiler(enabled=bool(PROFILE))
 
 # --------------------------------------------------------------
-# Initialisierung
+# CSV-Daten laden (vektorisiert, ohne df.iterrows())
 # --------------------------------------------------------------
-S = [(j, 0) for j in jobs]  # Alle Jobs starten bei Operation 0
-t = {(j, i): 0 for j in jobs for i in range(len(jobs[j]))}
-start_times, end_times = {}, {}
+changelog = RoutingChangeLog("routing.csv")  # routing.csv plus angehängte Änderungen von randx.py
+routing = changelog.materialize()
+jobs = routing.to_jobs()  # {job: [(Maschine, Bearbeitungszeit), ...]}
+calendars = load_calendars(CALENDAR) if CALENDAR else None
+release_dates = routing.release_date_map()  # Spalte "Release Date", sonst alle Jobs ab t = 0
+profiler.lap("csv")
 
 # --------------------------------------------------------------
-# Giffler-Thompson Hauptschleife (KOZ-Regel)
+# Giffler-Thompson (KOZ-Regel) über den heap-basierten Kern
 # --------------------------------------------------------------
-while S:
-    # 1. Frühestes Ende für alle Operationen berechnen
-    d = {}
-    for job, i in S:
-        m, p = jobs[job][i]
-        d[(job, i)] = max(t[(job, i)], machines[m]) + p
-
-    omin = min(d, key=d.get)
-    dmin = d[omin]
-    job_min, i_min = omin
-    mach_min, _ = jobs[job_min][i_min]
-
-    # 2. Konfliktmenge K: alle Operationen, die auf derselben Maschine frühestens fertig wären
-    K = [(j, i) for j, i in S if jobs[j][i][0] == mach_min and t[(j, i)] < dmin]
-
-    # 3. KOZ-Regel: Operation mit kürzester Bearbeitungszeit
-    o_bar = min(K, key=lambda o: jobs[o[0]][o[1]][1])
-    job_bar, i_bar = o_bar
-    mach_bar, p_bar = jobs[job_bar][i_bar]
-
-    # 4. Einplanen
-    start = max(t[(job_bar, i_bar)], machines[mach_bar])
-    end = start + p_bar
-    start_times[o_bar] = start
-    end_times[o_bar] = end
-    machines[mach_bar] = end
-
-    # 5. Zeit für andere Operationen in Konfliktmenge aktualisieren
-    for o in K:
-        if o != o_bar:
-            t[o] = end
-
-    # 6. Nächste Operation zum Plan hinzufügen
-    if i_bar + 1 < len(jobs[job_bar]):
-        S.append((job_bar, i_bar + 1))
-        t[(job_bar, i_bar + 1)] = end
-
-    S.remove(o_bar)
+start_times, end_times = giffler_thompson(jobs, rule=koz, profiler=profiler,
+                                          calendars=calendars, release_dates=release_dates)
+profiler.lap("gt")
 
 # --------------------------------------------------------------
 # Schedule für Ausgabe vorbereiten
@@ -86,22 +44,35 @@ for (job, i), start in start_times.items():
     ende = end_times[(job, i)]
     schedule.append({"job": job, "op": i + 1, "machine": m, "start": start, "end": ende})
 
+# --------------------------------------------------------------
+# Optional: lokale Suche auf den kritischen Blöcken (gfalgo.local_search)
+# --------------------------------------------------------------
+if IMPROVE:
+    result = improve_schedule(jobs, schedule, method=IMPROVE, time_limit=10)
+    print(f"Lokale Suche ({IMPROVE}): Makespan {result['initial_makespan']} -> {result['makespan']}")
+    schedule = result["schedule"]
+    profiler.lap("improve")
+
 schedule.sort(key=lambda x: (x["machine"], x["start"]))
 
 print("\nJob  Op  Maschine  Start  Ende")
 for s in schedule:
     print(f"{s['job']:3}  {s['op']:2}       {s['machine']:3}     {s['start']:4}   {s['end']:4}")
 
-makespan = max(end_times.values())
+makespan = max(s["end"] for s in schedule)
 print(f"\nMakespan (Gesamtbearbeitungszeit): {makespan}")
 
 # --------------------------------------------------------------
-# Previous schedule speichern (JSON)
+# Previous schedule speichern (Binärspeicher mit Versionen + JSON-Export)
 # --------------------------------------------------------------
-previous_schedule_file = Path("previous_schedule.json")
-with open(previous_schedule_file, "w") as f:
-    json.dump(schedule, f, indent=4)
+store = ScheduleStore("schedule_store")
+version = store.save(schedule, note="gt_koz.py (KOZ)", meta={"routing_version": changelog.latest()})
+print(f"Previous schedule saved to {store.root} (Version {version})")
+
+previous_schedule_file = Path("previous_schedule.json")  # für Skripte, die noch JSON lesen
+store.export_json(previous_schedule_file, version)
 print(f"Previous schedule saved to {previous_schedule_file}")
+profiler.lap("json")
 
 # --------------------------------------------------------------
 # Farben für Jobs festlegen (immer gleiche Farbe pro Job)
@@ -114,24 +85,20 @@ job_colors = {job_id: colors_palette[i % len(colors_palette)] for i, job_id in e
 # --------------------------------------------------------------
 # Gantt-Diagramm erzeugen und speichern
 # --------------------------------------------------------------
+# Eine Collection pro Maschine, Beschriftung nur bei ausreichend breiten Balken
 fig, ax = plt.subplots(figsize=(10, 5))
-
-for s in schedule:
-    color = job_colors[s['job']]
-    ax.barh(f"Maschine {s['machine']}", s['end'] - s['start'], left=s['start'],
-            color=color, edgecolor='black')
-    ax.text(s['start'] + (s['end'] - s['start']) / 2, f"Maschine {s['machine']}",
-            f"Job {s['job']}", va='center', ha='center', color='white', fontsize=9)
-
-ax.set_xlabel("Zeit")
-ax.set_ylabel("Maschinen")
-ax.set_title("Gantt-Diagramm – Giffler-Thompson (KOZ-Regel)")
-ax.grid(True, axis='x', linestyle='--', alpha=0.6)
+plot_gantt(schedule, ax=ax, job_colors=job_colors,
+           title="Gantt-Diagramm – Giffler-Thompson (KOZ-Regel)")
 plt.tight_layout()
 
 # Diagramm speichern
 output_file = "gantt_schedule_koz.png"
 plt.savefig(output_file, dpi=300)
 print(f"Gantt-Diagramm gespeichert als {output_file}")
+profiler.lap("gantt")
+
+if PROFILE:
+    profiler.save(PROFILE)
+    print(f"Profil gespeichert als {PROFILE}")
 
 plt.show()
@@ -2,158 +2,97 @@
 # Giffler-Thompson Algorithmus mit DEVIATION (Quadratische Abweichung)
 # ==============================================================
 
-import pandas as pd
-import json
 from pathlib import Path
 import matplotlib.pyplot as plt
 
+from gfalgo.changelog import RoutingChangeLog
+from gfalgo.gantt import plot_gantt
+from gfalgo.incremental import load_changes, reschedule_incremental
+from gfalgo.local_search import improve_schedule
+from gfalgo.mininv import schedule_deviation
+from gfalgo.prev_schedule import PreviousSchedule
+from gfalgo.profiling import Profiler
+from gfalgo.store import ScheduleStore
+
 # -------------------------------
 # Dateien
 # -------------------------------
 csv_file = "routing.csv"
 previous_schedule_file = Path("previous_schedule.json")
+changes_file = Path("routing_changes.csv") #letzte Änderung von randx.py (nur für ältere Pläne ohne Routing-Version)
+store = ScheduleStore("schedule_store") #Versionierter Binärspeicher, ersetzt die Backup-Datei
+
+IMPROVE = None #"tabu" oder "sa": Plan danach per lokaler Suche verbessern (None = aus)
+STABILITY_WEIGHT = 1.0 #Strafe pro Zeiteinheit Abweichung zum alten Plan in der lokalen Suche
+PROFILE = None #z.B. "profile_mininv.json" oder ".csv": Laufzeiten pro Phase speichern (None = aus)
+
+profiler = Profiler(enabled=bool(PROFILE))
 
 # -------------------------------
-# CSV einlesen
+# CSV einlesen (vektorisiert in NumPy-Arrays, ohne df.iterrows())
 # -------------------------------
-df = pd.read_csv(csv_file)
-df.columns = [c.strip() for c in df.columns] #entfernt führende und nachfolgende Leerzeichen aus allen Spaltennamen
+changelog = RoutingChangeLog(csv_file) #routing.csv plus angehängte Änderungen von randx.py
+routing_version = changelog.latest()
+routing = changelog.materialize(routing_version)
 
 # -------------------------------
 # Datenstruktur vorbereiten
 # -------------------------------
-jobs = {}
-machines = {}
-machine_ids = sorted(df["Machine"].unique()) #sortiert alle Maschinen
-
-for _, row in df.iterrows(): #gibt jede Zeile der CSV Datei zurück
-    job_id = int(row["Routing_ID"])      #liest die Daten ein und wandelt sie gegebenfalls um
-    op_id = int(row["Operation"])
-    machine = row["Machine"]
-    pt = int(row["Processing Time"])
-
-    if job_id not in jobs: #Jobs anlegen im Dictionary, falls noch nicht vorhanden 0-9
-        jobs[job_id] = []
-    jobs[job_id].append({ #Operation zum Job hinzufügen
-        "op": op_id,
-        "machine": machine,
-        "pt": pt,
-        "start": None,
-        "end": None
-    })
-
-    if machine not in machines: #Prüfung ob Maschine schon vorhanden, wenn nicht leere Liste der Maschinen anlegen
-        machines[machine] = []
+machine_ids = routing.machines #sortiert alle Maschinen
 
 # -------------------------------
 # Previous schedule laden (KOZ-Plan)
 # -------------------------------
-if previous_schedule_file.exists(): #Prüfen ob ein Vortagsplan existiert
+#Kein Backup mehr nötig: jeder Lauf legt eine neue Version an, die alten bleiben erhalten
+prev_routing_version = None
+if store.latest() is not None:
+    previous_schedule = PreviousSchedule.load(store.root) #aktuelle Version, per Memory-Mapping gelesen
+    prev_routing_version = store.load().meta.get("routing_version")
+else:
+    previous_schedule = PreviousSchedule.load(previous_schedule_file) #Fallback: alter JSON-Plan
 
-   #Backup
-    backup_file = Path("previous_schedule_backup.json") #Datei festlegen
-    with open(previous_schedule_file, "r") as f_src: #Erstellung eines Backups--> vllt Ergänzung eines
-        with open(backup_file, "w") as f_backup:
-            f_backup.write(f_src.read())
+#Deltas seit dem alten Plan: nur diese Operationen kommen aus dem Protokoll, nicht die ganze routing.csv
+if prev_routing_version is not None:
+    changes = [(c["job"], c["op"]) for c in changelog.iter_changes(since=prev_routing_version)]
+elif changes_file.exists():
+    changes = load_changes(changes_file)
+else:
+    changes = []
+profiler.lap("csv") #Routing, alter Plan und Änderungen laden
 
-    with open(previous_schedule_file, "r") as f: #Vortags Plan einlesen
-        previous_schedule = json.load(f)    #konvertierung in lesbares Dictionary
+
+# -------------------------------
+# Giffler-Thompson mit DEVIATION (Schleife in gfalgo.mininv)
+# -------------------------------
+if changes and len(previous_schedule) > 0: #randx.py hat einen Job geändert
+    #Inkrementell: Anfang des alten Plans wird übernommen, soweit der Neulauf ihn bestätigt, nur der Rest wird neu gerechnet
+    state, affected, cut_time = reschedule_incremental(routing, previous_schedule, changes, profiler=profiler)
+    if cut_time is None:
+        print("Keine Änderung gegenüber dem alten Plan")
+    else:
+        print(f"Inkrementell: {int(affected.sum())} von {routing.n_ops} Operationen ab t={cut_time} neu geplant")
 else:
-    previous_schedule = []
-
-
-def get_prev_start(job_id, op_id): #Startzeitpunkt der vorherigen Planung zurückgeben
-    for op in previous_schedule:    #durchlaufen jeder einzelnen Operation
-        if op["job"] == job_id and op["op"] == op_id + 1: #Prüfung ob gleicher Job gefunden wird, +1 da JSON Datei dort anfängt
-            return op["start"] # Abweichung zum neuen Plan, für Berechnung
-    return None
-
-# -------------------------------
-# Giffler-Thompson Hauptschleife
-# -------------------------------
-scheduled_ops = [] #leere Liste für geplante Operationen
-
-while any(any(op["start"] is None for op in ops) for ops in jobs.values()): #Prüfung ob Job noch nicht geplante Operationen hat; 
-                                                                            #erstes any prüft über alle Jobs hinweg; values gibt alle Operationen zurück
-    # 1. Nächste planbare Operationen pro Job
-    next_ops = [] #Speicher für nächste planbare Operationen pro Job
-    for job_id, ops in jobs.items(): #liefert job_id, operationsliste(1: [op1, op2, op3])
-        for idx, op in enumerate(ops): # gibt idx und Wert zurück der Operation
-            if op["start"] is None: #Schauen ob die Operation noch keinen Startzeitpunkt hat
-                prev_end = 0 #Startwert des Vorgängers, im ersten Durchlauf 0
-                if idx > 0: #direkten Vorgänger aus Liste holen, wenn Index nicht NUll
-                    prev_op = ops[idx - 1]
-                    if prev_op["end"] is None:#Falls Vorgänger noch in Bearbeitung, Abbrechen
-                        break
-                    prev_end = prev_op["end"]#Vorgänger Ende Übernehmen
-                next_ops.append((job_id, idx, prev_end, op)) #Operation einplanen, mit Vorgänger Ende als Startzeit
-                break #Nur die erste ungeschedulte Operation pro Job
-
-    if not next_ops: #Falls es keine planbaren Operationen gibt → Ende
-        break
-
-    # 2. Konfliktmenge pro Maschine identifizieren
-    conflict_ops_per_machine = {} #Konfliktmenge pro Maschine
-    for job_id, idx, earliest_start, op in next_ops: #aktuell einplanbare Operationen durchlaufen wegen next_ops
-        m_schedule = machines[op["machine"]]# auslesen um zu sehen wann MAschine frei
-        m_available = max([o["end"] for o in m_schedule], default=0) #liste der Endzeiten aller Maschinen
-        start_time = max(earliest_start, m_available)#Tatsächlicher Startzeitpunkt der Operation
-        end_time = start_time + op["pt"] #Endzeit berechnen mithilfe der Processing Time
-
-        if op["machine"] not in conflict_ops_per_machine: #Konfliktliste für diese Maschine anlegen
-            conflict_ops_per_machine[op["machine"]] = []
-        conflict_ops_per_machine[op["machine"]].append(#Speicherung des Tupels 
-            (job_id, idx, start_time, end_time, op)
-        )
-
-    # ------------------------------------------------------
-    # 3. DEVIATION (Quadratische Abweichung)
-    # ------------------------------------------------------
-    selected_ops = []#Liste zur Speicherung der ausgwählten Operationen
-
-    for m, candidates in conflict_ops_per_machine.items(): #Konfliktliste pro Maschine durchgehen
-        deviations = [] # Liste zur Speicherung der Berechnung
-        for job_id, idx, start_time, end_time, op in candidates: #jeder Operation durchgehen die um die Maschine konkurriert
-
-            prev_start = get_prev_start(job_id, idx) #Startzeit der vorherigen Operation des Vortages
-
-            if prev_start is not None:
-                raw_dev = abs(prev_start - start_time) #absolute Abweichung berechnen
-                deviation = raw_dev ** 2      #Quadratische Abweichungsstrafe ^2
-            else:
-                deviation = float('inf') #jobs werden nur gewählt wenn es keine andere Wahl gibt
-
-            # Speichere: (deviation, end_time, job_id, idx, original_data)
-            deviations.append(
-                (deviation, end_time, job_id, idx,
-                 (job_id, idx, start_time, end_time, op))
-            )
-
-        # kleinstes deviation → stabilster Plan; deviations=(deviation, end_time, job_id, idx, 'original_data')
-        best = min(deviations, key=lambda x: (x[0], x[1], x[2]))#Kriterien --> deviation --> end_time--> job_id
-        selected_ops.append(best[4])#original Tupel anfügen (job_id, idx, start_time, end_time, op)
-
-    # 4. Unter allen Maschinen: Operation mit kleinstem Endzeitpunkt
-    job_id, idx, start_time, end_time, op = min(selected_ops, key=lambda x: x[3])#Operation mit frühester Endzeit
-
-    # 5. Operation einplanen
-    op["start"] = start_time # berechneten Startzeitpunkt eintragen
-    op["end"] = end_time
-    machines[op["machine"]].append(op) #eingeplante Operation in Mshcinen Dictionary eintragen
-    scheduled_ops.append((job_id, idx, op["machine"], start_time, end_time))# Operation in die finale Schedule-Liste eintragen
+    state = schedule_deviation(routing, previous_schedule, profiler=profiler) #kompletter Lauf (Start/Ende/Freigabe als Arrays)
+profiler.lap("gt")
 
 # -------------------------------
 # Schedule speichern
 # -------------------------------
-schedule = [
-    {"job": job_id, "op": idx + 1, "machine": m, "start": start, "end": end}
-    for job_id, idx, m, start, end in scheduled_ops
-]
+schedule = state.records() #Einträge {"job", "op", "machine", "start", "end"}, op = Position im Job + 1
+
+if IMPROVE: #Makespan + STABILITY_WEIGHT * Startzeitabweichung, damit der Plan nah am alten bleibt
+    result = improve_schedule(routing.to_jobs(), schedule, method=IMPROVE, time_limit=10,
+                              prev_schedule=previous_schedule, stability_weight=STABILITY_WEIGHT)
+    print(f"Lokale Suche ({IMPROVE}): Makespan {result['initial_makespan']} -> {result['makespan']}, "
+          f"Startzeitabweichung {result['deviation']}")
+    schedule = result["schedule"]
+    profiler.lap("improve")
 
 schedule.sort(key=lambda x: (machine_ids.index(x["machine"]), x["start"]))
 
-with open(previous_schedule_file, "w") as f:
-    json.dump(schedule, f, indent=4)
+version = store.save(schedule, note="gt_mininv.py (DEVIATION)", meta={"routing_version": routing_version}) #neue Version, vorherige bleibt als Backup
+store.export_json(previous_schedule_file, version) #JSON-Export für Kompatibilität
+profiler.lap("json")
 
 makespan = max(s["end"] for s in schedule)
 print(f"Makespan: {makespan}")
@@ -161,7 +100,7 @@ print(f"Makespan: {makespan}")
 # -------------------------------
 # Farben für Jobs festlegen
 # -------------------------------
-job_ids = sorted(jobs.keys())
+job_ids = sorted(routing.job_ids.tolist())
 colors_palette = [
     'tab:blue','tab:orange','tab:green','tab:red','tab:purple',
     'tab:brown','tab:pink','tab:gray','tab:olive','tab:cyan'
@@ -173,34 +112,21 @@ job_colors = {job_id: colors_palette[i % len(colors_palette)]
 # Gantt-Diagramm
 # -------------------------------
 fig, ax = plt.subplots(figsize=(12, 6))
-
-for s in schedule:
-    color = job_colors[s['job']]
-    ax.barh(
-        f"Maschine {s['machine']}",
-        s['end'] - s['start'],
-        left=s['start'],
-        color=color,
-        edgecolor='black'
-    )
-    ax.text(
-        s['start'] + (s['end'] - s['start']) / 2,
-        f"Maschine {s['machine']}",
-        f"Job {s['job']}",
-        va='center',
-        ha='center',
-        color='white',
-        fontsize=9
-    )
-
-ax.set_xlabel("Zeit")
-ax.set_ylabel("Maschinen")
-ax.set_title("Giffler-Thompson mit quadratischer DEVIATION")
-ax.grid(True, axis='x', linestyle='--', alpha=0.6)
+plot_gantt(
+    schedule,
+    ax=ax,
+    job_colors=job_colors,
+    title="Giffler-Thompson mit quadratischer DEVIATION"
+)
 plt.tight_layout()
 
 output_file = "gantt_schedule.png"
 plt.savefig(output_file, dpi=300)
 print(f"Gantt-Diagramm gespeichert als {output_file}")
+profiler.lap("gantt")
+
+if PROFILE:
+    profiler.save(PROFILE)
+    print(f"Profil gespeichert als {PROFILE}")
 
 plt.show()
@@ -1,10 +1,18 @@
-import pandas as pd
 import json
 from pathlib import Path
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-import random
 import math
+import sys
+
+# Paket gfalgo aus dem Repository-Root importierbar machen
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gfalgo.gantt import plot_gantt
+from gfalgo.prev_schedule import PreviousSchedule
+from gfalgo.routing import load_routing
+from gfalgo.sampling import DurationSampler
+from gfalgo.schedule_state import ScheduleState
+from gfalgo.stability import kendall_tau_distance
 
 # ==============================================================
 # KONFIGURATION & INPUT
@@ -14,36 +22,19 @@ PREVIOUS_SCHEDULE_FILE = Path("previous_schedule.json")
 
 print("--- Minimalinvasives Scheduling (Delay-Only Modus) ---")
 try:
-    sig_in = input("Bitte Simulationsstreuung (Sigma) eingeben (Standard 0.0, z.B. 0.2): ")
+    # Sigma als Argument (python gt_test_einzelschritte.py 0.2) fragt nicht nach
+    if len(sys.argv) > 1:
+        sig_in = sys.argv[1]
+    else:
+        sig_in = input("Bitte Simulationsstreuung (Sigma) eingeben (Standard 0.0, z.B. 0.2): ")
     SIGMA = float(sig_in) if sig_in.strip() else 0.0
-except ValueError:
+except (ValueError, EOFError):
     print("Ungültige Eingabe. Setze Sigma = 0.0")
     SIGMA = 0.0
 
 print(f"-> Starte Planung mit Sigma = {SIGMA}")
 print("-> Bedingung aktiv: Ist-Zeit >= Plan-Zeit (Keine Verfrühung möglich)")
 
-# ==============================================================
-# HILFSFUNKTIONEN
-# ==============================================================
-def simulate_duration(planned_duration, sigma):
-    """
-    Simuliert die Dauer.
-    Garantie: Die simulierte Dauer ist NIEMALS kürzer als die geplante Dauer.
-    """
-    if sigma <= 0: return planned_duration
-    
-    # 1. Zufallsfaktor berechnen
-    mu = -(sigma**2) / 2
-    factor = random.lognormvariate(mu, sigma)
-    
-    # 2. Zeit berechnen
-    actual = int(round(planned_duration * factor))
-    
-    # 3. Constraint: Maximum aus (Plan, Ist) nehmen
-    # Das verhindert, dass Jobs schneller werden.
-    return max(planned_duration, actual)
-
 # ==============================================================
 # 1. DATEN LADEN
 # ==============================================================
@@ -52,115 +43,60 @@ if not CSV_FILE.exists():
     print(f"Fehler: {CSV_FILE} fehlt.")
     exit()
 
-df = pd.read_csv(CSV_FILE)
-df.columns = [c.strip() for c in df.columns]
+routing = load_routing(CSV_FILE, sort_ops=True) # vektorisiert, Ops pro Job nach ID sortiert
 
-# Vorherigen Plan laden
-prev_starts = {} 
-prev_schedule_by_machine = {} 
+# Vorherigen Plan laden (einmal, danach indiziert nach (job, op) und Maschine)
+prev_schedule = PreviousSchedule()
 prev_makespan = 0 
 has_prev_plan = False
 
 if PREVIOUS_SCHEDULE_FILE.exists():
     try:
-        with open(PREVIOUS_SCHEDULE_FILE, "r") as f:
-            data = json.load(f)
-            data.sort(key=lambda x: x["start"])
-            
-            if data:
-                prev_makespan = max(d["end"] for d in data)
-            
-            for entry in data:
-                prev_starts[(entry["job"], entry["op"])] = entry["start"]
-                
-                m = entry["machine"]
-                if m not in prev_schedule_by_machine:
-                    prev_schedule_by_machine[m] = []
-                prev_schedule_by_machine[m].append((entry["job"], entry["op"]))
-                
+        prev_schedule = PreviousSchedule.load(PREVIOUS_SCHEDULE_FILE)
+        prev_makespan = prev_schedule.makespan
         has_prev_plan = True
-        print(f"Alten Plan geladen ({len(prev_starts)} Ops). Makespan war: {prev_makespan}")
+        print(f"Alten Plan geladen ({len(prev_schedule)} Ops). Makespan war: {prev_makespan}")
     except:
         print("Alter Plan defekt. Strategie: INITIAL (KOZ)")
 else:
     print("Kein alter Plan. Strategie: INITIAL (KOZ)")
 
-# Datenstrukturen bauen
-jobs = {}
-machines = {}
-machine_ids = sorted(df["Machine"].unique())
+# Datenstrukturen bauen (Planzustand als Arrays, indiziert über die globale Op-Nummer)
+job_list = routing.job_ids.tolist()
+op_ids = routing.op_ids.tolist()
+op_job_ids = routing.job_ids[routing.op_job_index()].tolist()
 
-for _, row in df.iterrows():
-    job_id = int(row["Routing_ID"])
-    op_id = int(row["Operation"])
-    machine = int(row["Machine"])
-    planned_pt = int(row["Processing Time"])
-    
-    simulated_pt = simulate_duration(planned_pt, SIGMA)
-    
+# Simulierte Dauern aller Operationen in einem Zug (nie kürzer als geplant)
+simulated_pts = DurationSampler(SIGMA).sample(routing.pt).tolist()
+for job_id, op_id, planned_pt, simulated_pt in zip(op_job_ids, op_ids, routing.pt.tolist(), simulated_pts):
     # Info-Ausgabe nur bei Verzögerung
     if simulated_pt > planned_pt:
         print(f"Verzögerung! Job {job_id} Op {op_id}: {planned_pt} -> {simulated_pt}")
 
-    if job_id not in jobs: jobs[job_id] = []
-    
-    jobs[job_id].append({
-        "id": op_id,
-        "machine": machine,
-        "pt": simulated_pt,
-        "start": None,
-        "end": None,
-        "job_id": job_id
-    })
-    
-    if machine not in machines: machines[machine] = []
-
-for j in jobs.values(): j.sort(key=lambda x: x["id"])
+state = ScheduleState(routing, pt=simulated_pts)
 
 # ==============================================================
 # 2. ALGORITHMUS
 # ==============================================================
 
 def get_prev_start(job_id, op_id):
-    return prev_starts.get((job_id, op_id))
+    return prev_schedule.start(job_id, op_id)
 
-scheduled_ops_list = []
-
-while True:
-    # A) Startbare Operationen
+while not state.all_scheduled():
+    # A) Startbare Operationen: (job_id, o, est, eft)
     startable_ops = []
-    all_done = True
     
-    for job_id, ops in jobs.items():
-        for i, op in enumerate(ops):
-            if op["start"] is None:
-                all_done = False
-                est_tech = 0
-                if i > 0:
-                    prev_op = ops[i-1]
-                    if prev_op["end"] is None: est_tech = None
-                    else: est_tech = prev_op["end"]
-                
-                if est_tech is not None:
-                    m_sched = machines[op["machine"]]
-                    m_avail = max([o["end"] for o in m_sched], default=0)
-                    actual_est = max(est_tech, m_avail)
-                    
-                    startable_ops.append({
-                        "job_id": job_id, "op_idx": i,
-                        "est": actual_est, "eft": actual_est + op["pt"],
-                        "op": op
-                    })
-                break 
+    for k, o in state.frontier.items(): # erste offene Operation pro Job
+        actual_est = state.est(o)
+        startable_ops.append((job_list[k], o, actual_est, actual_est + int(state.pt[o])))
     
-    if all_done: break
     if not startable_ops: break
 
     # B) Konfliktmenge
-    min_eft_cand = min(startable_ops, key=lambda x: x["eft"])
-    machine_m = min_eft_cand["op"]["machine"]
-    c_min = min_eft_cand["eft"]
-    conflict_set = [c for c in startable_ops if c["op"]["machine"] == machine_m and c["est"] < c_min]
+    min_eft_cand = min(startable_ops, key=lambda x: x[3])
+    machine_m = state.machine[min_eft_cand[1]]
+    c_min = min_eft_cand[3]
+    conflict_set = [c for c in startable_ops if state.machine[c[1]] == machine_m and c[2] < c_min]
 
     # C) AUSWAHL
     selected = None
@@ -168,40 +104,30 @@ while True:
     k_new = []
     
     for c in conflict_set:
-        ps = get_prev_start(c["job_id"], c["op"]["id"])
+        ps = get_prev_start(c[0], op_ids[c[1]])
         if ps is not None:
-            c["prev_start"] = ps
-            k_old.append(c)
+            k_old.append((ps, c))
         else:
             k_new.append(c)
 
     if not has_prev_plan:
-        selected = min(conflict_set, key=lambda x: (x["op"]["pt"], x["job_id"]))
+        selected = min(conflict_set, key=lambda x: (state.pt[x[1]], x[0]))
     else:
-        best_old = min(k_old, key=lambda x: (x["prev_start"], x["job_id"])) if k_old else None
-        best_new = min(k_new, key=lambda x: (x["op"]["pt"], x["job_id"])) if k_new else None
+        best_old = min(k_old, key=lambda x: (x[0], x[1][0])) if k_old else None
+        best_new = min(k_new, key=lambda x: (state.pt[x[1]], x[0])) if k_new else None
         
         if best_old and best_new:
-            puffer = best_old["prev_start"] - best_new["eft"]
+            puffer = best_old[0] - best_new[3]
             if puffer >= 0: selected = best_new
-            else: selected = best_old
-        elif best_old: selected = best_old
+            else: selected = best_old[1]
+        elif best_old: selected = best_old[1]
         elif best_new: selected = best_new
         else: selected = conflict_set[0]
 
     # D) Ausführen
-    final_op = selected["op"]
-    final_op["start"] = selected["est"]
-    final_op["end"] = selected["eft"]
-    machines[final_op["machine"]].append(final_op)
-    
-    scheduled_ops_list.append({
-        "job": int(selected["job_id"]),
-        "op": int(final_op["id"]),
-        "machine": int(final_op["machine"]),
-        "start": int(selected["est"]),
-        "end": int(selected["eft"])
-    })
+    state.schedule(selected[1], selected[2])
+
+scheduled_ops_list = state.records(use_op_ids=True)
 
 # ==============================================================
 # 3. METRIKEN
@@ -227,20 +153,11 @@ for s in scheduled_ops_list:
     new_schedule_by_machine[m].append((s["job"], s["op"]))
 
 for m in new_schedule_by_machine:
-    if m not in prev_schedule_by_machine:
+    if not prev_schedule.has_machine(m):
         continue
-    old_seq = prev_schedule_by_machine[m]
+    old_seq = prev_schedule.machine_sequence(m)
     new_seq = new_schedule_by_machine[m]
-    common_ops = set(old_seq) & set(new_seq)
-    old_filtered = [op for op in old_seq if op in common_ops]
-    new_filtered = [op for op in new_seq if op in common_ops]
-    
-    for i in range(len(old_filtered)):
-        for j in range(i + 1, len(old_filtered)):
-            op_a = old_filtered[i] 
-            op_b = old_filtered[j]
-            if new_filtered.index(op_a) > new_filtered.index(op_b):
-                seq_dev_count += 1
+    seq_dev_count += kendall_tau_distance(old_seq, new_seq) # gedrehte Paare, O(n log n)
 
 # 3.3 Makespan Abweichung
 current_makespan = max(s['end'] for s in scheduled_ops_list)
@@ -269,23 +186,18 @@ with open(PREVIOUS_SCHEDULE_FILE, "w") as f:
 fig, ax = plt.subplots(figsize=(14, 8)) 
 colors = plt.cm.tab20.colors
 
-unique_jobs_in_schedule = set()
+unique_jobs_in_schedule = set(s["job"] for s in scheduled_ops_list)
+job_colors = {j_id: colors[(j_id - 1) % 20] for j_id in unique_jobs_in_schedule}
 
+# Alte Startzeiten als rote Markierung, falls verschoben
+markers = []
 for s in scheduled_ops_list:
-    unique_jobs_in_schedule.add(s["job"])
-    col = colors[(s["job"]-1) % 20]
-    ax.barh(f"M {s['machine']}", s['end']-s['start'], left=s['start'], 
-            color=col, edgecolor='black', alpha=0.9)
-    
-    if (s['end'] - s['start']) > 2: 
-        ax.text(s['start']+(s['end']-s['start'])/2, f"M {s['machine']}", 
-                f"J{s['job']}", ha='center', va='center', 
-                color='white', fontweight='bold', fontsize=8)
-    
     ps = get_prev_start(s["job"], s["op"])
     if ps is not None and ps != s["start"]:
-        idx = machine_ids.index(s["machine"])
-        ax.plot([ps, ps], [idx-0.4, idx+0.4], color='red', lw=2, ls='--')
+        markers.append((s["machine"], ps))
+
+plot_gantt(scheduled_ops_list, ax=ax, job_colors=job_colors, lane_label="M {}",
+           job_label="J{}", markers=markers, fontsize=8)
 
 # Legende
 legend_patches = []
@@ -298,12 +210,9 @@ for j_id in sorted_jobs:
 ax.legend(handles=legend_patches, loc='upper center', 
           bbox_to_anchor=(0.5, -0.12), ncol=10, frameon=False, fontsize=10)
 
-ax.set_xlabel("Zeit")
-ax.set_ylabel("Maschinen")
 title_str = (f"Plan (Sigma={SIGMA}, nur Delays) | Start-Dev: {time_dev_sum} | "
              f"Seq-Dev: {seq_dev_count} | Makespan: {current_makespan}{makespan_diff_text}")
 ax.set_title(title_str)
-ax.grid(True, axis='x', linestyle='--', alpha=0.5)
 plt.subplots_adjust(bottom=0.2) 
 
 plt.savefig(f"plan_seq_{SIGMA}.png", dpi=300)
@@ -1,72 +1,50 @@
 import csv
-import random
 from pathlib import Path
 
+import numpy as np
+
+from gfalgo.changelog import RoutingChangeLog
+from gfalgo.generator import generate_routing
+from gfalgo.routing import save_routing
+
 # ================================
 # Parameter
 # ================================
 num_jobs = 10
 num_operations = 10
-machines = [f"M{str(i).zfill(2)}" for i in range(10)]  # M00 bis M09
+num_machines = 10  # M00 bis M09
 processing_time_min = 10
 processing_time_max = 100
-routing_file = "routing.csv"  # Datei wird direkt überschrieben
+structure = "random"  # "random", "taillard" oder "flowshop" (siehe gfalgo.generator)
+skew = 0.0  # >0 = ungleich ausgelastete Maschinen (Engpässe)
+SEED = None  # z.B. 42 für reproduzierbare Änderungen
+routing_file = "routing.csv"  # Basisdatei, wird nicht mehr überschrieben
 changes_file = "routing_changes.csv"  # Datei für geänderte Operationen
 
-# ================================
-# Alte CSV-Daten laden
-# ================================
-old_data = {}
-if Path(routing_file).exists():
-    with open(routing_file, mode="r", newline="") as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            job_id = int(row["Routing_ID"])
-            op_id = int(row["Operation"])
-            if job_id not in old_data:
-                old_data[job_id] = {}
-            old_data[job_id][op_id] = {
-                "Machine": row["Machine"],
-                "Processing Time": int(row["Processing Time"])
-            }
+rng = np.random.default_rng(SEED)
+params = dict(num_operations=num_operations, num_machines=num_machines, structure=structure,
+              pt_low=processing_time_min, pt_high=processing_time_max, skew=skew)
 
 # ================================
 # Einen zufälligen Job auswählen, der komplett neu generiert wird
 # ================================
-random_job = random.choice(range(num_jobs))
+random_job = int(rng.integers(num_jobs))
+
+new_job = generate_routing(1, seed=rng, **params).records()[0]  # [(op_id, maschine, pt), ...]
+changed_ops = [[random_job, op_id, machine, pt] for op_id, machine, pt in new_job]  # Liste für geänderte Operationen
 
 # ================================
-# CSV-Dateien überschreiben und Änderungen speichern
+# Änderungen anhängen statt routing.csv neu zu schreiben
 # ================================
-changed_ops = []  # Liste für geänderte Operationen
-
-with open(routing_file, mode="w", newline="") as file:
-    writer = csv.writer(file)
-    writer.writerow(["Routing_ID", "Operation", "Machine", "Processing Time"])
-    
-    for job_id in range(num_jobs):
-        for op_id in range(num_operations):
-
-            if job_id == random_job:
-                # Komplett neu generieren
-                new_machine = random.choice(machines)
-                new_pt = random.randint(processing_time_min, processing_time_max)
-
-                changed_ops.append([job_id, op_id, new_machine, new_pt])
-                machine = new_machine
-                processing_time = new_pt
-
-            else:
-                # Unveränderte alten Werte übernehmen
-                if job_id in old_data and op_id in old_data[job_id]:
-                    machine = old_data[job_id][op_id]["Machine"]
-                    processing_time = old_data[job_id][op_id]["Processing Time"]
-                else:
-                    # falls etwas fehlt → neutral generieren (sollte nicht passieren)
-                    machine = random.choice(machines)
-                    processing_time = random.randint(processing_time_min, processing_time_max)
-
-            writer.writerow([job_id, op_id, machine, processing_time])
+changelog = RoutingChangeLog(routing_file)  # routing_changelog.csv neben routing.csv
+if Path(routing_file).exists():
+    # routing.csv bleibt unverändert, nur der neue Job kommt als Version ins Protokoll
+    version = changelog.append(changed_ops)
+    print(f"Änderungen als Version {version} an '{changelog.log_path}' angehängt.")
+else:
+    # Noch kein Routing: einmalig komplett erzeugen (beliebige Größe, siehe Parameter)
+    save_routing(generate_routing(num_jobs, seed=rng, **params), routing_file)
+    print(f"Routing-Datei '{routing_file}' erfolgreich erzeugt.")
 
 # ================================
 # Änderungen in separate CSV schreiben
@@ -76,6 +54,5 @@ with open(changes_file, mode="w", newline="") as file:
     writer.writerow(["Routing_ID", "Operation", "Machine", "New Processing Time"])
     writer.writerows(changed_ops)
 
-print(f"Routing-Datei '{routing_file}' erfolgreich aktualisiert.")
 print(f"Geänderte Operationen wurden in '{changes_file}' gespeichert.")
 print(f"Random-Job vollständig neu generiert: {random_job}")
@@ -0,0 +1,61 @@
+# ==============================================================
+# Inkrementelle Umplanung gegen den vollständigen Neulauf
+# ==============================================================
+import numpy as np
+import pytest
+
+from gfalgo.generator import generate_routing
+from gfalgo.incremental import reschedule_incremental
+from gfalgo.mininv import schedule_deviation
+from gfalgo.prev_schedule import PreviousSchedule
+from gfalgo.routing import Routing
+
+
+def _columns(routing):
+    job, op, machine, pt = [], [], [], []
+    for j, ops in routing.records().items():
+        for o, m, p in ops:
+            job.append(j)
+            op.append(o)
+            machine.append(m)
+            pt.append(p)
+    return job, op, machine, pt
+
+
+def _change(routing, kind, rng):
+    """Änderung wie randx.py: Job neu erzeugen, Job anhängen oder letzte Operation ändern."""
+    job, op, machine, pt = _columns(routing)
+    names = list(routing.machines)
+    if kind == "append":
+        j = max(job) + 1
+        for i in range(int(rng.integers(1, len(names) + 1))):
+            job.append(j)
+            op.append(i + 1)
+            machine.append(names[rng.integers(len(names))])
+            pt.append(int(rng.integers(10, 100)))
+    else:
+        j = int(rng.choice(sorted(set(job))))
+        rows = [i for i in range(len(job)) if job[i] == j]
+        for i in (rows if kind == "regenerate" else rows[-1:]):
+            machine[i] = names[rng.integers(len(names))]
+            pt[i] = int(rng.integers(10, 100))
+    return Routing.from_columns(job, op, machine, pt)
+
+
+@pytest.mark.parametrize("kind", ["regenerate", "append", "last"])
+def test_matches_full_rerun(kind):
+    rng = np.random.default_rng(14)
+    for seed in range(100):
+        num_machines = int(rng.integers(2, 7))
+        routing = generate_routing(int(rng.integers(2, 16)), num_machines=num_machines,
+                                   num_operations=int(rng.integers(1, num_machines + 1)), seed=seed)
+        first = schedule_deviation(routing, PreviousSchedule())
+        old = PreviousSchedule(schedule_deviation(routing, PreviousSchedule(first.records())).records())
+        changed = _change(routing, kind, rng)
+
+        full = schedule_deviation(changed, old)
+        state, affected, cut_time = reschedule_incremental(changed, old)
+        assert state.records() == full.records(), (kind, seed)
+        if cut_time is not None:
+            assert cut_time == int(state.start[affected].min())
+